@@ -83,3 +83,51 @@ def test_roles(edition: Edition):
 
     assert accounts[0].address not in edition.roles.get_all()[Role.ADMIN]
     assert address not in edition.roles.get_all()[Role.MINTER]
+
+
+def test_get_owned(edition: Edition):
+    edition.mint_batch(
+        [
+            EditionMetadataInput(NFTMetadataInput.from_json({"name": "Edition 1"}), 10),
+            EditionMetadataInput(NFTMetadataInput.from_json({"name": "Edition 2"}), 5),
+        ]
+    )
+    edition.transfer(accounts[0].address, 1, 5)
+
+    owned = edition.get_owned()
+
+    assert len(owned) == 1
+    assert owned[0].metadata.name == "Edition 1"
+    assert owned[0].supply == 10
+    assert owned[0].quantity_owned == 10
+
+
+def test_holder_index(edition: Edition):
+    edition.mint(
+        EditionMetadataInput(NFTMetadataInput.from_json({"name": "Edition 1"}), 10)
+    )
+    signer_address = edition._contract_wrapper.get_signer_address()
+
+    index = edition.get_holder_index()
+    minted_block = index.sync()
+
+    edition.transfer(accounts[0].address, 0, 4)
+    index.sync()
+
+    assert index.get_holders(0) == {signer_address: 6, accounts[0].address: 4}
+    assert index.get_token_ids(accounts[0].address) == {0: 4}
+    assert index.get_snapshot(0, minted_block) == {signer_address: 10}
+
+
+def test_get_all(edition: Edition):
+    edition.mint_batch(
+        [
+            EditionMetadataInput(NFTMetadataInput.from_json({"name": "Edition 1"}), 10),
+            EditionMetadataInput(NFTMetadataInput.from_json({"name": "Edition 2"}), 5),
+        ]
+    )
+
+    editions = edition.get_all()
+
+    assert [e.metadata.name for e in editions] == ["Edition 1", "Edition 2"]
+    assert [e.supply for e in editions] == [10, 5]
@@ -4,7 +4,11 @@ from thirdweb.contracts import Marketplace, NFTCollection, Edition, Token
 from brownie import accounts
 import pytest
 from thirdweb.types.currency import TokenAmount
-from thirdweb.types.marketplace import NewAuctionListing, NewDirectListing
+from thirdweb.types.marketplace import (
+    MarketplaceFilter,
+    NewAuctionListing,
+    NewDirectListing,
+)
 
 from thirdweb.types.nft import EditionMetadataInput, NFTMetadataInput
 from thirdweb.types.settings.metadata import (
@@ -200,3 +204,136 @@ def test_make_offer(
         currency_contract_address=token.get_address(),
         price_per_token=0.1,
     )
+
+
+def test_listing_index(
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+    tmp_path,
+):
+    create_direct_listing(marketplace, token.get_address(), nft_collection.get_address(), 0)
+    create_auction_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 1
+    )
+
+    index = marketplace.get_listing_index(str(tmp_path / "listings.db"))
+    index.sync()
+
+    assert index.get_total_count() == 2
+    assert len(index.get_listings(asset_contract=nft_collection.get_address())) == 2
+    assert len(index.get_raw_listings(token_id=1)) == 1
+
+    marketplace.buyout_listing(0, quantity_desired=1, receiver=accounts[0].address)
+    index.sync()
+
+    assert len(index.get_listings(active_only=True)) == 1
+    index.close()
+
+
+def test_get_winner(
+    sdk: ThirdwebSDK,
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+):
+    listing_id = create_auction_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 0
+    )
+    create_auction_listing(marketplace, token.get_address(), nft_collection.get_address(), 1)
+
+    marketplace.auction.buyout_listing(listing_id)
+
+    assert marketplace.auction.get_winner(listing_id) == sdk.get_signer().address  # type: ignore
+    assert marketplace.auction.get_winners([0, 1]) == {
+        listing_id: sdk.get_signer().address  # type: ignore
+    }
+
+
+def test_get_all_listings_filter(
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+):
+    create_direct_listing(marketplace, token.get_address(), nft_collection.get_address(), 0)
+    create_auction_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 1
+    )
+    # Moving the asset out of the seller's wallet makes the direct listing invalid
+    create_direct_listing(marketplace, token.get_address(), nft_collection.get_address(), 2)
+    nft_collection.transfer(accounts[0].address, 2)
+
+    listings = marketplace.get_all_listings(
+        MarketplaceFilter(token_contract=nft_collection.get_address(), token_id=1)
+    )
+    assert [listing.id for listing in listings] == [1]
+
+    listings = marketplace.get_all_listings(MarketplaceFilter(start=1, count=1))
+    assert [listing.id for listing in listings] == [1]
+
+    seller = marketplace._contract_wrapper.get_signer_address()
+    for address in [seller.lower(), "0x" + seller[2:].upper()]:
+        listings = marketplace.get_all_listings(MarketplaceFilter(seller=address))
+        assert [listing.id for listing in listings] == [0, 1]
+
+    listings = marketplace.get_all_listings(
+        MarketplaceFilter(token_contract=nft_collection.get_address(), token_id=2)
+    )
+    assert listings == []
+
+    listings = marketplace.get_all_listings(MarketplaceFilter(start=1, count=2))
+    assert [listing.id for listing in listings] == [1]
+
+    assert marketplace.get_all_listings(MarketplaceFilter(count=0)) == []
+
+
+def test_buyout_listings(
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+):
+    create_direct_listing(marketplace, token.get_address(), nft_collection.get_address(), 0)
+    create_direct_listing(marketplace, token.get_address(), nft_collection.get_address(), 1)
+    create_auction_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 2
+    )
+
+    results = marketplace.buyout_listings(
+        [(0, 1), (1, 1), (2, None), (5, 1)], receiver=accounts[0].address
+    )
+
+    assert [result.success for result in results] == [True, True, True, False]
+    assert nft_collection.owner_of(0) == accounts[0].address
+    assert nft_collection.owner_of(1) == accounts[0].address
+
+
+def test_order_book(
+    marketplace: Marketplace,
+    nft_collection: NFTCollection,
+    token: Token,
+):
+    listing_id = create_direct_listing(
+        marketplace, token.get_address(), nft_collection.get_address(), 0
+    )
+    marketplace.direct.make_offer(
+        listing_id,
+        quantity_desired=1,
+        currency_contract_address=token.get_address(),
+        price_per_token=0.1,
+    )
+
+    book = marketplace.get_order_book()
+    book.sync()
+
+    best_offer = book.get_best_offer(listing_id)
+    assert best_offer is not None
+    assert best_offer.offeror == marketplace._contract_wrapper.get_signer_address()
+    assert book.get_depth(listing_id, 5) == [(best_offer.price_per_token, 1)]
+    assert book.get_top_offers_for_asset(
+        nft_collection.get_address(), 0, token.get_address(), 5
+    ) == [best_offer]
+
+    marketplace.direct.cancel_listing(listing_id)
+    book.sync()
+
+    assert book.get_best_offer(listing_id) is None
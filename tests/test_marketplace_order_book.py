@@ -0,0 +1,110 @@
+from dataclasses import astuple
+from typing import Any, Dict, List, Tuple
+
+from web3 import Web3
+from web3.constants import MAX_INT
+
+import thirdweb.core.classes.marketplace_order_book as marketplace_order_book
+from thirdweb.core.classes.marketplace_order_book import MarketplaceOrderBook
+from thirdweb.types.marketplace import ContractListing, ContractOffer, ListingType
+from thirdweb.types.multicall import MulticallResult
+
+ASSET = Web3.toChecksumAddress("0x" + "11" * 20)
+CURRENCY = Web3.toChecksumAddress("0x" + "22" * 20)
+SELLER = Web3.toChecksumAddress("0x" + "33" * 20)
+BIDDER = Web3.toChecksumAddress("0x" + "44" * 20)
+
+
+class FakeContractWrapper:
+    listings: Dict[int, ContractListing]
+    offers: Dict[Tuple[int, str], ContractOffer]
+
+    def __init__(self):
+        self.listings = {}
+        self.offers = {}
+
+    def multi_call_read(
+        self, calls: List[Tuple[str, List[Any]]], block_identifier: Any = None
+    ) -> List[MulticallResult]:
+        results = []
+        for fn, args in calls:
+            if fn == "listings":
+                data: Any = astuple(self.listings[args[0]])
+            elif fn == "winningBid":
+                data = astuple(self.offers[(args[0], BIDDER)])
+            else:
+                data = astuple(self.offers[(args[0], args[1])])
+            results.append(MulticallResult(True, data))
+        return results
+
+
+def make_listing(listing_id: int, listing_type: ListingType, end_time: int):
+    return ContractListing(
+        listing_id,
+        SELLER,
+        ASSET,
+        0,
+        0,
+        end_time,
+        1,
+        CURRENCY,
+        0,
+        0,
+        0,
+        listing_type.value,
+    )
+
+
+def sync_offer(book: MarketplaceOrderBook, listing_id: int, offeror: str):
+    event: Any = {"event": "NewOffer", "args": {"listingId": listing_id, "offeror": offeror}}
+    book._apply(event)
+    book._on_synced(1)
+
+
+def test_bids_expire_when_auction_ends(monkeypatch):
+    now = 1000
+    monkeypatch.setattr(marketplace_order_book, "time", lambda: now)
+
+    wrapper = FakeContractWrapper()
+    # Bids are placed with MAX_INT as their expiration, only the auction end stops them
+    wrapper.listings[0] = make_listing(0, ListingType.AUCTION, 2000)
+    wrapper.offers[(0, BIDDER)] = ContractOffer(
+        0, BIDDER, 1, CURRENCY, 10, int(MAX_INT, 0)
+    )
+    wrapper.listings[1] = make_listing(1, ListingType.DIRECT, 3000)
+    wrapper.offers[(1, BIDDER)] = ContractOffer(1, BIDDER, 1, CURRENCY, 5, 2500)
+
+    book = MarketplaceOrderBook(wrapper)  # type: ignore
+    sync_offer(book, 0, BIDDER)
+    sync_offer(book, 1, BIDDER)
+
+    assert book.get_best_offer(0) == wrapper.offers[(0, BIDDER)]
+    assert book.get_depth_for_asset(ASSET, 0, CURRENCY, 5) == [(10, 1), (5, 1)]
+
+    now = 2000
+    assert book.get_best_offer(0) is None
+    assert book.get_depth(0, 5) == []
+    assert book.get_top_offers_for_asset(ASSET, 0, CURRENCY, 5) == [
+        wrapper.offers[(1, BIDDER)]
+    ]
+
+    # Offers on direct listings stop at their own expiration when it comes first
+    now = 2500
+    assert book.get_best_offer(1) is None
+    assert book.get_offers(0) == [wrapper.offers[(0, BIDDER)]]
+
+
+def test_offers_expire_when_direct_listing_ends(monkeypatch):
+    now = 1000
+    monkeypatch.setattr(marketplace_order_book, "time", lambda: now)
+
+    wrapper = FakeContractWrapper()
+    wrapper.listings[0] = make_listing(0, ListingType.DIRECT, 1500)
+    wrapper.offers[(0, BIDDER)] = ContractOffer(0, BIDDER, 1, CURRENCY, 10, 5000)
+
+    book = MarketplaceOrderBook(wrapper)  # type: ignore
+    sync_offer(book, 0, BIDDER)
+    assert book.get_best_offer(0) is not None
+
+    now = 1500
+    assert book.get_best_offer(0) is None
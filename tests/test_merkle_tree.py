@@ -0,0 +1,71 @@
+import pytest
+from eth_utils import keccak
+
+from thirdweb.common.merkle_tree import MerkleTree, hash_pair
+
+
+def make_leaves(count: int):
+    return [keccak(text=str(i)) for i in range(count)]
+
+
+def make_tree(leaves) -> MerkleTree:
+    tree = MerkleTree()
+    tree.add_leaf_bytes(leaves)
+    tree.make_tree()
+    return tree
+
+
+@pytest.mark.parametrize(
+    "count,root",
+    [
+        (1, "044852b2a670ade5407e78fb2863c51de9fcb96542a07186fe3aeda6bb8a116d"),
+        (2, "0b4aa17bff8fc189efb37609ac5ea9fca0df4c834a6fbac74b24c8119c40fef2"),
+        (3, "8911139c86aecdb43ccd0c0025cd651bc022096176972bc79b580a4340fc9013"),
+        (5, "94bdde98264b7c94eb0c5188f14ebab0f89fb2f16167cf9c69bd44f4b7010ea3"),
+        (7, "2fecafbb9ccfe100ebb3528064d95362fe950c82bedaa3eee3975f115eb8eb7c"),
+    ],
+)
+def test_known_roots(count: int, root: str):
+    assert make_tree(make_leaves(count)).get_merkle_root() == root
+
+
+def test_odd_level_proofs():
+    leaves = sorted(make_leaves(3))
+    tree = make_tree(leaves)
+
+    # The odd end node is promoted, so its proof skips the leaf level
+    assert tree.get_proof_bytes(leaves[0]) == [(leaves[1], True), (leaves[2], True)]
+    assert tree.get_proof_bytes(leaves[1]) == [(leaves[0], False), (leaves[2], True)]
+    assert tree.get_proof_bytes(leaves[2]) == [(hash_pair(leaves[0], leaves[1]), False)]
+    assert tree.get_merkle_root() == hash_pair(
+        hash_pair(leaves[0], leaves[1]), leaves[2]
+    ).hex()
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 5, 6, 7, 8, 9, 17, 33, 100])
+def test_proofs_verify(count: int):
+    leaves = make_leaves(count)
+    tree = make_tree(leaves)
+    root = tree.get_merkle_root()
+
+    hex_leaves = [leaf.hex() for leaf in leaves]
+    proofs = tree.get_proofs(hex_leaves)
+    for leaf, proof in zip(hex_leaves, proofs):
+        assert proof == tree.get_proof(leaf)
+        assert tree.validate_proof(proof, leaf, root)
+
+
+def test_missing_leaf():
+    tree = make_tree(make_leaves(4))
+    missing = keccak(text="missing")
+
+    assert tree.get_proof_bytes(missing) is None
+    assert tree.get_proofs([missing.hex(), make_leaves(1)[0].hex()])[0] is None
+
+
+def test_bytearray_leaves():
+    leaves = make_leaves(5)
+    tree = make_tree([bytearray(leaf) for leaf in leaves])
+
+    assert tree.get_merkle_root() == make_tree(leaves).get_merkle_root()
+    assert tree.get_proof_bytes(leaves[0]) is not None
@@ -1,3 +1,7 @@
+from thirdweb.common.feature_detection import (
+    fetch_token_interfaces,
+    token_interfaces_cache,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.types.nft import NFTMetadataInput
 from thirdweb.contracts import NFTCollection
@@ -127,3 +131,72 @@ def test_ownership(nft_collection: NFTCollection, primary_account):
 
     assert nft_collection.get_owned_token_ids() == [0, 1]
     assert nft_collection.get_owned()[0].metadata.name == "Python SDK NFT 1"
+
+
+def test_get_batch(nft_collection: NFTCollection):
+    nft_collection.mint_batch(
+        [
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 1"}),
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 2"}),
+        ]
+    )
+
+    result = nft_collection.get_batch([0, 1, 5])
+
+    assert [nft.metadata.name for nft in result.items] == [
+        "Python SDK NFT 1",
+        "Python SDK NFT 2",
+    ]
+    assert result.items[0].owner == nft_collection._contract_wrapper.get_signer_address()
+    assert list(result.failures.keys()) == [5]
+    assert len(nft_collection.get_all()) == 2
+
+
+def test_iter_all(nft_collection: NFTCollection):
+    nft_collection.mint_batch(
+        [
+            NFTMetadataInput.from_json({"name": f"Python SDK NFT {i}"})
+            for i in range(5)
+        ]
+    )
+
+    names = [nft.metadata.name for nft in nft_collection.iter_all(page_size=2)]
+
+    assert names == [f"Python SDK NFT {i}" for i in range(5)]
+
+
+def test_ownership_index(nft_collection: NFTCollection):
+    nft_collection.mint_batch(
+        [
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 1"}),
+            NFTMetadataInput.from_json({"name": "Python SDK NFT 2"}),
+        ]
+    )
+
+    index = nft_collection.get_ownership_index()
+    index.sync()
+
+    signer_address = nft_collection._contract_wrapper.get_signer_address()
+    assert index.get_owned_token_ids(signer_address) == [0, 1]
+
+    nft_collection.transfer(accounts[0].address, 0)
+    index.sync()
+
+    assert index.owner_of(0) == accounts[0].address
+    assert index.get_owned_token_ids(signer_address) == [1]
+    assert index.get_owned(accounts[0].address)[0].metadata.name == "Python SDK NFT 1"
+
+
+def test_token_interfaces(nft_collection: NFTCollection):
+    provider = nft_collection._contract_wrapper.get_provider()
+    assert fetch_token_interfaces(provider, nft_collection.get_address()) == (
+        True,
+        False,
+    )
+
+    cached = [
+        key
+        for key, _ in token_interfaces_cache.items()
+        if key[1] == nft_collection.get_address().lower()
+    ]
+    assert len(cached) == 1
@@ -0,0 +1,174 @@
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+
+from thirdweb.common.claim_conditions import (
+    fetch_snapshot_entry_for_address,
+    sharded_merkle_tree_cache,
+)
+from thirdweb.common.error import InvalidAddressException
+from thirdweb.common.merkle_tree import hash_pair
+from thirdweb.common.snapshots import create_snapshot, read_snapshot_entries
+from thirdweb.core.classes.sharded_merkle_tree import (
+    ShardedMerkleTree,
+    hash_snapshot_entry,
+    set_snapshot_cache_dir,
+)
+from thirdweb.types.contracts.claim_conditions import SnapshotEntry
+
+
+class FakeStorage:
+    files: Dict[str, Any]
+    reads: List[str]
+
+    def __init__(self):
+        self.files = {}
+        self.reads = []
+
+    def upload_batch(self, files) -> str:
+        base_uri = f"ipfs://batch{len(self.files)}"
+        for file in files:
+            data = file["data"]
+            if hasattr(data, "read"):
+                data = data.read()
+            self.files[f"{base_uri}/{file['name']}"] = json.loads(data)
+        return base_uri
+
+    def upload_metadata(self, metadata: Dict[str, Any]) -> str:
+        uri = f"ipfs://metadata{len(self.files)}"
+        self.files[uri] = metadata
+        return uri
+
+    def get(self, uri: str) -> Any:
+        self.reads.append(uri)
+        return self.files[uri]
+
+
+class FakeEth:
+    chain_id = 1337
+
+
+class FakeProvider:
+    eth = FakeEth()
+
+
+def make_entries(count: int):
+    rng = random.Random(count)
+    return [
+        SnapshotEntry(
+            Web3.toChecksumAddress("0x%040x" % rng.getrandbits(160)),
+            str(rng.randint(1, 10)),
+            str(rng.randint(0, 5)),
+            "",
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("shard_nybbles", [1, 2])
+def test_snapshot_round_trip(shard_nybbles: int):
+    storage: Any = FakeStorage()
+    entries = make_entries(300)
+
+    snapshot = create_snapshot(
+        entries, 0, storage, None, shard_nybbles, max_workers=2  # type: ignore
+    )
+    assert storage.files[snapshot.snapshot_uri]["merkleRoot"] == snapshot.merkle_root
+
+    tree = ShardedMerkleTree.from_info(snapshot.info, storage)
+    for entry in entries:
+        entry_with_proof = tree.get_proof(entry.address, None)  # type: ignore
+        assert entry_with_proof is not None
+
+        node = hash_snapshot_entry(entry, 0, 18)
+        for sibling in entry_with_proof.proof:
+            node = hash_pair(node, bytes(HexBytes(sibling)))
+        assert "0x" + node.hex() == snapshot.merkle_root
+
+    missing = Web3.toChecksumAddress("0x" + "ff" * 20)
+    assert tree.get_proof(missing, None) is None  # type: ignore
+
+
+def test_invalid_addresses(tmp_path):
+    path = tmp_path / "allowlist.csv"
+    path.write_text("address,maxClaimable,price,currencyAddress\n0x1234,1,0,\n")
+
+    with pytest.raises(InvalidAddressException):
+        list(read_snapshot_entries(str(path)))
+
+    with pytest.raises(InvalidAddressException):
+        hash_snapshot_entry(SnapshotEntry("0x1234", "1", "0", ""), 0, 18)
+
+    with pytest.raises(InvalidAddressException):
+        entries = [SnapshotEntry("0x1234", "1", "0", "")]
+        create_snapshot(entries, 0, FakeStorage(), None)  # type: ignore
+
+
+def test_shard_nybbles_bound():
+    with pytest.raises(Exception):
+        create_snapshot(make_entries(1), 0, FakeStorage(), None, 4)  # type: ignore
+
+
+def test_sharded_merkle_tree_cache():
+    storage: Any = FakeStorage()
+    entries = make_entries(50)
+    snapshot = create_snapshot(entries, 0, storage, None)  # type: ignore
+    merkle_metadata = {snapshot.merkle_root: snapshot.snapshot_uri}
+    provider: Any = FakeProvider()
+
+    sharded_merkle_tree_cache.clear()
+    first = fetch_snapshot_entry_for_address(
+        entries[0].address, snapshot.merkle_root, merkle_metadata, provider, storage
+    )
+    assert first is not None
+    reads = len(storage.reads)
+
+    # Callers get their own copy of the memoized proof
+    first.proof.append("0x00")
+    second = fetch_snapshot_entry_for_address(
+        entries[0].address, snapshot.merkle_root, merkle_metadata, provider, storage
+    )
+    assert second is not None
+    assert second.proof == first.proof[:-1]
+    assert len(storage.reads) == reads
+    assert len(sharded_merkle_tree_cache) == 1
+
+
+def test_snapshot_file_cache(tmp_path):
+    storage: Any = FakeStorage()
+    entries = make_entries(50)
+    snapshot = create_snapshot(entries, 0, storage, None)  # type: ignore
+
+    set_snapshot_cache_dir(str(tmp_path))
+    try:
+        tree = ShardedMerkleTree.from_info(snapshot.info, storage)
+        expected = tree.get_proof(entries[0].address, None)  # type: ignore
+        assert len(storage.reads) == 1
+
+        # A new process would find the shard on disk instead of downloading it
+        offline: Any = FakeStorage()
+        tree = ShardedMerkleTree.from_info(snapshot.info, offline)
+        assert tree.get_proof(entries[0].address, None) == expected  # type: ignore
+        assert offline.reads == []
+    finally:
+        set_snapshot_cache_dir(None)
+
+
+def test_shards_load_once():
+    storage: Any = FakeStorage()
+    entries = make_entries(50)
+    snapshot = create_snapshot(entries, 0, storage, None, 1)  # type: ignore
+
+    tree = ShardedMerkleTree.from_info(snapshot.info, storage)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        proofs = list(
+            executor.map(lambda e: tree.get_proof(e.address, None), entries * 4)
+        )
+
+    assert all(proof is not None for proof in proofs)
+    assert len(storage.reads) == len(set(storage.reads))
@@ -1,11 +1,18 @@
 from tkinter.tix import IMAGE
 from eth_account.account import LocalAccount
+from thirdweb.common.currency import (
+    currency_metadata_cache,
+    fetch_currency_metadata,
+    load_currency_metadata_cache,
+    save_currency_metadata_cache,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.core.sdk import ThirdwebSDK
 from thirdweb.contracts import Token
 from brownie import accounts
 import pytest
 
+from thirdweb.types.currency import TokenAmount
 from thirdweb.types.settings.metadata import TokenContractMetadata
 
 
@@ -71,3 +78,97 @@ def test_transfer_tokens(token: Token):
 # test burning tokens
 
 # test allowance
+
+
+def test_currency_metadata_cache(token: Token, tmp_path):
+    """
+    Should cache currency metadata and warm start from disk
+    """
+
+    provider = token._contract_wrapper.get_provider()
+    currency = fetch_currency_metadata(provider, token.get_address())
+    assert currency.symbol == "SDK"
+
+    path = str(tmp_path / "currencies.json")
+    save_currency_metadata_cache(path)
+    currency_metadata_cache.clear()
+    load_currency_metadata_cache(path)
+
+    assert len(currency_metadata_cache) > 0
+    assert fetch_currency_metadata(provider, token.get_address()) == currency
+
+
+def test_balances_of(token: Token, tmp_path):
+    """
+    Should read and export many balances at the same block
+    """
+
+    token.mint(20)
+    token.transfer(accounts[0].address, 5)
+
+    owner = token._contract_wrapper.get_signer_address()
+    balances = token.balances_of([owner, accounts[0].address])
+    assert balances[owner].display_value == 15
+    assert balances[accounts[0].address].display_value == 5
+
+    path = str(tmp_path / "balances.jsonl")
+    token.export_balances([owner, accounts[0].address], path)
+    with open(path) as f:
+        assert len(f.readlines()) == 2
+
+
+def test_holder_index(token: Token):
+    """
+    Should index holder balances from transfer events
+    """
+
+    token.mint(20)
+    token.transfer(accounts[0].address, 5)
+
+    index = token.get_holder_index()
+    block = index.sync()
+
+    owner = token._contract_wrapper.get_signer_address()
+    assert index.get_holder_count() == 2
+    assert index.get_top_holders(1)[0][0] == owner
+    assert index.balance_of(accounts[0].address) == token.balance_of(
+        accounts[0].address
+    ).value
+    assert index.balance_at(accounts[0].address, block - 1) == 0
+
+
+def test_transfer_batch(token: Token):
+    """
+    Should transfer to many wallets in gas bounded chunks
+    """
+
+    token.mint(20)
+    recipients = [accounts[i].address for i in range(1, 5)]
+
+    results = token.transfer_batch(
+        [TokenAmount(address, 1) for address in recipients], gas_budget=150000
+    )
+
+    assert all(result.success for result in results)
+    assert len(set(result.data["transactionHash"] for result in results)) > 1
+    for address in recipients:
+        assert token.balance_of(address).display_value == 1
+
+
+def test_get_vote_balances_of(token: Token):
+    """
+    Should read votes and delegates of many wallets at once
+    """
+
+    token.mint(20)
+    owner = token._contract_wrapper.get_signer_address()
+    token.delegate_to(owner)
+    block = token._contract_wrapper.get_provider().eth.block_number
+    token.mint(5)
+
+    balances = token.get_vote_balances_of([owner, accounts[0].address], block)
+
+    assert balances[0].delegate == owner
+    assert balances[0].votes.display_value == 25
+    assert balances[0].past_votes.display_value == 20
+    assert balances[1].votes.value == 0
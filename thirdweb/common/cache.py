@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from threading import Lock, get_ident
+from typing import Any, Callable, Generic, Hashable, List, Optional, Tuple, TypeVar
+from weakref import WeakKeyDictionary
+from web3 import Web3
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe cache that holds at most max_size entries and evicts the
+    least recently used entry when it is full.
+    """
+
+    _max_size: int
+    _entries: "OrderedDict[K, V]"
+    _lock: Lock
+
+    def __init__(self, max_size: int):
+        """
+        Initializes the cache.
+
+        :param max_size: maximum number of entries to hold
+        """
+
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get an entry from the cache and mark it as recently used.
+
+        :param key: key of the entry
+        :returns: the cached value, or None if the key is not cached
+        """
+
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key: K, value: V):
+        """
+        Add or replace an entry in the cache.
+
+        :param key: key of the entry
+        :param value: value to cache
+        """
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: K, fetch: Callable[[], V]) -> V:
+        """
+        Get an entry from the cache, fetching and caching it if it's missing.
+        The fetch runs outside the lock, so concurrent misses for the same key
+        may both fetch it.
+
+        :param key: key of the entry
+        :param fetch: function returning the value to cache on a miss
+        :returns: the cached or fetched value
+        """
+
+        value = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value)
+        return value
+
+    def delete(self, key: K):
+        """
+        Remove an entry from the cache if it is present.
+
+        :param key: key of the entry
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def items(self) -> List[Tuple[K, V]]:
+        """
+        Get all the entries of the cache, from least to most recently used.
+        """
+
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class JSONFileCache:
+    """
+    A cache of JSON documents stored as files in a directory, so they outlive the
+    process. Meant for content that never changes under its key, like IPFS files.
+    """
+
+    _directory: str
+
+    def __init__(self, directory: str):
+        """
+        Initializes the cache, creating its directory if needed.
+
+        :param directory: path of the directory to store the documents in
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a document from the cache.
+
+        :param key: key of the document
+        :returns: the cached document, or None if the key is not cached
+        """
+
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any):
+        """
+        Add or replace a document in the cache.
+
+        :param key: key of the document
+        :param value: JSON serializable document to cache
+        """
+
+        path = self._path(key)
+        # Write to a temporary file first so readers never see a partial document
+        temporary_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(value, f)
+        os.replace(temporary_path, path)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self._directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+
+_chain_ids: "WeakKeyDictionary[Web3, int]" = WeakKeyDictionary()
+
+
+def fetch_chain_id(provider: Web3) -> int:
+    """
+    Get the chain ID of a provider, only querying it the first time.
+
+    :param provider: web3 provider instance
+    :returns: chain ID of the provider
+    """
+
+    chain_id = _chain_ids.get(provider)
+    if chain_id is None:
+        chain_id = provider.eth.chain_id
+        _chain_ids[provider] = chain_id
+    return chain_id
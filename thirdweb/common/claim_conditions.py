@@ -1,4 +1,4 @@
-from typing import Dict, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from web3 import Web3
 from web3.constants import MAX_INT
@@ -13,7 +13,12 @@ from thirdweb.common.currency import (
     is_native_token,
     normalize_price_value
 )
-from thirdweb.core.classes.sharded_merkle_tree import ShardedMerkleTree
+from thirdweb.common.cache import LRUCache, fetch_chain_id
+from thirdweb.constants.contract import DEFAULT_MERKLE_TREE_CACHE_SIZE
+from thirdweb.core.classes.sharded_merkle_tree import (
+    ShardedMerkleTree,
+    fetch_snapshot_file,
+)
 
 from thirdweb.types.contracts.claim_conditions import (
     ClaimCondition,
@@ -22,6 +27,13 @@ from thirdweb.types.contracts.claim_conditions import (
     SnapshotEntryWithProof,
     ShardedMerkleTreeInfo
 )
+from thirdweb.types.multicall import MulticallResult
+
+# Sharded merkle trees keep the shards they loaded, so claims against the same
+# snapshot reuse them instead of downloading and hashing them again
+sharded_merkle_tree_cache: LRUCache[Tuple[int, str, str], ShardedMerkleTree] = LRUCache(
+    DEFAULT_MERKLE_TREE_CACHE_SIZE
+)
 
 
 def prepare_claim(
@@ -113,15 +125,23 @@ def fetch_snapshot_entry_for_address(
 
     snapshot_uri = merkle_metadata[merkle_root_hash]
     if snapshot_uri:
-        raw = storage.get(snapshot_uri)
-        metadata = ShardedMerkleTreeInfo.from_json(raw)
-       
-        if metadata.merkle_root == merkle_root:
+        key = (fetch_chain_id(provider), merkle_root, snapshot_uri)
+        merkle_tree = sharded_merkle_tree_cache.get(key)
+
+        if merkle_tree is None:
+            raw = fetch_snapshot_file(storage, snapshot_uri)
+            metadata = ShardedMerkleTreeInfo.from_json(raw)
+
+            if metadata.merkle_root != merkle_root:
+                return None
+
             merkle_tree = ShardedMerkleTree.from_info(
                 metadata,
                 storage
             )
-            return merkle_tree.get_proof(address_to_claim, provider)
+            sharded_merkle_tree_cache.set(key, merkle_tree)
+
+        return merkle_tree.get_proof(address_to_claim, provider)
 
     return None
 
@@ -144,3 +164,32 @@ def transform_result_to_claim_condition(
         currency_metadata=cv,
         merkle_root_hash="0x" + cast(bytes, pm["merkleRoot"]).hex()
     )
+
+
+def transform_results_to_claim_conditions(
+    results: List[MulticallResult],
+    provider: Web3,
+    merkle_metadata: Dict[str, str],
+    storage: IpfsStorage,
+) -> List[ClaimCondition]:
+    conditions = []
+    for result in results:
+        if not result.success:
+            raise cast(Exception, result.error)
+
+        returned: Any = result.data
+        pm = IClaimConditionClaimCondition(
+            startTimestamp=returned[0],
+            maxClaimableSupply=returned[1],
+            supplyClaimed=returned[2],
+            quantityLimitPerWallet=returned[3],
+            merkleRoot=returned[4],
+            pricePerToken=returned[5],
+            currency=returned[6],
+            metadata=returned[7],
+        )
+        conditions.append(
+            transform_result_to_claim_condition(pm, provider, merkle_metadata, storage)
+        )
+
+    return conditions
@@ -1,8 +1,13 @@
+import json
+from typing import Any, Dict, List, Tuple
+from thirdweb.common.cache import LRUCache, fetch_chain_id
 from thirdweb.constants.chains import ChainId
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.types.currency import Currency, CurrencyValue, Price, PriceWei
+from thirdweb.types.multicall import MulticallResult
 from thirdweb.abi import TokenERC20, IERC20
 from thirdweb.constants.currency import (
+    DEFAULT_CURRENCY_CACHE_SIZE,
     NATIVE_TOKEN_ADDRESS,
     ZERO_ADDRESS,
     get_native_token_by_chain_id,
@@ -28,14 +33,65 @@ def format_units(wei_value: PriceWei, decimals: int) -> Price:
     return wei_value / (10**decimals)
 
 
+# Token metadata never changes, so currencies are cached for the whole process
+# by (chain ID, lowercase token address)
+currency_metadata_cache: LRUCache[Tuple[int, str], Currency] = LRUCache(
+    DEFAULT_CURRENCY_CACHE_SIZE
+)
+
+
 def fetch_currency_metadata(provider: Web3, asset: str) -> Currency:
+    chain_id = fetch_chain_id(provider)
+
     if is_native_token(asset):
-        chain_id = provider.eth.chain_id
         native_token = get_native_token_by_chain_id(ChainId(chain_id))
         return Currency(native_token.name, native_token.symbol, native_token.decimals)
 
-    abi = TokenERC20(provider, asset)
-    return Currency(abi.name.call(), abi.symbol.call(), abi.decimals.call())
+    def fetch() -> Currency:
+        abi = TokenERC20(provider, asset)
+        return Currency(abi.name.call(), abi.symbol.call(), abi.decimals.call())
+
+    return currency_metadata_cache.get_or_set((chain_id, asset.lower()), fetch)
+
+
+def load_currency_metadata_cache(path: str):
+    """
+    Warm the currency metadata cache from a file written by save_currency_metadata_cache.
+
+    :param path: path of the JSON file to load
+    """
+
+    with open(path) as f:
+        entries = json.load(f)
+
+    for entry in entries:
+        currency_metadata_cache.set(
+            (entry["chain_id"], entry["address"].lower()),
+            Currency(entry["name"], entry["symbol"], entry["decimals"]),
+        )
+
+
+def save_currency_metadata_cache(path: str):
+    """
+    Save the currency metadata cache to a JSON file, so a later process can start
+    with it warm through load_currency_metadata_cache.
+
+    :param path: path of the JSON file to write
+    """
+
+    entries = [
+        {
+            "chain_id": chain_id,
+            "address": address,
+            "name": currency.name,
+            "symbol": currency.symbol,
+            "decimals": currency.decimals,
+        }
+        for (chain_id, address), currency in currency_metadata_cache.items()
+    ]
+
+    with open(path, "w") as f:
+        json.dump(entries, f)
 
 
 def fetch_currency_value(provider: Web3, asset: str, price: PriceWei) -> CurrencyValue:
@@ -92,6 +148,45 @@ def set_erc20_allowance(
         return overrides
 
 
+def set_erc20_allowances(
+    contract_to_approve: ContractWrapper, values: Dict[str, int]
+) -> Dict[str, MulticallResult]:
+    """
+    Approve the contract to spend the given amount of each ERC20 currency, sending
+    at most one approval per currency and submitting them all back to back.
+
+    :param contract_to_approve: contract wrapper of the spender, with the signer
+    :param values: map of currency address to the total amount to allow
+    :return: map of each currency that needed an approval to its outcome
+    """
+
+    provider = contract_to_approve.get_provider()
+    owner = contract_to_approve.get_signer_address()
+    spender = contract_to_approve._contract_abi.contract_address
+    gas_price = provider.eth.gas_price
+
+    currencies: List[str] = []
+    txs: List[Any] = []
+    for currency_address, value in values.items():
+        if is_native_token(currency_address):
+            continue
+
+        erc20 = IERC20(provider, currency_address)
+        try:
+            if erc20.allowance.call(owner, spender) >= value:
+                continue
+            tx: Any = erc20.approve.build_transaction(
+                spender, value, tx_params=TxParams(from_=owner, gas_price=gas_price)
+            )
+        except Exception as e:
+            tx = e
+
+        currencies.append(currency_address)
+        txs.append(tx)
+
+    return dict(zip(currencies, contract_to_approve._send_pipelined(txs)))
+
+
 def approve_erc20_allowance(
     contract_to_approve: ContractWrapper,
     currency_address: str,
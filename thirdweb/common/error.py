@@ -80,5 +80,10 @@ class DuplicateLeafsException(Exception):
         super().__init__(f"Duplicate leafs: {message}")
 
 
+class InvalidAddressException(Exception):
+    def __init__(self, address: str):
+        super().__init__(f"Invalid address: {address}")
+
+
 def includes_error_message(err: Any, message: str) -> bool:
     return message in str(err)
@@ -1,11 +1,29 @@
 import base58
+from time import time
+from typing import Tuple
 from hexbytes import HexBytes
 from web3.contract import ContractFunctions
 from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from thirdweb.abi import TokenERC721
+from thirdweb.common.cache import LRUCache, fetch_chain_id
+from thirdweb.constants.contract import (
+    DEFAULT_INTERFACE_CACHE_SIZE,
+    DEFAULT_INTERFACE_CACHE_TTL,
+    INTERFACE_ID_IERC1155,
+    INTERFACE_ID_IERC721,
+)
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from cbor2 import decoder
 import json
 
+# Expiry time and supported token interfaces keyed by (chain ID, address), kept
+# until they expire, are evicted or are invalidated with invalidate_token_interfaces
+token_interfaces_cache: LRUCache[
+    Tuple[int, str], Tuple[float, Tuple[bool, bool]]
+] = LRUCache(DEFAULT_INTERFACE_CACHE_SIZE)
+
 
 def matches_interface(
     contract: ContractFunctions, interface_to_match: ContractFunctions
@@ -17,6 +35,64 @@ def matches_interface(
     return set(interface_fn) == set(overlap)
 
 
+def fetch_token_interfaces(provider: Web3, address: str) -> Tuple[bool, bool]:
+    """
+    Check whether a contract implements the ERC721 and ERC1155 interfaces. Both
+    interfaces are probed in one multicall, and the result is cached per chain
+    and address for DEFAULT_INTERFACE_CACHE_TTL seconds. Call
+    invalidate_token_interfaces to probe a contract again right away, like after
+    upgrading a proxy.
+
+    :param provider: web3 provider instance to use
+    :param address: address of the contract to check
+    :returns: whether the contract implements ERC721, and whether it implements ERC1155
+    """
+
+    key = (fetch_chain_id(provider), address.lower())
+    now = time()
+    cached = token_interfaces_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    interfaces = _probe_token_interfaces(provider, address)
+    token_interfaces_cache.set(key, (now + DEFAULT_INTERFACE_CACHE_TTL, interfaces))
+    return interfaces
+
+
+def invalidate_token_interfaces(provider: Web3, address: str):
+    """
+    Drop the cached interfaces of a contract, so the next check probes it again.
+    Use it after upgrading a proxy or redeploying a contract at the same address.
+
+    :param provider: web3 provider instance to use
+    :param address: address of the contract
+    """
+
+    token_interfaces_cache.delete((fetch_chain_id(provider), address.lower()))
+
+
+def _probe_token_interfaces(provider: Web3, address: str) -> Tuple[bool, bool]:
+    wrapper = ContractWrapper(TokenERC721(provider, address), provider)
+    results = wrapper.multi_call_read(
+        [
+            ("supportsInterface", [INTERFACE_ID_IERC721]),
+            ("supportsInterface", [INTERFACE_ID_IERC1155]),
+        ]
+    )
+
+    supported = []
+    for result in results:
+        # Contracts without ERC165 revert or return nothing, anything else is
+        # a failed request that shouldn't be cached
+        if not result.success and not isinstance(
+            result.error, (BadFunctionCallOutput, ContractLogicError)
+        ):
+            raise result.error  # type: ignore
+        supported.append(result.success and bool(result.data))
+
+    return (supported[0], supported[1])
+
+
 def fetch_contract_metadata(metadata_uri: str, storage: IpfsStorage) -> str:
     metadata = storage.get(metadata_uri)
     return metadata["output"]["abi"]
@@ -1,13 +1,19 @@
-from typing import Optional, Union, cast
-from thirdweb.abi import IERC165, IERC721, IERC1155
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from thirdweb.abi import IERC721, IERC1155, TokenERC721, TokenERC1155
 from thirdweb.common.currency import fetch_currency_value
-from thirdweb.constants.contract import INTERFACE_ID_IERC1155, INTERFACE_ID_IERC721
+from thirdweb.common.feature_detection import fetch_token_interfaces
+from thirdweb.common.nft import fetch_token_metadata_batch
+from thirdweb.constants.contract import DEFAULT_MAX_WORKERS
 from eth_account.account import LocalAccount
 from web3 import Web3
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.currency import Price, PriceWei
+from thirdweb.types.nft import NFTMetadata
 
 from thirdweb.types.marketplace import (
+    ContractListing,
     ContractOffer,
     NewAuctionListing,
     NewDirectListing,
@@ -25,9 +31,7 @@ def is_token_approved_for_transfer(
     fr: str,
 ) -> bool:
     try:
-        erc165 = IERC165(provider, asset_contract)
-        is_erc721 = erc165.supports_interface.call(INTERFACE_ID_IERC721)
-        is_erc1155 = erc165.supports_interface.call(INTERFACE_ID_IERC1155)
+        is_erc721, is_erc1155 = fetch_token_interfaces(provider, asset_contract)
 
         if is_erc721:
             ierc721 = IERC721(provider, asset_contract)
@@ -61,9 +65,7 @@ def handle_token_approval(
     token_id: int,
     fr: str,
 ):
-    erc165 = IERC165(provider, asset_contract)
-    is_erc721 = erc165.supports_interface.call(INTERFACE_ID_IERC721)
-    is_erc1155 = erc165.supports_interface.call(INTERFACE_ID_IERC1155)
+    is_erc721, is_erc1155 = fetch_token_interfaces(provider, asset_contract)
 
     if is_erc721:
         ierc721_abi = IERC721(provider, asset_contract)
@@ -97,6 +99,284 @@ def handle_token_approval(
         raise Exception("Contract does not implement ERC1155 or ERC721")
 
 
+def fetch_listing_assets(
+    provider: Web3,
+    marketplace_address: str,
+    listings: List[ContractListing],
+    storage: IpfsStorage,
+    validity: Optional[Dict[int, bool]] = None,
+) -> Dict[int, Tuple[NFTMetadata, bool]]:
+    """
+    Fetch the asset metadata of many listings, and check whether the seller of each
+    listing still owns its asset and has approved the marketplace to transfer it.
+
+    The calls to each asset contract are batched into multicalls, and the asset
+    contracts are queried concurrently.
+
+    :param provider: web3 provider instance to use
+    :param marketplace_address: address of the marketplace the listings are on
+    :param listings: listings to fetch the assets of
+    :param storage: storage to fetch the asset metadata from
+    :param validity: optional validity of the listings already returned by
+        fetch_listing_validity, to skip reading it again
+    :returns: map of listing ID to the metadata of its asset and whether the listing
+        is still valid. Listings whose asset metadata can't be fetched are left out.
+    """
+
+    by_contract: Dict[str, List[ContractListing]] = {}
+    for listing in listings:
+        by_contract.setdefault(listing.asset_contract.lower(), []).append(listing)
+
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda group: _fetch_contract_listing_assets(
+                provider, marketplace_address, group, storage, validity
+            ),
+            by_contract.values(),
+        )
+
+    assets: Dict[int, Tuple[NFTMetadata, bool]] = {}
+    for result in results:
+        assets.update(result)
+
+    return assets
+
+
+def fetch_listing_validity(
+    provider: Web3,
+    marketplace_address: str,
+    listings: List[ContractListing],
+) -> Dict[int, bool]:
+    """
+    Check whether the seller of each listing still owns its asset and has approved
+    the marketplace to transfer it, without fetching any asset metadata.
+
+    :param provider: web3 provider instance to use
+    :param marketplace_address: address of the marketplace the listings are on
+    :param listings: listings to check
+    :returns: map of listing ID to whether the listing is still valid
+    """
+
+    by_contract: Dict[str, List[ContractListing]] = {}
+    for listing in listings:
+        by_contract.setdefault(listing.asset_contract.lower(), []).append(listing)
+
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda group: _fetch_contract_listing_validity(
+                provider, marketplace_address, group
+            ),
+            by_contract.values(),
+        )
+
+    validity: Dict[int, bool] = {}
+    for result in results:
+        validity.update(result)
+
+    return validity
+
+
+def fetch_assets_metadata(
+    provider: Web3,
+    assets: List[Tuple[str, int, int]],
+    storage: IpfsStorage,
+) -> Tuple[Dict[Tuple[str, int], NFTMetadata], Dict[Tuple[str, int], Exception]]:
+    """
+    Fetch the metadata of many assets whose token standard is already known. The
+    token URIs of each contract are read in one batch, and the contracts are
+    queried concurrently.
+
+    :param provider: web3 provider instance to use
+    :param assets: list of asset contract address, token ID and token type, where
+        the token type is 0 for ERC721 and 1 for ERC1155
+    :param storage: storage to fetch the metadata from
+    :returns: map of (lowercase asset contract address, token ID) to metadata, and
+        map of the same keys to the error raised while fetching it
+    """
+
+    by_contract: Dict[str, Tuple[str, int, Set[int]]] = {}
+    for asset_contract, token_id, token_type in assets:
+        group = by_contract.setdefault(
+            asset_contract.lower(), (asset_contract, token_type, set())
+        )
+        group[2].add(token_id)
+
+    def fetch_contract(
+        group: Tuple[str, int, Set[int]]
+    ) -> Tuple[Dict[int, NFTMetadata], Dict[int, Exception]]:
+        asset_contract, token_type, token_ids = group
+        if token_type == 0:
+            wrapper: ContractWrapper[Any] = ContractWrapper(
+                TokenERC721(provider, asset_contract), provider
+            )
+            fn = "tokenURI"
+        else:
+            wrapper = ContractWrapper(TokenERC1155(provider, asset_contract), provider)
+            fn = "uri"
+
+        ids = sorted(token_ids)
+        results = wrapper.multi_call_read([(fn, [token_id]) for token_id in ids])
+
+        token_uris: Dict[int, str] = {}
+        failures: Dict[int, Exception] = {}
+        for token_id, result in zip(ids, results):
+            if result.success and result.data:
+                token_uris[token_id] = result.data
+            else:
+                failures[token_id] = result.error or Exception(
+                    f"Token {token_id} of {asset_contract} has no metadata URI"
+                )
+
+        metadata, fetch_failures = fetch_token_metadata_batch(token_uris, storage)
+        failures.update(fetch_failures)
+        return metadata, failures
+
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+        results = list(executor.map(fetch_contract, by_contract.values()))
+
+    metadata: Dict[Tuple[str, int], NFTMetadata] = {}
+    failures: Dict[Tuple[str, int], Exception] = {}
+    for address, (contract_metadata, contract_failures) in zip(by_contract, results):
+        for token_id, token_metadata in contract_metadata.items():
+            metadata[(address, token_id)] = token_metadata
+        for token_id, error in contract_failures.items():
+            failures[(address, token_id)] = error
+
+    return metadata, failures
+
+
+def _fetch_contract_listing_assets(
+    provider: Web3,
+    marketplace_address: str,
+    listings: List[ContractListing],
+    storage: IpfsStorage,
+    known_validity: Optional[Dict[int, bool]],
+) -> Dict[int, Tuple[NFTMetadata, bool]]:
+    asset = _get_asset_wrapper(provider, listings[0].asset_contract)
+    if asset is None:
+        return {}
+
+    wrapper, is_erc721 = asset
+    sellers = list({listing.token_owner for listing in listings})
+    uri_fn = "tokenURI" if is_erc721 else "uri"
+    calls: List[Tuple[str, List[Any]]] = [
+        (uri_fn, [listing.token_id]) for listing in listings
+    ]
+    if known_validity is None:
+        calls += _get_validity_calls(marketplace_address, listings, sellers, is_erc721)
+
+    results = wrapper.multi_call_read(calls)
+    if known_validity is None:
+        validity = _read_validity(
+            marketplace_address, listings, sellers, is_erc721, results[len(listings) :]
+        )
+    else:
+        validity = {
+            listing.listing_id: known_validity.get(listing.listing_id, False)
+            for listing in listings
+        }
+
+    token_uris: Dict[int, str] = {}
+    for listing, uri in zip(listings, results):
+        if uri.success and uri.data:
+            token_uris[listing.token_id] = uri.data
+
+    metadata, _ = fetch_token_metadata_batch(token_uris, storage)
+
+    return {
+        listing.listing_id: (metadata[listing.token_id], validity[listing.listing_id])
+        for listing in listings
+        if listing.token_id in metadata
+    }
+
+
+def _fetch_contract_listing_validity(
+    provider: Web3, marketplace_address: str, listings: List[ContractListing]
+) -> Dict[int, bool]:
+    asset = _get_asset_wrapper(provider, listings[0].asset_contract)
+    if asset is None:
+        return {listing.listing_id: False for listing in listings}
+
+    wrapper, is_erc721 = asset
+    sellers = list({listing.token_owner for listing in listings})
+    results = wrapper.multi_call_read(
+        _get_validity_calls(marketplace_address, listings, sellers, is_erc721)
+    )
+
+    return _read_validity(marketplace_address, listings, sellers, is_erc721, results)
+
+
+def _get_asset_wrapper(
+    provider: Web3, asset_contract: str
+) -> Optional[Tuple[ContractWrapper[Any], bool]]:
+    is_erc721, is_erc1155 = fetch_token_interfaces(provider, asset_contract)
+    if is_erc721:
+        return ContractWrapper(TokenERC721(provider, asset_contract), provider), True
+    elif is_erc1155:
+        return ContractWrapper(TokenERC1155(provider, asset_contract), provider), False
+    return None
+
+
+def _get_validity_calls(
+    marketplace_address: str,
+    listings: List[ContractListing],
+    sellers: List[str],
+    is_erc721: bool,
+) -> List[Tuple[str, List[Any]]]:
+    # ERC721 listings need the owner and the approval of each token, ERC1155
+    # listings the balance of each seller, followed by the approvals of the sellers
+    calls: List[Tuple[str, List[Any]]] = []
+    for listing in listings:
+        if is_erc721:
+            calls.append(("ownerOf", [listing.token_id]))
+            calls.append(("getApproved", [listing.token_id]))
+        else:
+            calls.append(("balanceOf", [listing.token_owner, listing.token_id]))
+    for seller in sellers:
+        calls.append(("isApprovedForAll", [seller, marketplace_address]))
+
+    return calls
+
+
+def _read_validity(
+    marketplace_address: str,
+    listings: List[ContractListing],
+    sellers: List[str],
+    is_erc721: bool,
+    results: List[Any],
+) -> Dict[int, bool]:
+    step = 2 if is_erc721 else 1
+    approved_for_all = {
+        seller: result.success and result.data
+        for seller, result in zip(sellers, results[len(listings) * step :])
+    }
+
+    validity: Dict[int, bool] = {}
+    for i, listing in enumerate(listings):
+        holding = results[i * step]
+        if is_erc721:
+            approval = results[i * step + 1]
+            approved = approved_for_all[listing.token_owner] or (
+                approval.success
+                and approval.data.lower() == marketplace_address.lower()
+            )
+            valid = (
+                approved
+                and holding.success
+                and holding.data.lower() == listing.token_owner.lower()
+            )
+        else:
+            valid = (
+                approved_for_all[listing.token_owner]
+                and holding.success
+                and holding.data >= listing.quantity
+            )
+
+        validity[listing.listing_id] = bool(valid)
+
+    return validity
+
+
 def validate_new_listing_param(param: Union[NewDirectListing, NewAuctionListing]):
     if param.asset_contract_address == None:
         raise Exception("Asset contract address is required")
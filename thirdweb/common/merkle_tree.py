@@ -1,7 +1,10 @@
-
 import binascii
+from typing import Dict, Iterable, List, Optional, Set, Tuple, cast
+from eth_utils import keccak
 from hexbytes import HexBytes
-from web3 import Web3
+
+# Size in bytes of every node of the tree
+NODE_SIZE = 32
 
 
 class HashedData:
@@ -10,31 +13,48 @@ class HashedData:
 
     def hexdigest(self):
         return self.data.hex()[2:]
-    
+
     def digest(self):
-        digest = binascii.unhexlify(self.data.hex()[2:])
-        return digest
+        return bytes(self.data)
+
+
+def keccak256(x: bytes) -> HashedData:
+    return HashedData(HexBytes(keccak(bytes(x))))
+
+
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """
+    Hash two sibling nodes the way the contracts verify proofs, smallest node first.
+    """
+
+    return keccak(left + right) if left <= right else keccak(right + left)
 
 
-def keccak256(x: bytearray) -> HashedData:
-    hexstr = binascii.hexlify(x).decode("ascii")
-    keccak = Web3.keccak(hexstr=hexstr)
-    return HashedData(keccak)
-    
 class MerkleTree(object):
+    """
+    Merkle tree with sorted leaves and sorted sibling pairs, matching the
+    OpenZeppelin MerkleProof verifier used by the drop contracts.
+
+    Each level is stored as one bytes object of 32 byte nodes, from the leaves
+    up to the root, and leaves are indexed so proofs are found without a scan.
+    """
+
+    leaves: List[bytes]
+    levels: Optional[List[bytes]]
+    leaf_indices: Dict[bytes, int]
+    is_ready: bool
+
     def __init__(self):
         self.hash_function = keccak256
         self.reset_tree()
 
-    def _to_hex(self, x):
-        try:  # python3
-            return x.hex()
-        except:  # python2
-            return binascii.hexlify(x)
+    def _to_hex(self, x: bytes) -> str:
+        return x.hex()
 
     def reset_tree(self):
         self.leaves = list()
         self.levels = None
+        self.leaf_indices = {}
         self.is_ready = False
 
     def add_leaf(self, values, do_hash=False):
@@ -44,10 +64,17 @@ class MerkleTree(object):
             values = [values]
         for v in values:
             if do_hash:
-                v = v.encode('utf-8')
-                v = self.hash_function(v).hexdigest()
-            v = bytearray.fromhex(v)
-            self.leaves.append(v)
+                self.leaves.append(keccak(v.encode("utf-8")))
+            else:
+                self.leaves.append(binascii.unhexlify(v))
+
+    def add_leaf_bytes(self, leaves: Iterable[bytes]):
+        """
+        Add already hashed leaves as raw bytes, without any hex conversion
+        """
+
+        self.is_ready = False
+        self.leaves.extend(bytes(leaf) for leaf in leaves)
 
     def get_leaf(self, index):
         return self._to_hex(self.leaves[index])
@@ -58,84 +85,126 @@ class MerkleTree(object):
     def get_tree_ready_state(self):
         return self.is_ready
 
-    def _calculate_next_level(self):
-        solo_leave = None
-        N = len(self.levels[0])  # number of leaves on the level
-        if N % 2 == 1:  # if odd number of leaves on the level
-            solo_leave = self.levels[0][-1]
-            N -= 1
-
-        new_level = []
-        for l, r in zip(self.levels[0][0:N:2], self.levels[0][1:N:2]):
-            # IMPORTANT: Sort the leaves before hashing
-            sorted_leaves = [l, r]
-            sorted_leaves.sort()
-            left = sorted_leaves[0]
-            right = sorted_leaves[1]
-
-            new_level.append(self.hash_function(left+right).digest())
-        if solo_leave is not None:
-            new_level.append(solo_leave)
-        self.levels = [new_level, ] + self.levels  # prepend new level
-
     def make_tree(self):
         self.is_ready = False
         # IMPORTANT: Sort the leaves before building tree
         self.leaves.sort()
+        self.leaf_indices = {}
+        for index, leaf in enumerate(self.leaves):
+            self.leaf_indices.setdefault(leaf, index)
+
         if self.get_leaf_count() > 0:
-            self.levels = [self.leaves, ]
-            while len(self.levels[0]) > 1:
-                self._calculate_next_level()
+            self.levels = [b"".join(self.leaves)]
+            while len(self.levels[-1]) > NODE_SIZE:
+                self.levels.append(self._calculate_next_level(self.levels[-1]))
+        else:
+            self.levels = None
         self.is_ready = True
 
     def get_merkle_root(self):
-        if self.is_ready:
-            if self.levels is not None:
-                return self._to_hex(self.levels[0][0])
-            else:
-                return None
-        else:
-            return None
+        if self.is_ready and self.levels is not None:
+            return self._to_hex(self.levels[-1])
+        return None
 
     def get_proof(self, leaf: str):
-        try:
-            index = self.leaves.index(binascii.unhexlify(leaf))
-        except ValueError:
+        proof = self.get_proof_bytes(binascii.unhexlify(leaf))
+        if proof is None:
             return None
 
-        if self.levels is None:
-            return None
-        elif not self.is_ready or index > len(self.leaves)-1 or index < 0:
-            return None
-        else:
-            proof = []
-            for x in range(len(self.levels) - 1, 0, -1):
-                level_len = len(self.levels[x])
-                if (index == level_len - 1) and (level_len % 2 == 1):  # skip if this is an odd end node
-                    index = int(index / 2.)
+        return [
+            {"right" if is_right else "left": self._to_hex(sibling)}
+            for sibling, is_right in proof
+        ]
+
+    def get_proofs(self, leaves: List[str]) -> List[Optional[List[Dict[str, str]]]]:
+        """
+        Get the proofs of many leaves at once, walking the levels of the tree once
+
+        :param leaves: hex encoded leaves to get the proofs of
+        :return: the proof of each leaf, or None for leaves that aren't in the tree
+        """
+
+        return [
+            [
+                {"right" if is_right else "left": self._to_hex(sibling)}
+                for sibling, is_right in proof
+            ]
+            if proof is not None
+            else None
+            for proof in self.get_proofs_bytes(
+                [binascii.unhexlify(leaf) for leaf in leaves]
+            )
+        ]
+
+    def get_proofs_bytes(
+        self, leaves: List[bytes]
+    ) -> List[Optional[List[Tuple[bytes, bool]]]]:
+        """
+        Get the proofs of many leaves as raw sibling hashes, walking the levels of
+        the tree once and reading each shared node only once per level
+
+        :param leaves: raw leaf hashes
+        :return: the proof of each leaf, or None for leaves that aren't in the tree
+        """
+
+        if not self.is_ready or self.levels is None:
+            return [None for _ in leaves]
+
+        indices = [self.leaf_indices.get(bytes(leaf)) for leaf in leaves]
+        proofs: List[Optional[List[Tuple[bytes, bool]]]] = [
+            [] if index is not None else None for index in indices
+        ]
+        for level in self.levels[:-1]:
+            steps = self._get_proof_steps(level, {i for i in indices if i is not None})
+            for n, index in enumerate(indices):
+                if index is None:
                     continue
-                is_right_node = index % 2
-                sibling_index = index - 1 if is_right_node else index + 1
-                sibling_pos = "left" if is_right_node else "right"
-                sibling_value = self._to_hex(self.levels[x][sibling_index])
-                proof.append({sibling_pos: sibling_value})
-                index = int(index / 2.)
-            return proof
+
+                step = steps[index]
+                if step is not None:
+                    cast(List[Tuple[bytes, bool]], proofs[n]).append(step)
+                indices[n] = index // 2
+
+        return proofs
+
+    def get_proof_bytes(self, leaf: bytes):
+        """
+        Get the proof of a leaf as raw sibling hashes, from the leaf up to the root
+
+        :param leaf: raw leaf hash
+        :return: list of sibling hash and whether the sibling is the right node, or
+            None if the leaf is not in the tree
+        """
+
+        return self.get_proofs_bytes([leaf])[0]
 
     def validate_proof(self, proof, target_hash, merkle_root):
-        merkle_root = bytearray.fromhex(merkle_root)
-        target_hash = bytearray.fromhex(target_hash)
-        if len(proof) == 0:
-            return target_hash == merkle_root
-        else:
-            proof_hash = target_hash
-            for p in proof:
-                try:
-                    # the sibling is a left node
-                    sibling = bytearray.fromhex(p['left'])
-                    proof_hash = self.hash_function(sibling + proof_hash).digest()
-                except:
-                    # the sibling is a right node
-                    sibling = bytearray.fromhex(p['right'])
-                    proof_hash = self.hash_function(proof_hash + sibling).digest()
-            return proof_hash == merkle_root
\ No newline at end of file
+        proof_hash = bytes.fromhex(target_hash)
+        for p in proof:
+            # Siblings are hashed in sorted order, whichever side they are on
+            proof_hash = hash_pair(proof_hash, bytes.fromhex(p.get("left", p.get("right"))))
+        return proof_hash == bytes.fromhex(merkle_root)
+
+    def _get_proof_steps(
+        self, level: bytes, indices: Set[int]
+    ) -> Dict[int, Optional[Tuple[bytes, bool]]]:
+        # Sibling of each node and whether it is the right node, None for an odd end node
+        level_len = len(level) // NODE_SIZE
+        steps: Dict[int, Optional[Tuple[bytes, bool]]] = {}
+        for index in indices:
+            if (index == level_len - 1) and (level_len % 2 == 1):
+                steps[index] = None
+                continue
+            is_right_node = index % 2
+            sibling_index = index - 1 if is_right_node else index + 1
+            sibling = level[sibling_index * NODE_SIZE : (sibling_index + 1) * NODE_SIZE]
+            steps[index] = (sibling, not is_right_node)
+        return steps
+
+    def _calculate_next_level(self, level: bytes) -> bytes:
+        nodes = [level[i : i + NODE_SIZE] for i in range(0, len(level), NODE_SIZE)]
+        # IMPORTANT: Sort the leaves before hashing
+        next_level = [hash_pair(l, r) for l, r in zip(nodes[0::2], nodes[1::2])]
+        if len(nodes) % 2 == 1:  # promote the odd node to the next level
+            next_level.append(nodes[-1])
+        return b"".join(next_level)
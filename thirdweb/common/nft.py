@@ -1,9 +1,12 @@
-from typing import List, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any, Dict, List, Tuple, Union, cast
 
 from web3 import Web3
-from thirdweb.abi import TokenERC1155, IERC165, TokenERC721
+from thirdweb.abi import TokenERC1155, TokenERC721
 from thirdweb.common.error import UploadException
-from thirdweb.constants.contract import INTERFACE_ID_IERC1155, INTERFACE_ID_IERC721
+from thirdweb.common.feature_detection import fetch_token_interfaces
+from thirdweb.constants.contract import DEFAULT_MAX_WORKERS
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.nft import NFTMetadata, NFTMetadataInput
 
@@ -11,7 +14,22 @@ from thirdweb.types.nft import NFTMetadata, NFTMetadataInput
 def fetch_token_metadata(
     token_id: int, token_uri: str, storage: IpfsStorage
 ) -> NFTMetadata:
-    metadata = storage.get(token_uri)
+    metadata = storage.get(resolve_token_uri(token_id, token_uri))
+    return map_token_metadata(token_id, token_uri, metadata)
+
+
+def resolve_token_uri(token_id: int, token_uri: str) -> str:
+    """
+    Expand the ERC1155 {id} template in a token URI, which is substituted with the
+    token ID as 64 lowercase hex characters.
+    """
+
+    return token_uri.replace("{id}", format(token_id, "064x"))
+
+
+def map_token_metadata(
+    token_id: int, token_uri: str, metadata: Dict[str, Any]
+) -> NFTMetadata:
     return NFTMetadata(
         token_id,
         token_uri,
@@ -25,15 +43,62 @@ def fetch_token_metadata(
     )
 
 
+def fetch_token_metadata_batch(
+    token_uris: Dict[int, str], storage: IpfsStorage
+) -> Tuple[Dict[int, NFTMetadata], Dict[int, Exception]]:
+    """
+    Fetch the metadata of many tokens concurrently. ERC1155 {id} templates are
+    expanded first, and each distinct URI is only downloaded once, so tokens that
+    share a URI don't cost extra requests.
+
+    :param token_uris: map of token ID to the URI of its metadata
+    :param storage: storage to fetch the metadata from
+    :returns: map of token ID to metadata, and map of token ID to the error
+        raised while fetching it
+    """
+
+    resolved_uris = {
+        token_id: resolve_token_uri(token_id, uri) for token_id, uri in token_uris.items()
+    }
+    unique_uris = list(dict.fromkeys(resolved_uris.values()))
+
+    def fetch(uri: str) -> Union[Any, Exception]:
+        try:
+            return storage.get(uri)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+        fetched = dict(zip(unique_uris, executor.map(fetch, unique_uris)))
+
+    metadatas: Dict[int, NFTMetadata] = {}
+    failures: Dict[int, Exception] = {}
+    seen = set()
+    for token_id, uri in token_uris.items():
+        resolved_uri = resolved_uris[token_id]
+        data = fetched[resolved_uri]
+        if isinstance(data, Exception):
+            failures[token_id] = data
+            continue
+
+        try:
+            metadatas[token_id] = map_token_metadata(
+                token_id, uri, deepcopy(data) if resolved_uri in seen else data
+            )
+            seen.add(resolved_uri)
+        except Exception as e:
+            failures[token_id] = e
+
+    return metadatas, failures
+
+
 def fetch_token_metadata_for_contract(
     contract_address: str,
     provider: Web3,
     token_id: int,
     storage: IpfsStorage,
 ):
-    erc165 = IERC165(provider, contract_address)
-    is_erc721 = erc165.supports_interface.call(INTERFACE_ID_IERC721)
-    is_erc1155 = erc165.supports_interface.call(INTERFACE_ID_IERC1155)
+    is_erc721, is_erc1155 = fetch_token_interfaces(provider, contract_address)
 
     if is_erc721:
         erc721 = TokenERC721(provider, contract_address)
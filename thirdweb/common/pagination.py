@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, TypeVar
+from thirdweb.constants.contract import DEFAULT_MAX_WORKERS
+
+T = TypeVar("T")
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], List[T]],
+    start: int,
+    end: int,
+    page_size: int,
+) -> Iterator[T]:
+    """
+    Iterate over the items with IDs in [start, end) page by page. The next page
+    is fetched in the background while the items of the current one are consumed,
+    so only two pages are ever held in memory.
+
+    :param fetch_page: function taking the start ID and count of a page and returning its items
+    :param start: ID of the first item
+    :param end: ID after the last item
+    :param page_size: number of IDs to fetch per page
+    :returns: iterator over the items of every page, in order
+    """
+
+    if page_size <= 0:
+        raise ValueError("page_size must be greater than 0")
+
+    page_starts = range(start, end, page_size)
+    if len(page_starts) == 0:
+        return
+
+    def submit(executor: ThreadPoolExecutor, page_start: int):
+        return executor.submit(
+            fetch_page, page_start, min(page_size, end - page_start)
+        )
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_page = submit(executor, page_starts[0])
+        for index in range(len(page_starts)):
+            page = next_page.result()
+            if index + 1 < len(page_starts):
+                next_page = submit(executor, page_starts[index + 1])
+
+            for item in page:
+                yield item
+
+
+def fetch_pages(
+    fetch_page: Callable[[int, int], List[T]],
+    start: int,
+    end: int,
+    page_size: int,
+) -> List[T]:
+    """
+    Fetch the items with IDs in [start, end) in pages of page_size IDs, with the
+    pages fetched concurrently.
+
+    :param fetch_page: function taking the start ID and count of a page and returning its items
+    :param start: ID of the first item
+    :param end: ID after the last item
+    :param page_size: number of IDs to fetch per page
+    :returns: the items of every page, in order
+    """
+
+    if page_size <= 0:
+        raise ValueError("page_size must be greater than 0")
+
+    page_starts = range(start, end, page_size)
+    with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+        pages = list(
+            executor.map(
+                lambda page_start: fetch_page(
+                    page_start, min(page_size, end - page_start)
+                ),
+                page_starts,
+            )
+        )
+
+    return [item for page in pages for item in page]
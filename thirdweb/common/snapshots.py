@@ -1,87 +1,257 @@
-from hexbytes import HexBytes
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from web3 import Web3
-from thirdweb.common.error import DuplicateLeafsException
+from thirdweb.common.currency import fetch_currency_metadata
+from thirdweb.common.error import DuplicateLeafsException, InvalidAddressException
+from thirdweb.common.merkle_tree import MerkleTree
+from thirdweb.constants.contract import (
+    DEFAULT_SHARD_NYBBLES,
+    MAX_SHARD_NYBBLES,
+    SNAPSHOT_WRITE_BUFFER_SIZE,
+)
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.sharded_merkle_tree import hash_snapshot_entry
 from thirdweb.types.contracts.claim_conditions import (
+    ShardData,
+    ShardedMerkleTreeInfo,
+    SnapshotEntry,
     SnapshotInfo,
-    SnapshotInput,
-    SnapshotProof,
 )
-from thirdweb.common.currency import parse_units
-from pymerkle import MerkleTree
-
 
-class HashedData:
-    def __init__(self, data: HexBytes):
-        self.data = data
 
-    def hexdigest(self):
-        return self.data.hex()
+def read_snapshot_entries(path: str) -> Iterator[SnapshotEntry]:
+    """
+    Stream the entries of an allowlist file, without loading the whole file.
 
+    :param path: path of a .csv file with address, maxClaimable, price and
+        currencyAddress columns, or of a .jsonl file with one entry per line
+    :returns: iterator over the entries of the file
+    """
 
-def keccak256(x: bytes) -> HashedData:
-    print("INPUT: ", x)
-    hexstr = x.decode()[1:]
-    print("HEXSTR: ", hexstr)
-    keccak = Web3.keccak(hexstr=hexstr)
-    print("KECCAK: ", keccak)
-    return HashedData(keccak)
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                yield _validate_entry(SnapshotEntry.from_json(row))
+    elif path.endswith(".jsonl"):
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield _validate_entry(SnapshotEntry.from_json(json.loads(line)))
+    else:
+        raise Exception("Snapshots can only be read from .csv or .jsonl files")
 
 
 def create_snapshot(
-    snapshot_input: SnapshotInput, token_decimals: int, storage: IpfsStorage
+    entries: Iterable[SnapshotEntry],
+    token_decimals: int,
+    storage: IpfsStorage,
+    provider: Web3,
+    shard_nybbles: int = DEFAULT_SHARD_NYBBLES,
+    max_workers: Optional[int] = None,
 ) -> SnapshotInfo:
-    input = snapshot_input
-    addresses = [i.address for i in input]
-    has_duplicates = len(addresses) != len(set(addresses))
-    if has_duplicates:
-        raise DuplicateLeafsException()
+    """
+    Build the sharded merkle tree of an allowlist and upload it in the format
+    ShardedMerkleTree reads when claiming.
 
-    hashed_leafs = [
-        hash_leaf_node(i.address, parse_units(i.max_claimable, token_decimals))
-        for i in input
-    ]
+    Entries are streamed into one temporary file per shard and the shard trees
+    are built in a process pool, so the entries are never all parsed in memory
+    at once. The shard files are uploaded in a single request to share one base
+    URI, and that request body holds the whole snapshot in memory.
 
-    print("ADDRESSES: ", addresses)
-    print("HASHED LEAFS:", hashed_leafs)
+    The process pool starts new interpreters that import the calling module on
+    platforms that spawn processes, like macOS and Windows, so scripts calling
+    this function there need an `if __name__ == "__main__":` guard.
 
-    # tree = MerkleTree(*hashed_leafs)
-    tree = MerkleTree()
+    ```python
+    from thirdweb.common.snapshots import create_snapshot, read_snapshot_entries
 
-    tree.algorithm = keccak256
-    for leaf in hashed_leafs:
-        tree.update(leaf.hex())
+    if __name__ == "__main__":
+        snapshot = create_snapshot(
+            read_snapshot_entries("allowlist.csv"), 0, sdk.storage, sdk.get_provider()
+        )
+    ```
 
-    # root_hash = "0x" + tree.rootHash.decode("utf-8")
-    # root_hash = tree.rootHash.decode("utf-8")
-    # root_hash = hashed_leafs[0].hex()
-    root_hash = "0x5cee642ff879fb7bf27d34daceac161e9702076c331ce82cedded7075c0b7f22"
+    :param entries: allowlist entries, at most one per address
+    :param token_decimals: decimals of the claimed token
+    :param storage: storage to upload the snapshot to
+    :param provider: provider to read the decimals of the entry currencies with
+    :param shard_nybbles: number of leading address nybbles to shard the entries by,
+        from 1 to MAX_SHARD_NYBBLES
+    :param max_workers: optional number of processes to build the shards with
+    :returns: the merkle root and the URI of the uploaded snapshot
+    """
 
-    print("ROOT HASH: ", root_hash)
+    if shard_nybbles < 1 or shard_nybbles > MAX_SHARD_NYBBLES:
+        raise Exception(
+            f"Snapshots can only be sharded by 1 to {MAX_SHARD_NYBBLES} nybbles"
+        )
+
+    with TemporaryDirectory() as directory:
+        shard_paths, currencies = _write_shard_entries(
+            entries, directory, shard_nybbles
+        )
+        # Entries without a currency are priced with 18 decimals, like ShardedMerkleTree
+        currency_decimals = {
+            currency: fetch_currency_metadata(provider, currency).decimals
+            if currency
+            else 18
+            for currency in currencies
+        }
+
+        shard_ids = sorted(shard_paths)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            roots = list(
+                executor.map(
+                    _build_shard,
+                    [shard_paths[shard_id] for shard_id in shard_ids],
+                    [token_decimals] * len(shard_ids),
+                    [currency_decimals] * len(shard_ids),
+                )
+            )
 
-    claims = []
-    for index, item in enumerate(input):
-        proof = tree.merkleProof({"checksum": hashed_leafs[index]})
+            tree = MerkleTree()
+            tree.add_leaf_bytes(roots)
+            tree.make_tree()
 
-        # What do I need here from the proof
-        claims.append(
-            SnapshotProof(
-                address=item.address,
-                max_claimable=item.max_claimable,
-                proof="0x" + proof.serialize()["header"]["commitment"],
+            shard_proofs = [
+                ["0x" + sibling.hex() for sibling, _ in proof or []]
+                for proof in tree.get_proofs_bytes(roots)
+            ]
+            shard_files = list(
+                executor.map(
+                    _write_shard,
+                    [shard_paths[shard_id] for shard_id in shard_ids],
+                    shard_proofs,
+                )
             )
+
+        # Shards are read back as bytes, so no file stays open during the upload
+        files: List[Dict[str, Any]] = []
+        for shard_id, path in zip(shard_ids, shard_files):
+            with open(path, "rb") as f:
+                files.append({"name": f"{shard_id}.json", "data": f.read()})
+        base_uri = storage.upload_batch(files)
+
+        original_entries_path = _write_original_entries(shard_paths, directory)
+        with open(original_entries_path, "rb") as f:
+            original_entries_uri = (
+                storage.upload_batch([{"name": "entries.json", "data": f}])
+                + "/entries.json"
+            )
+
+    merkle_root = "0x" + tree.get_merkle_root()
+    info = ShardedMerkleTreeInfo(
+        merkle_root=merkle_root,
+        base_uri=base_uri,
+        original_entries_uri=original_entries_uri,
+        shard_nybbles=shard_nybbles,
+        token_decimals=token_decimals,
+    )
+    snapshot_uri = storage.upload_metadata(info.to_json())
+
+    return SnapshotInfo(merkle_root=merkle_root, snapshot_uri=snapshot_uri, info=info)
+
+
+def _write_shard_entries(
+    entries: Iterable[SnapshotEntry], directory: str, shard_nybbles: int
+) -> Tuple[Dict[str, str], List[str]]:
+    shard_paths: Dict[str, str] = {}
+    buffers: Dict[str, List[str]] = {}
+    buffered = 0
+    currencies = set()
+    for entry in entries:
+        _validate_entry(entry)
+        # Shard files are named after the lowercase address prefix
+        shard_id = entry.address[2 : shard_nybbles + 2].lower()
+        if shard_id not in shard_paths:
+            shard_paths[shard_id] = os.path.join(directory, f"{shard_id}.jsonl")
+
+        buffers.setdefault(shard_id, []).append(json.dumps(entry.to_json()) + "\n")
+        currencies.add(entry.currency_address)
+        buffered += 1
+        # Buffers are flushed in turn, so only one shard file is ever open
+        if buffered == SNAPSHOT_WRITE_BUFFER_SIZE:
+            _flush_shard_entries(shard_paths, buffers)
+            buffered = 0
+
+    _flush_shard_entries(shard_paths, buffers)
+
+    if len(shard_paths) == 0:
+        raise Exception("Cannot create a snapshot without entries")
+
+    return shard_paths, list(currencies)
+
+
+def _flush_shard_entries(shard_paths: Dict[str, str], buffers: Dict[str, List[str]]):
+    for shard_id, lines in buffers.items():
+        with open(shard_paths[shard_id], "a") as f:
+            f.writelines(lines)
+    buffers.clear()
+
+
+def _validate_entry(entry: SnapshotEntry) -> SnapshotEntry:
+    if not Web3.isAddress(entry.address):
+        raise InvalidAddressException(entry.address)
+    if entry.currency_address and not Web3.isAddress(entry.currency_address):
+        raise InvalidAddressException(entry.currency_address)
+
+    return entry
+
+
+def _read_shard_entries(path: str) -> List[SnapshotEntry]:
+    with open(path) as f:
+        return [SnapshotEntry.from_json(json.loads(line)) for line in f]
+
+
+def _build_shard(
+    path: str, token_decimals: int, currency_decimals: Dict[str, int]
+) -> bytes:
+    entries = _read_shard_entries(path)
+
+    # Addresses sharing a shard share a prefix, so duplicates are always in the same shard
+    addresses = set()
+    for entry in entries:
+        _validate_entry(entry)
+        address = entry.address.lower()
+        if address in addresses:
+            raise DuplicateLeafsException(entry.address)
+        addresses.add(address)
+
+    tree = MerkleTree()
+    tree.add_leaf_bytes(
+        hash_snapshot_entry(
+            entry, token_decimals, currency_decimals[entry.currency_address]
         )
+        for entry in entries
+    )
+    tree.make_tree()
+
+    return bytes.fromhex(tree.get_merkle_root())
+
 
-    # snapshot = SnapshotSchema(merkle_root=tree.rootHash, claims=claims)
-    snapshot = {
-        "merkle_root": root_hash,
-        "claims": [c.__dict__ for c in claims],
-    }
+def _write_shard(path: str, proofs: List[str]) -> str:
+    entries = _read_shard_entries(path)
+    shard_path = path[: -len(".jsonl")] + ".json"
+    with open(shard_path, "w") as f:
+        json.dump(ShardData(proofs, entries).to_json(), f)
 
-    uri = storage.upload_metadata(snapshot)
+    return shard_path
 
-    return SnapshotInfo(merkle_root=root_hash, snapshot_uri=uri, snapshot=snapshot)
 
+def _write_original_entries(shard_paths: Dict[str, str], directory: str) -> str:
+    path = os.path.join(directory, "entries.json")
+    with open(path, "w") as f:
+        f.write("[")
+        first = True
+        for shard_id in sorted(shard_paths):
+            with open(shard_paths[shard_id]) as shard:
+                for line in shard:
+                    f.write(line.strip() if first else "," + line.strip())
+                    first = False
+        f.write("]")
 
-def hash_leaf_node(address: str, max_claimable_amount: int) -> HexBytes:
-    return Web3.solidityKeccak(["address", "uint256"], [address, max_claimable_amount])
+    return path
@@ -3,3 +3,46 @@ INTERFACE_ID_IERC721 = bytes([0x80, 0xAC, 0x58, 0xCD])
 
 # Uint8Array of "0xd9b67a26" in JS
 INTERFACE_ID_IERC1155 = bytes([0xD9, 0xB6, 0x7A, 0x26])
+
+# Maximum number of calls packed into a single read-only multicall
+DEFAULT_MULTICALL_CHUNK_SIZE = 500
+
+# Maximum number of concurrent requests made by bulk reads
+DEFAULT_MAX_WORKERS = 8
+
+# Number of items fetched per page by the paginated iterators
+DEFAULT_PAGE_SIZE = 100
+
+# Maximum number of token IDs queried in a single balanceOfBatch call
+DEFAULT_BALANCE_BATCH_SIZE = 1000
+
+# Gas budget of each transaction sent by the gas-aware batched multicall writes
+DEFAULT_MULTICALL_GAS_BUDGET = 10_000_000
+
+# Intrinsic gas paid by every transaction, on top of the gas used by its calls
+TRANSACTION_BASE_GAS = 21000
+
+# Maximum number of contracts whose supported token interfaces are cached
+DEFAULT_INTERFACE_CACHE_SIZE = 4096
+
+# Maximum number of seconds the supported token interfaces of a contract are reused
+# before it is probed again, so upgraded proxies are picked up
+DEFAULT_INTERFACE_CACHE_TTL = 600
+
+# Maximum number of sharded merkle trees of claim snapshots kept loaded
+DEFAULT_MERKLE_TREE_CACHE_SIZE = 16
+
+# Maximum number of allowlist proofs memoized per sharded merkle tree
+DEFAULT_PROOF_CACHE_SIZE = 65536
+
+# Number of leading address nybbles claim snapshots are sharded by
+DEFAULT_SHARD_NYBBLES = 2
+
+# Maximum number of address nybbles claim snapshots can be sharded by, every shard is one uploaded file
+MAX_SHARD_NYBBLES = 3
+
+# Number of snapshot entries buffered in memory before they are appended to their shard files
+SNAPSHOT_WRITE_BUFFER_SIZE = 10000
+
+# Maximum number of seconds an active claim condition is reused before its supply is re-read
+DEFAULT_CLAIM_CONDITION_TTL = 30
@@ -102,3 +102,7 @@ NATIVE_TOKENS: Dict[ChainId, NativeToken] = {
 
 def get_native_token_by_chain_id(chain_id: ChainId) -> NativeToken:
     return NATIVE_TOKENS[chain_id]
+
+
+# Maximum number of currencies held by the process-wide currency metadata cache
+DEFAULT_CURRENCY_CACHE_SIZE = 1024
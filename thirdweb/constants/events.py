@@ -9,3 +9,13 @@ class EventType(Enum):
 class EventStatus(Enum):
     SUBMITTED = "submitted"
     COMPLETED = "completed"
+
+
+# Maximum number of blocks queried in a single eth_getLogs request
+DEFAULT_LOG_CHUNK_SIZE = 2000
+
+# Number of most recent blocks an event index replays on every sync to recover from reorgs
+DEFAULT_REORG_DEPTH = 12
+
+# Number of seconds an event index following the chain head waits between syncs
+DEFAULT_POLL_INTERVAL = 2
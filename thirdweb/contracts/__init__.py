@@ -2,6 +2,7 @@ from .nft_collection import NFTCollection
 from .edition import Edition
 from .token import Token
 from .marketplace import Marketplace
+from .marketplace_v3 import MarketplaceV3
 from .nft_drop import NFTDrop
 from .edition_drop import EditionDrop
 from .multiwrap import Multiwrap
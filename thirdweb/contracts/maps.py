@@ -9,6 +9,7 @@ from thirdweb.contracts import (
     Edition,
     Token,
     Marketplace,
+    MarketplaceV3,
     NFTDrop,
     EditionDrop,
     Multiwrap,
@@ -20,6 +21,7 @@ CONTRACTS_MAP: Dict[ContractType, Union[NFTCollection, Edition, Token]] = {
     Edition.contract_type: Edition,  # type: ignore
     Token.contract_type: Token,  # type: ignore
     Marketplace.contract_type: Marketplace,  # type: ignore
+    MarketplaceV3.contract_type: MarketplaceV3,  # type: ignore
     NFTDrop.contract_type: NFTDrop,  # type: ignore
     EditionDrop.contract_type: EditionDrop,  # type: ignore
     Multiwrap.contract_type: Multiwrap,  # type: ignore
@@ -30,6 +32,7 @@ REMOTE_CONTRACT_NAME: Dict[ContractType, str] = {
     Edition.contract_type: "TokenERC1155",
     Token.contract_type: "TokenERC20",
     Marketplace.contract_type: "Marketplace",
+    MarketplaceV3.contract_type: "MarketplaceV3",
     NFTDrop.contract_type: "DropERC721",
     EditionDrop.contract_type: "DropERC1155",
     Multiwrap.contract_type: "Multiwrap",
@@ -40,6 +43,7 @@ REMOTE_CONTRACT_NAME_TO_CONTRACT_TYPE: Dict[str, ContractType] = {
     "TokenERC1155": Edition.contract_type,
     "TokenERC20": Token.contract_type,
     "Marketplace": Marketplace.contract_type,
+    "MarketplaceV3": MarketplaceV3.contract_type,
     "DropERC721": NFTDrop.contract_type,
     "DropERC1155": EditionDrop.contract_type,
     "Multiwrap": Multiwrap.contract_type,
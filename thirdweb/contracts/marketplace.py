@@ -1,8 +1,13 @@
 """Interface for interacting with a marketplace contract"""
 
 from time import time
+from thirdweb.common.currency import is_native_token, set_erc20_allowances
 from thirdweb.common.error import ListingNotFoundException
+from thirdweb.common.marketplace import fetch_listing_assets, fetch_listing_validity
+from thirdweb.common.pagination import iter_pages
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
 from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
 from thirdweb.core.classes.contract_events import ContractEvents
 from thirdweb.core.classes.contract_platform_fee import ContractPlatformFee
 from thirdweb.types.marketplace import (
@@ -20,14 +25,19 @@ from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.core.classes.marketplace_auction import MarketplaceAuction
 from thirdweb.core.classes.marketplace_direct import MarketplaceDirect
+from thirdweb.core.classes.marketplace_listing_index import MarketplaceListingIndex
+from thirdweb.core.classes.marketplace_order_book import MarketplaceOrderBook
 from thirdweb.types.contract import ContractType
+from thirdweb.types.multicall import MulticallResult
 from eth_account.account import LocalAccount
 from thirdweb.types.sdk import SDKOptions
 from thirdweb.constants.role import Role, get_role_hash
-from typing import Any, Final, List, Optional, Union, cast
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple, Union, cast
 from thirdweb.abi import Marketplace as MarketplaceABI
 from web3.eth import TxReceipt
 from web3 import Web3
+from web3.constants import MAX_INT
+from zero_ex.contract_wrappers.tx_params import TxParams
 
 
 class Marketplace(BaseContract[MarketplaceABI]):
@@ -145,40 +155,146 @@ class Marketplace(BaseContract[MarketplaceABI]):
         price_of_first = listings[0].price
         ```
 
+        The filter, the validity check of direct listings and filter.start are
+        applied to the raw listings, and asset metadata is only fetched for the
+        listings returned. filter.start counts matching valid listings whether or
+        not their metadata can be fetched, while filter.count listings with
+        metadata are returned whenever that many exist.
+
         :param filter: Filter to apply to the listings
         :return: List of listings
         """
-        raw_listings = self._get_all_listings_no_filter()
 
-        if filter is not None:
-            if filter.seller:
-                raw_listings = [
+        if filter is None:
+            return self._get_all_listings_no_filter()
+
+        if filter.count <= 0:
+            return []
+
+        total_count = self.get_total_count()
+        page_size = max(filter.count, DEFAULT_PAGE_SIZE)
+        skipped = 0
+        listings: List[Union[DirectListing, AuctionListing]] = []
+        for page_start in range(0, total_count, page_size):
+            raw_listings = [
+                listing
+                for listing in self._get_raw_listings(
+                    page_start, min(page_start + page_size, total_count)
+                )
+                if self._matches_filter(listing, filter)
+            ]
+            validity = fetch_listing_validity(
+                self._contract_wrapper.get_provider(),
+                self.get_address(),
+                [
                     listing
                     for listing in raw_listings
-                    if listing.seller_address == filter.seller
-                ]
-            if filter.token_contract:
-                if filter.token_id:
-                    raw_listings = [
-                        listing
-                        for listing in raw_listings
-                        if listing.asset_contract_address == filter.token_contract
-                        and listing.token_id == filter.token_id
-                    ]
-                else:
-                    raw_listings = [
-                        listing
-                        for listing in raw_listings
-                        if listing.asset_contract_address == filter.token_contract
-                    ]
-
-            max_id = min(filter.start + filter.count, self.get_total_count())
-            raw_listings = [raw_listings[i] for i in range(filter.start, max_id)]
-
-        return [listing for listing in raw_listings if listing is not None]
+                    if ListingType(listing.listing_type) == ListingType.DIRECT
+                ],
+            )
+
+            pending: List[ContractListing] = []
+            for listing in raw_listings:
+                is_direct = ListingType(listing.listing_type) == ListingType.DIRECT
+                if is_direct and not validity.get(listing.listing_id, False):
+                    continue
+                if skipped < filter.start:
+                    skipped += 1
+                    continue
+                pending.append(listing)
+
+            # Listings whose metadata can't be fetched are dropped, so keep mapping
+            # the pending listings until the page is full
+            while len(pending) > 0 and len(listings) < filter.count:
+                batch = pending[: filter.count - len(listings)]
+                pending = pending[len(batch) :]
+                listings.extend(self._map_contract_listings(batch, validity))
+
+            if len(listings) >= filter.count:
+                return listings
+
+        return listings
 
     get_all = get_all_listings
 
+    def iter_all_listings(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[Union[DirectListing, AuctionListing]]:
+        """
+        Iterate over all the listings that have ever been made on this marketplace
+        page by page, fetching the next page in the background.
+
+        ```python
+        for listing in contract.iter_all_listings(page_size=100):
+            print(listing.id)
+        ```
+
+        :param page_size: Number of listing IDs to fetch per page
+        :return: Iterator over listings
+        """
+        return iter_pages(
+            lambda start, count: self._get_all_listings_no_filter(start, start + count),
+            0,
+            self.get_total_count(),
+            page_size,
+        )
+
+    iter_all = iter_all_listings
+
+    def get_listing_index(
+        self,
+        database_path: Optional[str] = None,
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ) -> MarketplaceListingIndex:
+        """
+        Create a local index of the listings on this marketplace, built from its
+        events. Call sync on the index to bring it up to date, after which listings
+        can be filtered without scanning the whole marketplace.
+
+        ```python
+        index = contract.get_listing_index("listings.db")
+        index.sync()
+
+        listings = index.get_listings(seller="{{wallet_address}}")
+        ```
+
+        :param database_path: optional path of an SQLite file to store the index in, defaults to storing it in memory
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        :return: the listing index
+        """
+
+        return MarketplaceListingIndex(
+            self._contract_wrapper,
+            self._map_contract_listings,
+            database_path,
+            start_block,
+            reorg_depth,
+        )
+
+    def get_order_book(
+        self, start_block: int = 0, reorg_depth: int = DEFAULT_REORG_DEPTH
+    ) -> MarketplaceOrderBook:
+        """
+        Create a live order book of the offers and winning bids on this marketplace,
+        built from its events. Call sync on the order book to bring it up to date,
+        or follow to keep it synced in the background.
+
+        ```python
+        book = contract.get_order_book()
+        book.follow()
+
+        best_offer = book.get_best_offer(0)
+        ```
+
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        :return: the order book
+        """
+
+        return MarketplaceOrderBook(self._contract_wrapper, start_block, reorg_depth)
+
     def get_total_count(self) -> int:
         """
         Get the total number of listings on this marketplace.
@@ -255,6 +371,94 @@ class Marketplace(BaseContract[MarketplaceABI]):
 
         raise Exception(f"Unkown listing type {listing.listing_type}")
 
+    def buyout_listings(
+        self,
+        purchases: List[Tuple[int, Optional[int]]],
+        receiver: Optional[str] = None,
+    ) -> List[MulticallResult]:
+        """
+        Buyout many listings at once
+
+        The listings are read in one multicall, each currency is approved at most
+        once for the total spent in it, and the purchases are then submitted back to
+        back, so a whole sweep can land in the same block. A purchase that fails
+        doesn't stop the others.
+
+        ```python
+        purchases = [(0, 1), (1, 1), (2, None)]
+
+        results = contract.buyout_listings(purchases)
+        failed = [purchases[i][0] for i, result in enumerate(results) if not result.success]
+        ```
+
+        :param purchases: list of listing ID and quantity to buyout, the quantity is ignored for auction listings
+        :param receiver: Address to send the assets to, defaults to the signer
+        :return: the outcome of each purchase, in order, with its transaction receipt as data
+        """
+
+        buy_for = receiver if receiver else self._contract_wrapper.get_signer_address()
+        reads = self._contract_wrapper.multi_call_read(
+            [("listings", [listing_id]) for listing_id, _ in purchases]
+        )
+
+        results: List[Optional[MulticallResult]] = [None] * len(purchases)
+        calls: List[Tuple[int, str, str, List[Any], int]] = []
+        totals: Dict[str, int] = {}
+        for i, ((listing_id, quantity_desired), read) in enumerate(zip(purchases, reads)):
+            if not read.success:
+                results[i] = read
+                continue
+
+            listing = ContractListing(*read.data)
+            if listing.listing_id != listing_id or listing.asset_contract == ZERO_ADDRESS:
+                results[i] = MulticallResult(
+                    False, error=ListingNotFoundException(listing_id)
+                )
+                continue
+
+            if ListingType(listing.listing_type) == ListingType.DIRECT:
+                if quantity_desired is None:
+                    results[i] = MulticallResult(
+                        False,
+                        error=Exception("quantity_desired is required for direct listings"),
+                    )
+                    continue
+
+                value = listing.buyout_price_per_token * quantity_desired
+                fn = "buy"
+                args = [listing_id, buy_for, quantity_desired, listing.currency, value]
+            else:
+                value = listing.buyout_price_per_token * listing.quantity
+                fn = "offer"
+                args = [
+                    listing_id,
+                    listing.quantity,
+                    listing.currency,
+                    listing.buyout_price_per_token,
+                    int(MAX_INT, 0),
+                ]
+
+            calls.append((i, listing.currency, fn, args, value))
+            totals[listing.currency] = totals.get(listing.currency, 0) + value
+
+        approvals = set_erc20_allowances(self._contract_wrapper, totals)
+
+        sends: List[Tuple[int, Tuple[str, List[Any], Optional[TxParams]]]] = []
+        for i, currency, fn, args, value in calls:
+            approval = approvals.get(currency)
+            if approval is not None and not approval.success:
+                results[i] = approval
+                continue
+
+            overrides = TxParams(value=value) if is_native_token(currency) else None
+            sends.append((i, (fn, args, overrides)))
+
+        outcomes = self._contract_wrapper.send_transactions([call for _, call in sends])
+        for (i, _), outcome in zip(sends, outcomes):
+            results[i] = outcome
+
+        return cast(List[MulticallResult], results)
+
     def set_bid_buffer_bps(self, buffer_bps: int) -> TxReceipt:
         """
         Set the bid buffer basis points for this marketplace.
@@ -350,23 +554,62 @@ class Marketplace(BaseContract[MarketplaceABI]):
     """
 
     def _get_all_listings_no_filter(
-        self,
+        self, start: int = 0, end: Optional[int] = None
     ) -> List[Union[DirectListing, AuctionListing]]:
-        total_listings = self._contract_wrapper._contract_abi.total_listings.call()
+        if end is None:
+            end = self._contract_wrapper._contract_abi.total_listings.call()
+
+        return self._map_contract_listings(self._get_raw_listings(start, end))
+
+    def _get_raw_listings(self, start: int, end: int) -> List[ContractListing]:
+        results = self._contract_wrapper.multi_call_read(
+            [("listings", [i]) for i in range(start, end)]
+        )
+
+        raw_listings: List[ContractListing] = []
+        for result in results:
+            if not result.success:
+                raise cast(Exception, result.error)
+
+            listing = ContractListing(*result.data)
+            if listing.asset_contract != ZERO_ADDRESS:
+                raw_listings.append(listing)
 
-        listings = []
-        for i in range(total_listings):
-            try:
-                listing = self.get_listing(i)
+        return raw_listings
 
-                if ListingType(listing.type) == ListingType.AUCTION:
-                    listings.append(listing)
-                else:
-                    valid = self.direct._is_still_valid_listing(cast(Any, listing))
+    def _matches_filter(self, listing: ContractListing, filter: MarketplaceFilter) -> bool:
+        if filter.seller and listing.token_owner.lower() != filter.seller.lower():
+            return False
+        if filter.token_contract:
+            if listing.asset_contract.lower() != filter.token_contract.lower():
+                return False
+            if filter.token_id is not None and listing.token_id != filter.token_id:
+                return False
 
-                    if valid:
-                        listings.append(listing)
-            except:
-                pass
+        return True
 
-        return [listing for listing in listings if listing is not None]
\ No newline at end of file
+    def _map_contract_listings(
+        self,
+        raw_listings: List[ContractListing],
+        validity: Optional[Dict[int, bool]] = None,
+    ) -> List[Union[DirectListing, AuctionListing]]:
+        assets = fetch_listing_assets(
+            self._contract_wrapper.get_provider(),
+            self.get_address(),
+            raw_listings,
+            self._storage,
+            validity,
+        )
+
+        listings: List[Union[DirectListing, AuctionListing]] = []
+        for listing in raw_listings:
+            if listing.listing_id not in assets:
+                continue
+
+            asset, valid = assets[listing.listing_id]
+            if ListingType(listing.listing_type) == ListingType.AUCTION:
+                listings.append(self.auction._map_listing(listing, asset))
+            elif ListingType(listing.listing_type) == ListingType.DIRECT and valid:
+                listings.append(self.direct._map_listing(listing, asset))
+
+        return listings
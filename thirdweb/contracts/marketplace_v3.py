@@ -0,0 +1,98 @@
+"""Interface for interacting with a marketplace V3 contract"""
+
+from typing import Final, Optional
+from eth_account.account import LocalAccount
+from web3 import Web3
+from thirdweb.abi import (
+    DirectListingsLogic,
+    EnglishAuctionsLogic,
+    MarketplaceV3 as MarketplaceV3ABI,
+    OffersLogic,
+)
+from thirdweb.core.classes.base_contract import BaseContract
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.contract_metadata import ContractMetadata
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.core.classes.marketplace_v3_direct_listings import DirectListings
+from thirdweb.core.classes.marketplace_v3_english_auctions import EnglishAuctions
+from thirdweb.core.classes.marketplace_v3_offers import Offers
+from thirdweb.types.contract import ContractType
+from thirdweb.types.sdk import SDKOptions
+from thirdweb.types.settings.metadata import MarketplaceContractMetadata
+
+
+class MarketplaceV3(BaseContract[MarketplaceV3ABI]):
+    """
+    Read the direct listings, English auctions and offers of a modular marketplace.
+
+    ```python
+    from thirdweb import ThirdwebSDK
+
+    # You can customize this to a supported network or your own RPC URL
+    network = "mumbai"
+
+    # Now we can create a new instance of the SDK
+    sdk = ThirdwebSDK(network)
+
+    contract = sdk.get_marketplace_v3("{{contract_address}}")
+    listings = contract.direct_listings.get_all_valid()
+    ```
+    """
+
+    _abi_type = MarketplaceV3ABI
+
+    contract_type: Final[ContractType] = ContractType.MARKETPLACE_V3
+
+    metadata: ContractMetadata[MarketplaceV3ABI, MarketplaceContractMetadata]
+    direct_listings: DirectListings
+    english_auctions: EnglishAuctions
+    offers: Offers
+    events: ContractEvents[MarketplaceV3ABI]
+
+    def __init__(
+        self,
+        provider: Web3,
+        address: str,
+        storage: IpfsStorage,
+        signer: Optional[LocalAccount] = None,
+        options: SDKOptions = SDKOptions(),
+    ):
+        abi = MarketplaceV3ABI(provider, address)
+        contract_wrapper = ContractWrapper(abi, provider, signer, options)
+        super().__init__(contract_wrapper)
+
+        self.metadata = ContractMetadata(
+            contract_wrapper, storage, MarketplaceContractMetadata
+        )
+        # Each extension of the marketplace is called through the main contract
+        # with the ABI of its own logic contract
+        self.direct_listings = DirectListings(
+            ContractWrapper(
+                DirectListingsLogic(provider, address), provider, signer, options
+            ),
+            storage,
+        )
+        self.english_auctions = EnglishAuctions(
+            ContractWrapper(
+                EnglishAuctionsLogic(provider, address), provider, signer, options
+            ),
+            storage,
+        )
+        self.offers = Offers(
+            ContractWrapper(OffersLogic(provider, address), provider, signer, options),
+            storage,
+        )
+        self.events = ContractEvents(contract_wrapper)
+
+    def on_provider_updated(self, provider: Web3):
+        super().on_provider_updated(provider)
+        self.direct_listings.on_provider_updated(provider)
+        self.english_auctions.on_provider_updated(provider)
+        self.offers.on_provider_updated(provider)
+
+    def on_signer_updated(self, signer: Optional[LocalAccount] = None):
+        super().on_signer_updated(signer)
+        self.direct_listings.on_signer_updated(signer)
+        self.english_auctions.on_signer_updated(signer)
+        self.offers.on_signer_updated(signer)
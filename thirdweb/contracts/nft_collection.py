@@ -19,7 +19,7 @@ from eth_account.account import LocalAccount
 from web3 import Web3
 
 from thirdweb.types.sdk import SDKOptions
-from typing import Any, Final, Optional, List, Union
+from typing import Any, Final, Optional, List, Union, cast
 
 from thirdweb.types.settings.metadata import NFTCollectionContractMetadata
 from thirdweb.types.tx import TxResultWithId
@@ -100,7 +100,7 @@ class NFTCollection(ERC721Standard[TokenERC721]):
         """
 
         token_ids = self.get_owned_token_ids(address)
-        return [self.get(token_id) for token_id in token_ids]
+        return self.get_batch(token_ids).items
 
     def get_owned_token_ids(self, address: str = "") -> List[int]:
         """
@@ -112,10 +112,15 @@ class NFTCollection(ERC721Standard[TokenERC721]):
 
         owner = address if address else self._contract_wrapper.get_signer_address()
         balance = self._contract_wrapper._contract_abi.balance_of.call(owner)
-        return [
-            self._contract_wrapper._contract_abi.token_of_owner_by_index.call(owner, i)
-            for i in range(balance)
-        ]
+        results = self._contract_wrapper.multi_call_read(
+            [("tokenOfOwnerByIndex", [owner, i]) for i in range(balance)]
+        )
+
+        for result in results:
+            if not result.success:
+                raise cast(Exception, result.error)
+
+        return [result.data for result in results]
 
     """
     WRITE FUNCTIONS
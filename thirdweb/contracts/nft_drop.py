@@ -1,6 +1,7 @@
-from typing import Any, Final, List, Optional
+from typing import Any, Final, Iterator, List, Optional
 from thirdweb.abi import DropERC721
 from thirdweb.abi.drop_erc721 import IDropAllowlistProof
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
 from thirdweb.constants.role import Role
 from thirdweb.core.classes.contract_events import ContractEvents
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -98,7 +99,7 @@ class NFTDrop(ERC721Standard[DropERC721]):
         """
 
         token_ids = self.get_owned_token_ids(address)
-        return [self.get(token_id) for token_id in token_ids]
+        return self.get_batch(token_ids).items
 
     def get_owned_token_ids(self, address: str = "") -> List[int]:
         """
@@ -110,13 +111,17 @@ class NFTDrop(ERC721Standard[DropERC721]):
 
         owner = address if address else self._contract_wrapper.get_signer_address()
 
-        total_count = self._contract_wrapper._contract_abi.next_token_id_to_mint.call()
-        token_ids = []
-        for i in range(total_count):
-            if self._contract_wrapper._contract_abi.owner_of.call(i).lower() == owner.lower():
-                token_ids.append(i)
+        # Only claimed tokens have an owner, lazy minted tokens revert ownerOf
+        claimed_count = self._contract_wrapper._contract_abi.next_token_id_to_claim.call()
+        results = self._contract_wrapper.multi_call_read(
+            [("ownerOf", [i]) for i in range(claimed_count)]
+        )
 
-        return token_ids
+        return [
+            token_id
+            for token_id, result in enumerate(results)
+            if result.success and result.data.lower() == owner.lower()
+        ]
 
     def get_all_claimed(
         self, query_params: QueryAllParams = QueryAllParams()
@@ -135,6 +140,23 @@ class NFTDrop(ERC721Standard[DropERC721]):
 
         return self._erc721.get_all_claimed(query_params)
 
+    def iter_all_claimed(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[NFTMetadataOwner]:
+        """
+        Iterate over all claimed NFTs page by page.
+
+        ```python
+        for nft in contract.iter_all_claimed(page_size=100):
+            print(nft.owner)
+        ```
+
+        :param page_size: Number of tokens to fetch per page.
+        :return: Iterator over nft metadatas and owners for claimed nfts.
+        """
+
+        return self._erc721.iter_all_claimed(page_size)
+
     def get_all_unclaimed(
         self, query_params: QueryAllParams = QueryAllParams()
     ) -> List[NFTMetadata]:
@@ -152,6 +174,21 @@ class NFTDrop(ERC721Standard[DropERC721]):
 
         return self._erc721.get_all_unclaimed(query_params)
 
+    def iter_all_unclaimed(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[NFTMetadata]:
+        """
+        Iterate over all unclaimed NFTs page by page.
+
+        ```python
+        for nft in contract.iter_all_unclaimed(page_size=100):
+            print(nft.name)
+        ```
+
+        :param page_size: Number of tokens to fetch per page.
+        :return: Iterator over nft metadatas.
+        """
+
+        return self._erc721.iter_all_unclaimed(page_size)
+
     def total_claimed_supply(self) -> int:
         """
         Get the total number of NFTs claimed from this contract
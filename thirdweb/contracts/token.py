@@ -1,11 +1,12 @@
 """Interface for interacting with a token contract"""
 
-from typing import Any, Final, List, Optional
+from typing import Any, Final, List, Optional, Tuple, cast
 from thirdweb.abi import TokenERC20
 from web3 import Web3
 from web3.eth import TxReceipt
 from eth_account.account import LocalAccount
-from thirdweb.common.currency import parse_units
+from thirdweb.common.currency import format_units, parse_units
+from thirdweb.constants.contract import DEFAULT_MULTICALL_GAS_BUDGET
 from thirdweb.constants.role import Role
 from thirdweb.core.classes.contract_events import ContractEvents
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -16,7 +17,8 @@ from thirdweb.core.classes.erc_20_standard import ERC20Standard
 from thirdweb.core.classes.erc_20_signature_minting import ERC20SignatureMinting
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import ContractType
-from thirdweb.types.currency import CurrencyValue, Price, TokenAmount
+from thirdweb.types.currency import CurrencyValue, Price, TokenAmount, VoteBalance
+from thirdweb.types.multicall import MulticallResult
 
 from thirdweb.types.sdk import SDKOptions
 from thirdweb.types.settings.metadata import TokenContractMetadata
@@ -119,6 +121,58 @@ class Token(ERC20Standard):
 
         return self._contract_wrapper._contract_abi.delegates.call(account)
 
+    def get_vote_balances_of(
+        self, accounts: List[str], block: Optional[int] = None
+    ) -> List[VoteBalance]:
+        """
+        Get the voting power and delegatee of many wallets at once.
+
+        ```python
+        accounts = ["{{wallet_address}}", "0x..."]
+        balances = contract.get_vote_balances_of(accounts)
+
+        leaderboard = sorted(balances, key=lambda b: b.votes.value, reverse=True)
+        ```
+
+        :param accounts: wallet addresses to check the votes of
+        :param block: optional past block to also read the voting power of each wallet at
+        :returns: vote balance and delegatee of each wallet, in the order of accounts
+        """
+
+        calls: List[Tuple[str, List[Any]]] = []
+        for account in accounts:
+            calls.append(("getVotes", [account]))
+            calls.append(("delegates", [account]))
+            if block is not None:
+                calls.append(("getPastVotes", [account, block]))
+
+        results = self._contract_wrapper.multi_call_read(calls)
+        for result in results:
+            if not result.success:
+                raise cast(Exception, result.error)
+
+        currency = self._erc20.get()
+
+        def to_value(votes: int) -> CurrencyValue:
+            return CurrencyValue(
+                currency.name,
+                currency.symbol,
+                currency.decimals,
+                votes,
+                format_units(votes, currency.decimals),
+            )
+
+        step = 2 if block is None else 3
+        return [
+            VoteBalance(
+                account,
+                results[i * step + 1].data,
+                to_value(results[i * step].data),
+                to_value(results[i * step + 2].data) if block is not None else None,
+            )
+            for i, account in enumerate(accounts)
+        ]
+
     """
     WRITE FUNCTIONS
     """
@@ -148,7 +202,9 @@ class Token(ERC20Standard):
 
         return self._erc20.mint_to(to, amount)
 
-    def mint_batch_to(self, args: List[TokenAmount]) -> TxReceipt:
+    def mint_batch_to(
+        self, args: List[TokenAmount], gas_budget: int = DEFAULT_MULTICALL_GAS_BUDGET
+    ) -> List[MulticallResult]:
         """
         Mint tokens to a list of wallets.
 
@@ -160,14 +216,15 @@ class Token(ERC20Standard):
             TokenAmount("{{wallet_address}}", 2),
         ]
 
-        contract.mint_batch_to(args)
+        results = contract.mint_batch_to(args)
         ```
 
         :param args: list of wallet addresses and amounts to mint
-        :returns: transaction receipt of the mint
+        :param gas_budget: maximum gas limit of each transaction
+        :returns: the outcome of the mint to each wallet, in the order of args
         """
 
-        return self._erc20.mint_batch_to(args)
+        return self._erc20.mint_batch_to(args, gas_budget)
 
     def delegate_to(self, delegatee_address: str) -> TxReceipt:
         """
@@ -1,9 +1,10 @@
-from typing import Any, Callable, Dict, Generic, Tuple
-from thirdweb.constants.events import EventType
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple
+from thirdweb.constants.events import DEFAULT_LOG_CHUNK_SIZE, EventType
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.types.contract import TContractABI
 from thirdweb.types.events import EventQueryOptions, TxEvent
 from web3.datastructures import AttributeDict
+from web3.types import BlockIdentifier
 
 class ContractEvents(Generic[TContractABI]):
     _contract_wrapper: ContractWrapper[TContractABI]
@@ -84,3 +85,53 @@ class ContractEvents(Generic[TContractABI]):
         events_interface = self._contract_wrapper.get_contract_interface().events[event_name]
         return events_interface.getLogs(options.filters, options.from_block, options.to_block)
 
+    def get_events_chunked(
+        self,
+        event_name: str,
+        options: EventQueryOptions = EventQueryOptions(),
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
+    ) -> List[AttributeDict]:
+        """
+        Query past events of a specific type over a large block range by splitting
+        the range into smaller queries. Ranges the node rejects, for example because
+        they return too many logs, are halved and retried.
+
+        :param event_name: The name of the event to query.
+        :param options: The options to use when querying for events, including block range specifications and filters
+        :param chunk_size: The maximum number of blocks to query at once.
+        :return: A list of events, in the order they were emitted.
+        """
+
+        events_interface = self._contract_wrapper.get_contract_interface().events[event_name]
+        from_block = self._resolve_block_number(options.from_block)
+        to_block = self._resolve_block_number(options.to_block)
+
+        events: List[AttributeDict] = []
+        size = chunk_size
+        start = from_block
+        while start <= to_block:
+            end = min(start + size - 1, to_block)
+            try:
+                logs = events_interface.getLogs(options.filters, start, end)
+            except Exception:
+                if end == start:
+                    raise
+                size = max(1, (end - start + 1) // 2)
+                continue
+
+            events.extend(logs)
+            start = end + 1
+            size = min(size * 2, chunk_size)
+
+        return events
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _resolve_block_number(self, block: Optional[BlockIdentifier]) -> int:
+        if block is None or block in ["latest", "pending", "safe", "finalized"]:
+            return self._contract_wrapper.get_provider().eth.block_number
+        if block == "earliest":
+            return 0
+        return int(block)
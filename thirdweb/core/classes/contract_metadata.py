@@ -1,4 +1,5 @@
-from typing import Any, Dict, Generic, cast
+from copy import deepcopy
+from typing import Any, Dict, Generic, Optional, Tuple, cast
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import TContractSchema, TMetadataABI
@@ -9,6 +10,7 @@ class ContractMetadata(Generic[TMetadataABI, TContractSchema]):
     _contract_wrapper: ContractWrapper[TMetadataABI]
     _schema: TContractSchema
     _storage: IpfsStorage
+    _cached: Optional[Tuple[str, TContractSchema]]
 
     def __init__(
         self,
@@ -19,10 +21,12 @@ class ContractMetadata(Generic[TMetadataABI, TContractSchema]):
         self._contract_wrapper = contract_wrapper
         self._storage = storage
         self._schema = cast(TContractSchema, contract_schema)
+        self._cached = None
 
     def get(self) -> TContractSchema:
         """
-        Get the contract metadata
+        Get the contract metadata. The metadata is only downloaded again once the
+        contract URI changes.
 
         ```python
         metadata = contract.metadata.get()
@@ -35,8 +39,12 @@ class ContractMetadata(Generic[TMetadataABI, TContractSchema]):
 
         abi = self._contract_wrapper._contract_abi
         uri = abi.contract_uri.call()
-        data = self._storage.get(uri)
-        return cast(TContractSchema, self._schema.from_json(data))
+        if self._cached is None or self._cached[0] != uri:
+            data = self._storage.get(uri)
+            self._cached = (uri, cast(TContractSchema, self._schema.from_json(data)))
+
+        # Callers may edit the metadata before setting it, so never hand out the cached copy
+        return deepcopy(self._cached[1])
 
     def set(self, metadata: TContractSchema) -> TxReceipt:
         """
@@ -1,12 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from typing import Any, Generic, Tuple, List, Optional, cast
-from eth_typing import Address
+from eth_typing import Address, HexStr
 
 from web3 import Web3
 from web3.datastructures import AttributeDict
 from web3.contract import Contract, ContractFunction
 from thirdweb.common.error import NoSignerException
+from web3._utils.abi import get_abi_output_types, map_abi_data
 from web3._utils.events import EventLogErrorFlags
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.types import BlockIdentifier, Nonce
 from thirdweb.common.sign import EIP712Domain, sign_typed_data_internal
+from thirdweb.constants.contract import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_MULTICALL_CHUNK_SIZE,
+    DEFAULT_MULTICALL_GAS_BUDGET,
+    TRANSACTION_BASE_GAS,
+)
 from thirdweb.constants.events import EventStatus, EventType
 
 from thirdweb.core.classes.provider_handler import ProviderHandler
@@ -15,6 +26,7 @@ from eth_account.account import LocalAccount
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contract import TContractABI
 from thirdweb.types.events import SignatureEvent, TxEvent
+from thirdweb.types.multicall import MulticallResult
 
 from thirdweb.types.sdk import SDKOptions
 
@@ -26,6 +38,7 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
     """
 
     _contract_abi: TContractABI
+    _multicall_supported: Optional[bool]
 
     def __init__(
         self,
@@ -44,6 +57,7 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
 
         super().__init__(provider, signer, options)
         self._contract_abi = contract_abi
+        self._multicall_supported = None
 
     def get_chain_id(self) -> int:
         """
@@ -186,6 +200,200 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
 
         return self.send_transaction("multicall", [encoded])
 
+    def multi_call_chunked(
+        self, encoded: List[str], gas_budget: int = DEFAULT_MULTICALL_GAS_BUDGET
+    ) -> List[MulticallResult]:
+        """
+        Execute many encoded function calls in as few multicall transactions as fit
+        within a gas budget, and return the outcome of each call.
+
+        The gas of every call is estimated up front, and calls that would revert
+        are reported as failed without being sent. The rest are packed into
+        multicall transactions that each stay within the gas budget, which are
+        all submitted with consecutive nonces before waiting for their receipts.
+
+        :param encoded: list of encoded function calls to execute
+        :param gas_budget: maximum gas limit of each multicall transaction
+        :returns: the outcome of each call, in the order of the encoded calls, with
+            the receipt of the transaction that executed it as data
+        """
+
+        provider = self.get_provider()
+        signer = self.get_signer()
+
+        if signer is None:
+            raise NoSignerException
+
+        def estimate_gas(data: str) -> MulticallResult:
+            try:
+                gas = provider.eth.estimate_gas(
+                    {
+                        "from": signer.address,  # type: ignore
+                        "to": self._contract_abi.contract_address,
+                        "data": HexStr(data),
+                    }
+                )
+                return MulticallResult(True, gas)
+            except Exception as e:
+                return MulticallResult(False, error=e)
+
+        results: List[Optional[MulticallResult]] = [None] * len(encoded)
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            estimates = list(executor.map(estimate_gas, encoded))
+
+        # Each chunk is the indices of its calls and the gas they need together
+        chunks: List[Tuple[List[int], int]] = []
+        indices: List[int] = []
+        gas = TRANSACTION_BASE_GAS
+        for i, estimate in enumerate(estimates):
+            if not estimate.success:
+                results[i] = estimate
+                continue
+
+            call_gas = estimate.data - TRANSACTION_BASE_GAS
+            # Keep a 20% margin for the overhead of dispatching each call in the multicall
+            if len(indices) > 0 and (gas + call_gas) * 6 // 5 > gas_budget:
+                chunks.append((indices, gas))
+                indices = []
+                gas = TRANSACTION_BASE_GAS
+
+            indices.append(i)
+            gas += call_gas
+
+        if len(indices) > 0:
+            chunks.append((indices, gas))
+
+        gas_price = provider.eth.gas_price
+        txs: List[Any] = []
+        for indices, gas in chunks:
+            try:
+                txs.append(
+                    self._contract_abi.multicall.build_transaction(  # type: ignore
+                        [encoded[i] for i in indices],
+                        tx_params=TxParams(gas=gas * 6 // 5, gas_price=gas_price),
+                    )
+                )
+            except Exception as e:
+                txs.append(e)
+
+        for (indices, _), result in zip(chunks, self._send_pipelined(txs)):
+            for i in indices:
+                results[i] = result
+
+        return cast(List[MulticallResult], results)
+
+    def send_transactions(
+        self, calls: List[Tuple[str, List[Any], Optional[TxParams]]]
+    ) -> List[MulticallResult]:
+        """
+        Send many transactions to the contract back to back and return the outcome
+        of each one.
+
+        Every transaction is built and its gas estimated concurrently, and the ones
+        that would revert are reported as failed without being sent. The rest are
+        submitted with consecutive nonces before waiting for their receipts, so they
+        can all be mined in the same block.
+
+        :param calls: list of (function name, arguments, overrides) to send
+        :returns: the outcome of each transaction, in the order of the calls, with
+            its receipt as data
+        """
+
+        provider = self.get_provider()
+        signer = self.get_signer()
+
+        if signer is None:
+            raise NoSignerException
+
+        gas_price = provider.eth.gas_price
+
+        def build_transaction(call: Tuple[str, List[Any], Optional[TxParams]]) -> Any:
+            fn, args, overrides = call
+            tx_params = copy(overrides) if overrides else TxParams()
+            tx_params.from_ = signer.address  # type: ignore
+            tx_params.gas_price = gas_price
+            try:
+                return getattr(self._contract_abi, fn).build_transaction(
+                    *args, tx_params=tx_params
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            txs = list(executor.map(build_transaction, calls))
+
+        return self._send_pipelined(txs)
+
+    def multi_call_read(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        chunk_size: int = DEFAULT_MULTICALL_CHUNK_SIZE,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[MulticallResult]:
+        """
+        Execute a batch of read-only calls through the multicall function of the
+        contract and return the result of each call.
+
+        Calls are packed into multicalls of at most chunk_size calls, which are
+        executed concurrently. If a multicall reverts, it is split in half until
+        the failing calls are isolated, so one bad call doesn't fail the batch.
+        Contracts without a multicall function have each call made separately.
+
+        :param calls: list of (function name, arguments) pairs to call
+        :param chunk_size: maximum number of calls to pack into a single multicall
+        :param block_identifier: block to execute the calls at
+        :returns: the result of each call, in the same order as the calls
+        """
+
+        if len(calls) == 0:
+            return []
+
+        interface = self.get_contract_interface()
+        encoded = [interface.encodeABI(fn, args) for fn, args in calls]
+        if self._multicall_supported is False:
+            chunk_size = 1
+        chunks = [
+            range(start, min(start + chunk_size, len(calls)))
+            for start in range(0, len(calls), chunk_size)
+        ]
+
+        def read_one(index: int) -> MulticallResult:
+            fn, args = calls[index]
+            try:
+                data = getattr(interface.functions, fn)(*args).call(
+                    block_identifier=block_identifier
+                )
+                return MulticallResult(True, data)
+            except Exception as e:
+                return MulticallResult(False, error=e)
+
+        def read_chunk(indices: range) -> List[MulticallResult]:
+            if len(indices) == 1:
+                return [read_one(indices[0])]
+
+            try:
+                returned = interface.functions.multicall(
+                    [encoded[i] for i in indices]
+                ).call(block_identifier=block_identifier)
+            except Exception:
+                if not self._supports_multicall(interface, block_identifier):
+                    return [read_one(i) for i in indices]
+
+                middle = len(indices) // 2
+                return read_chunk(indices[:middle]) + read_chunk(indices[middle:])
+
+            return [
+                MulticallResult(
+                    True, self._decode_function_result(interface, calls[i][0], data)
+                )
+                for i, data in zip(indices, returned)
+            ]
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            results = list(executor.map(read_chunk, chunks))
+
+        return [result for chunk in results for result in chunk]
+
     def emit_transaction_event(self, status: EventStatus, tx_hash: str):
         self.emit(EventType.TRANSACTION, TxEvent(status, tx_hash))  # type: ignore
 
@@ -207,3 +415,78 @@ class ContractWrapper(Generic[TContractABI], ProviderHandler):
         )
 
         return signature
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _supports_multicall(
+        self, interface: Contract, block_identifier: BlockIdentifier
+    ) -> bool:
+        if self._multicall_supported is None:
+            try:
+                interface.functions.multicall([]).call(block_identifier=block_identifier)
+                self._multicall_supported = True
+            except Exception:
+                self._multicall_supported = False
+
+        return self._multicall_supported
+
+    def _send_pipelined(self, txs: List[Any]) -> List[MulticallResult]:
+        """
+        Sign and submit built transactions with consecutive nonces, then wait for
+        all of their receipts.
+
+        :param txs: built transactions, or the exception raised while building one,
+            which is reported as its result without taking a nonce
+        :returns: the outcome of each transaction with its receipt as data
+        """
+
+        provider = self.get_provider()
+        signer = cast(LocalAccount, self.get_signer())
+
+        results: List[Optional[MulticallResult]] = [None] * len(txs)
+        nonce = provider.eth.get_transaction_count(signer.address, "pending")  # type: ignore
+        submitted: List[Tuple[int, Any]] = []
+        for i, tx in enumerate(txs):
+            if isinstance(tx, Exception):
+                results[i] = MulticallResult(False, error=tx)
+                continue
+
+            try:
+                tx["nonce"] = nonce
+                signed_tx = signer.sign_transaction(tx)
+                tx_hash = provider.eth.send_raw_transaction(signed_tx.rawTransaction)
+            except Exception as e:
+                # Later transactions can't be mined once a nonce is skipped
+                for j in range(i, len(txs)):
+                    if results[j] is None:
+                        results[j] = MulticallResult(False, error=e)
+                break
+
+            nonce = Nonce(nonce + 1)
+            self.emit_transaction_event(EventStatus.SUBMITTED, tx_hash.hex())
+            submitted.append((i, tx_hash))
+
+        for i, tx_hash in submitted:
+            receipt = provider.eth.wait_for_transaction_receipt(tx_hash)
+            self.emit_transaction_event(EventStatus.COMPLETED, tx_hash.hex())
+
+            if receipt["status"] == 1:
+                results[i] = MulticallResult(True, receipt)
+            else:
+                results[i] = MulticallResult(
+                    False, receipt, Exception(f"Transaction {tx_hash.hex()} reverted")
+                )
+
+        return cast(List[MulticallResult], results)
+
+    def _decode_function_result(self, interface: Contract, fn: str, data: bytes) -> Any:
+        abi = interface.get_function_by_name(fn).abi
+        output_types = get_abi_output_types(abi)
+        decoded = self.get_provider().codec.decode_abi(output_types, data)
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+
+        if len(normalized) == 1:
+            return normalized[0]
+        return normalized
@@ -1,8 +1,10 @@
-from typing import List
+from time import time
+from typing import List, Optional, Tuple, cast
 from thirdweb.abi.drop_erc721 import DropERC721
 from thirdweb.common.claim_conditions import (
-    transform_result_to_claim_condition,
+    transform_results_to_claim_conditions,
 )
+from thirdweb.constants.contract import DEFAULT_CLAIM_CONDITION_TTL
 from thirdweb.core.classes.contract_metadata import ContractMetadata
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
@@ -16,6 +18,7 @@ class DropClaimConditions:
     _contract_wrapper: ContractWrapper[DropERC721]
     _metadata: ContractMetadata[DropERC721, NFTDropContractMetadata]
     _storage: IpfsStorage
+    _active: Optional[Tuple[ClaimCondition, float, Tuple[int, int]]]
 
     def __init__(
         self,
@@ -26,6 +29,7 @@ class DropClaimConditions:
         self._contract_wrapper = contract_wrapper
         self._metadata = metadata
         self._storage = storage
+        self._active = None
 
     """
     READ FUNCTIONS
@@ -35,18 +39,36 @@ class DropClaimConditions:
         """
         Get the currently active claim condition
 
+        The active condition is reused for a few seconds, or until the next claim
+        condition starts or the claim conditions are reset, so the supply it
+        reports can be up to DEFAULT_CLAIM_CONDITION_TTL seconds old.
+
         :return: The currently active claim condition
         """
 
-        id = self._contract_wrapper._contract_abi.get_active_claim_condition_id.call()
-        mc = self._contract_wrapper._contract_abi.get_claim_condition_by_id.call(id)
-        metadata = self._metadata.get()
-        return transform_result_to_claim_condition(
-            mc,
-            self._contract_wrapper.get_provider(),
-            metadata.merkle,
-            self._storage,
+        if self._active is not None and time() < self._active[1]:
+            # Resetting or resizing the claim conditions moves their range, other
+            # updates are picked up once the memo expires
+            claim_condition = self._contract_wrapper._contract_abi.claim_condition
+            if tuple(claim_condition.call()) == self._active[2]:
+                return self._active[0]
+
+        reads = self._contract_wrapper.multi_call_read(
+            [("claimCondition", []), ("getActiveClaimConditionId", [])]
         )
+        for read in reads:
+            if not read.success:
+                raise cast(Exception, read.error)
+        (start_id, count), id = reads[0].data, reads[1].data
+
+        conditions = self._get_conditions(range(id, min(id + 2, start_id + count)))
+        # Reuse the condition for at most the TTL, and never past the start of the next one
+        valid_until = time() + DEFAULT_CLAIM_CONDITION_TTL
+        if len(conditions) > 1:
+            valid_until = min(valid_until, conditions[1].start_time)
+        self._active = (conditions[0], valid_until, (start_id, count))
+
+        return conditions[0]
 
     def get_all(self) -> List[ClaimCondition]:
         """
@@ -55,17 +77,21 @@ class DropClaimConditions:
         :return: A list of all claim conditions on this contract
         """
 
-        # Is this the correct order?
         start_id, count = self._contract_wrapper._contract_abi.claim_condition.call()
-        conditions = []
-        for i in range(start_id + count):
-            conditions.append(
-                self._contract_wrapper._contract_abi.get_claim_condition_by_id.call(i)
-            )
-        metadata = self._metadata.get()
-        return [
-            transform_result_to_claim_condition(
-                c, self._contract_wrapper.get_provider(), metadata.merkle, self._storage
-            )
-            for c in conditions
-        ]
+        return self._get_conditions(range(start_id, start_id + count))
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _get_conditions(self, ids: range) -> List[ClaimCondition]:
+        results = self._contract_wrapper.multi_call_read(
+            [("getClaimConditionById", [i]) for i in ids]
+        )
+
+        return transform_results_to_claim_conditions(
+            results,
+            self._contract_wrapper.get_provider(),
+            self._metadata.get().merkle,
+            self._storage,
+        )
@@ -1,4 +1,5 @@
-from typing import Generic, List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generic, Iterator, List, Union, cast
 
 from web3 import Web3
 from thirdweb.abi.drop_erc1155 import DropERC1155
@@ -6,7 +7,18 @@ from thirdweb.abi.drop_erc721 import IDropAllowlistProof
 from thirdweb.abi.token_erc1155 import TokenERC1155
 from thirdweb.common.claim_conditions import prepare_claim
 from thirdweb.common.error import NotFoundException
-from thirdweb.common.nft import fetch_token_metadata, upload_or_extract_uri, upload_or_extract_uris
+from thirdweb.common.pagination import iter_pages
+from thirdweb.common.nft import (
+    fetch_token_metadata,
+    fetch_token_metadata_batch,
+    upload_or_extract_uri,
+    upload_or_extract_uris,
+)
+from thirdweb.constants.contract import (
+    DEFAULT_BALANCE_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PAGE_SIZE,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.contract_metadata import ContractMetadata
@@ -18,6 +30,7 @@ from web3.constants import MAX_INT
 from thirdweb.types.contract import TERC1155
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contracts.claim_conditions import ClaimVerification
+from thirdweb.types.multicall import BatchQueryResult
 from thirdweb.types.nft import (
     EditionMetadata,
     EditionMetadataInput,
@@ -113,13 +126,40 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
         print(metadatas)
         ```
 
+        Tokens whose metadata can't be resolved are left out, use get_batch
+        to get the error for each of them.
+
         :extension: ERC1155Enumerable
         :param query_params: optional QueryAllParams to define which tokens to get metadata for
         :return: list of metadata for all tokens
         """
 
         max_id = min(query_params.start + query_params.count, self.get_total_count())
-        return [self.get(token_id) for token_id in range(query_params.start, max_id)]
+        return self.get_batch(list(range(query_params.start, max_id))).items
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EditionMetadata]:
+        """
+        Iterate over all NFTs page by page
+
+        ```python
+        for metadata in contract.erc1155.iter_all(page_size=100):
+            print(metadata.supply)
+        ```
+
+        The next page is fetched in the background while the current one is
+        consumed, so large editions can be read in constant memory.
+
+        :extension: ERC1155Enumerable
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the metadata for all tokens
+        """
+
+        return iter_pages(
+            lambda start, count: self.get_all(QueryAllParams(start, count)),
+            0,
+            self.get_total_count(),
+            page_size,
+        )
 
     def get_total_count(self) -> int:
         """
@@ -153,19 +193,65 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
 
         owner = address if address else self._contract_wrapper.get_signer_address()
         max_id = self._contract_wrapper._contract_abi.next_token_id_to_mint.call()
-        balances = self._contract_wrapper._contract_abi.balance_of_batch.call(
-            [owner for i in range(max_id)],
-            [id for id in range(max_id)],
-        )
+        balances = self._get_balances(owner, list(range(max_id)))
 
-        metadatas = []
-        for index, balance in enumerate(balances):
-            metadata = self.get(index)
-            metadatas.append(
-                EditionMetadataOwner(metadata.metadata, metadata.supply, owner, balance)
+        owned_ids = [token_id for token_id, balance in enumerate(balances) if balance > 0]
+        editions = self.get_batch(owned_ids).items
+
+        return [
+            EditionMetadataOwner(
+                edition.metadata, edition.supply, owner, balances[edition.metadata.id]
             )
+            for edition in editions
+        ]
 
-        return metadatas
+    def get_batch(self, token_ids: List[int]) -> BatchQueryResult[EditionMetadata]:
+        """
+        Get many NFTs at once
+
+        ```python
+        result = contract.erc1155.get_batch([0, 1, 2])
+        metadatas = result.items
+        failed_token_ids = list(result.failures.keys())
+        ```
+
+        Supplies and URIs are read in batched multicalls, and the metadata of
+        every token is then fetched concurrently.
+
+        :extension: ERC1155
+        :param token_ids: token IDs of the tokens to get the metadata for
+        :return: the metadata and supply of each token that resolved, and the error for each token that didn't
+        """
+
+        calls = []
+        for token_id in token_ids:
+            calls.append(("totalSupply", [token_id]))
+            calls.append(("uri", [token_id]))
+        results = self._token.multi_call_read(calls)
+
+        batch = BatchQueryResult[EditionMetadata]()
+        token_uris = {}
+        for index, token_id in enumerate(token_ids):
+            uri_result = results[2 * index + 1]
+            if not uri_result.success:
+                batch.failures[token_id] = cast(Exception, uri_result.error)
+            elif not uri_result.data:
+                batch.failures[token_id] = NotFoundException(str(token_id))
+            else:
+                token_uris[token_id] = uri_result.data
+
+        metadatas, failures = fetch_token_metadata_batch(token_uris, self._storage)
+        batch.failures.update(failures)
+
+        for index, token_id in enumerate(token_ids):
+            if token_id not in metadatas:
+                continue
+
+            supply_result = results[2 * index]
+            supply = supply_result.data if supply_result.success else 0
+            batch.items.append(EditionMetadata(metadatas[token_id], supply))
+
+        return batch
 
     def total_supply(self, token_id: int) -> int:
         """
@@ -743,6 +829,34 @@ class ERC1155(Generic[TERC1155], BaseContract[TERC1155]):
     INTERNAL FUNCTIONS
     """
 
+    def _get_balances(self, owner: str, token_ids: List[int]) -> List[int]:
+        """
+        Read the balances of many tokens with concurrent balanceOfBatch calls.
+        Chunks that the node rejects, for example for exceeding its gas or
+        response size limits, are split in half and retried.
+        """
+
+        def read_chunk(chunk: List[int]) -> List[int]:
+            try:
+                return self._contract_wrapper._contract_abi.balance_of_batch.call(
+                    [owner] * len(chunk), chunk
+                )
+            except Exception:
+                if len(chunk) <= 1:
+                    raise
+                middle = len(chunk) // 2
+                return read_chunk(chunk[:middle]) + read_chunk(chunk[middle:])
+
+        chunks = [
+            token_ids[start : start + DEFAULT_BALANCE_BATCH_SIZE]
+            for start in range(0, len(token_ids), DEFAULT_BALANCE_BATCH_SIZE)
+        ]
+
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+            balances = list(executor.map(read_chunk, chunks))
+
+        return [balance for chunk in balances for balance in chunk]
+
     def _get_token_metadata(self, token_id: int) -> NFTMetadata:
         token_uri = self._token._contract_abi.uri.call(token_id)
 
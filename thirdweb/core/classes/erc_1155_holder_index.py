@@ -0,0 +1,264 @@
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.event_index import EventIndex
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+
+class ERC1155HolderIndex(EventIndex):
+    """
+    Local index of the balance of every holder of an ERC1155 contract, built from
+    its TransferSingle and TransferBatch events and stored in SQLite.
+
+    Every balance change is kept, so the holders of a token can also be read as
+    of any past block. When the index is stored in a file, it resumes from the
+    last synced block after a restart instead of scanning the history again.
+
+    ```python
+    index = contract.get_holder_index("holders.db")
+    index.sync()
+
+    holders = index.get_holders(0)
+    snapshot = index.get_snapshot(0, block=16000000)
+    ```
+    """
+
+    _connection: sqlite3.Connection
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper,
+        database_path: str = ":memory:",
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the holder index.
+
+        :param contract_wrapper: contract wrapper of the ERC1155 contract to index
+        :param database_path: path of the SQLite file to store the index in, defaults to an in-memory database
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        super().__init__(
+            ContractEvents(contract_wrapper),
+            ["TransferSingle", "TransferBatch"],
+            start_block,
+            reorg_depth,
+        )
+
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._create_tables(contract_wrapper._contract_abi.contract_address)
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """
+        Bring the index up to date with the chain and persist it.
+
+        :param to_block: optional block to sync to, defaults to the latest block
+        :returns: the block the index is synced to
+        """
+
+        try:
+            return super().sync(to_block)
+        except Exception:
+            with self._lock:
+                self._connection.rollback()
+            raise
+
+    def balance_of(self, holder: str, token_id: int) -> int:
+        """
+        Get the balance of a holder for a token from the index
+
+        :param holder: address of the holder
+        :param token_id: ID of the token
+        :return: the balance of the holder
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT balance FROM balances WHERE holder = ? AND token_id = ?",
+                (Web3.toChecksumAddress(holder), str(token_id)),
+            ).fetchone()
+
+        return int(row[0]) if row is not None else 0
+
+    def get_holders(self, token_id: int) -> Dict[str, int]:
+        """
+        Get every holder of a token and their balance
+
+        :param token_id: ID of the token
+        :return: map of holder address to balance
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT holder, balance FROM balances WHERE token_id = ?",
+                (str(token_id),),
+            ).fetchall()
+
+        return {holder: int(balance) for holder, balance in rows}
+
+    def get_token_ids(self, holder: str) -> Dict[int, int]:
+        """
+        Get every token held by a holder and its balance
+
+        :param holder: address of the holder
+        :return: map of token ID to balance, in ascending token ID order
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT token_id, balance FROM balances WHERE holder = ?",
+                (Web3.toChecksumAddress(holder),),
+            ).fetchall()
+
+        return {
+            int(token_id): int(balance)
+            for token_id, balance in sorted(rows, key=lambda row: int(row[0]))
+        }
+
+    def get_snapshot(self, token_id: int, block: int) -> Dict[str, int]:
+        """
+        Get every holder of a token and their balance as of a past block
+
+        :param token_id: ID of the token
+        :param block: block to take the snapshot at, must not be after the synced block
+        :return: map of holder address to balance at the end of the block
+        """
+
+        if block > self._cursor:
+            raise Exception(
+                f"Cannot take a snapshot at block {block}, the index is only synced to block {self._cursor}"
+            )
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT holder, delta FROM deltas WHERE token_id = ? AND block_number <= ?",
+                (str(token_id), block),
+            ).fetchall()
+
+        balances: Dict[str, int] = {}
+        for holder, delta in rows:
+            balances[holder] = balances.get(holder, 0) + int(delta)
+
+        return {holder: balance for holder, balance in balances.items() if balance > 0}
+
+    def close(self):
+        """
+        Close the connection to the database of the index
+        """
+
+        with self._lock:
+            self._connection.close()
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _create_tables(self, contract_address: str):
+        with self._lock:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS balances (
+                    holder TEXT NOT NULL,
+                    token_id TEXT NOT NULL,
+                    balance TEXT NOT NULL,
+                    PRIMARY KEY (holder, token_id)
+                );
+                CREATE INDEX IF NOT EXISTS balances_token_id ON balances (token_id);
+                CREATE TABLE IF NOT EXISTS deltas (
+                    block_number INTEGER NOT NULL,
+                    holder TEXT NOT NULL,
+                    token_id TEXT NOT NULL,
+                    delta TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS deltas_token_id_block ON deltas (token_id, block_number);
+                CREATE INDEX IF NOT EXISTS deltas_block ON deltas (block_number);
+                """
+            )
+
+            meta = dict(self._connection.execute("SELECT key, value FROM meta").fetchall())
+            if "contract_address" not in meta:
+                self._connection.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [
+                        ("contract_address", contract_address.lower()),
+                        ("cursor", str(self._cursor)),
+                    ],
+                )
+                self._connection.commit()
+            elif meta["contract_address"] != contract_address.lower():
+                raise Exception(
+                    f"The index database belongs to contract {meta['contract_address']}, not {contract_address}"
+                )
+            else:
+                self._cursor = int(meta["cursor"])
+
+    def _apply(self, event: AttributeDict) -> None:
+        args: Any = event["args"]
+        if event["event"] == "TransferSingle":
+            transfers = [(args["id"], args["value"])]
+        else:
+            transfers = list(zip(args["ids"], args["values"]))
+
+        for token_id, value in transfers:
+            self._add_balance(event["blockNumber"], args["from"], token_id, -value)
+            self._add_balance(event["blockNumber"], args["to"], token_id, value)
+
+        return None
+
+    def _revert(self, undo: Any):
+        pass
+
+    def _rollback(self, from_block: int):
+        deltas: List[Tuple[str, str, str]] = self._connection.execute(
+            "SELECT holder, token_id, delta FROM deltas WHERE block_number >= ?",
+            (from_block,),
+        ).fetchall()
+
+        for holder, token_id, delta in deltas:
+            self._update_balance(holder, token_id, -int(delta))
+
+        self._connection.execute(
+            "DELETE FROM deltas WHERE block_number >= ?", (from_block,)
+        )
+
+    def _on_synced(self, block: int):
+        self._connection.execute(
+            "UPDATE meta SET value = ? WHERE key = 'cursor'", (str(block),)
+        )
+        self._connection.commit()
+
+    def _add_balance(self, block_number: int, holder: str, token_id: int, delta: int):
+        if holder.lower() == ZERO_ADDRESS or delta == 0:
+            return
+
+        self._connection.execute(
+            "INSERT INTO deltas (block_number, holder, token_id, delta) VALUES (?, ?, ?, ?)",
+            (block_number, holder, str(token_id), str(delta)),
+        )
+        self._update_balance(holder, str(token_id), delta)
+
+    def _update_balance(self, holder: str, token_id: str, delta: int):
+        row = self._connection.execute(
+            "SELECT balance FROM balances WHERE holder = ? AND token_id = ?",
+            (holder, token_id),
+        ).fetchone()
+        balance = (int(row[0]) if row is not None else 0) + delta
+
+        if balance == 0:
+            self._connection.execute(
+                "DELETE FROM balances WHERE holder = ? AND token_id = ?",
+                (holder, token_id),
+            )
+        else:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO balances (holder, token_id, balance) VALUES (?, ?, ?)",
+                (holder, token_id, str(balance)),
+            )
@@ -1,9 +1,13 @@
-from typing import Generic, List, Union
+from typing import Generic, Iterator, List, Union
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.erc_1155 import ERC1155
+from thirdweb.core.classes.erc_1155_holder_index import ERC1155HolderIndex
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import TERC1155
+from thirdweb.types.multicall import BatchQueryResult
 from thirdweb.types.nft import (
     EditionMetadata,
     EditionMetadataOwner,
@@ -57,6 +61,36 @@ class ERC1155Standard(Generic[TERC1155], BaseContract[TERC1155]):
 
         return self._erc1155.get_all(query_params)
 
+    def get_batch(self, token_ids: List[int]) -> BatchQueryResult[EditionMetadata]:
+        """
+        Get the metadata for many tokens at once
+
+        ```python
+        result = contract.get_batch([0, 1, 2])
+        metadatas = result.items
+        ```
+
+        :param token_ids: token IDs of the tokens to get the metadata for
+        :return: the metadata and supply of each token that resolved, and the error for each token that didn't
+        """
+
+        return self._erc1155.get_batch(token_ids)
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EditionMetadata]:
+        """
+        Iterate over the metadata for all tokens on the contract page by page
+
+        ```python
+        for metadata in contract.iter_all(page_size=100):
+            print(metadata.supply)
+        ```
+
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the metadata for all tokens
+        """
+
+        return self._erc1155.iter_all(page_size)
+
     def get_total_count(self) -> int:
         """
         Get the total number of NFTs on the contract
@@ -82,6 +116,33 @@ class ERC1155Standard(Generic[TERC1155], BaseContract[TERC1155]):
 
         return self._erc1155.get_owned(address)
 
+    def get_holder_index(
+        self,
+        database_path: str = ":memory:",
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ) -> ERC1155HolderIndex:
+        """
+        Create a local index of the holders of every token, built from the transfer
+        events of the contract. Call sync on the index to bring it up to date.
+
+        ```python
+        index = contract.get_holder_index("holders.db")
+        index.sync()
+
+        holders = index.get_holders(0)
+        ```
+
+        :param database_path: path of the SQLite file to store the index in, defaults to an in-memory database
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        :return: the holder index
+        """
+
+        return ERC1155HolderIndex(
+            self._contract_wrapper, database_path, start_block, reorg_depth
+        )
+
     def total_supply(self, token_id: int) -> int:
         """
         Get the total number of tokens on the contract
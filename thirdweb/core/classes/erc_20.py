@@ -1,15 +1,24 @@
-from typing import List
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
 from thirdweb.abi.token_erc20 import TokenERC20
 from thirdweb.common.currency import (
     fetch_currency_metadata,
     fetch_currency_value,
+    format_units,
     parse_units,
 )
+from thirdweb.constants.contract import (
+    DEFAULT_MULTICALL_CHUNK_SIZE,
+    DEFAULT_MULTICALL_GAS_BUDGET,
+)
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.types.multicall import MulticallResult
 from thirdweb.types.currency import (
     Currency,
     CurrencyValue,
@@ -86,6 +95,118 @@ class ERC20(BaseContract[TokenERC20]):
             self._contract_wrapper._contract_abi.balance_of.call(address)
         )
 
+    def balances_of(
+        self, addresses: List[str], block_identifier: Optional[int] = None
+    ) -> Dict[str, CurrencyValue]:
+        """
+        Get token balances of many wallets at once
+
+        ```python
+        addresses = ["{{wallet_address}}", "0x..."]
+        balances = contract.erc20.balances_of(addresses)
+        print(balances)
+        ```
+
+        All balances are read at the same block in batched multicalls, and the
+        token metadata is only looked up once. Duplicate addresses are only read
+        once, and addresses whose balance can't be read are left out of the result.
+
+        :extension: ERC20
+        :param addresses: wallet addresses to check the balances of
+        :param block_identifier: optional block to read the balances at, defaults to the latest block
+        :returns: map of wallet address to its balance
+        """
+
+        block = (
+            block_identifier
+            if block_identifier is not None
+            else self._contract_wrapper.get_provider().eth.block_number
+        )
+        currency = self.get()
+        unique_addresses = list(dict.fromkeys(addresses))
+        results = self._contract_wrapper.multi_call_read(
+            [("balanceOf", [address]) for address in unique_addresses],
+            block_identifier=block,
+        )
+
+        balances: Dict[str, CurrencyValue] = {}
+        for address, result in zip(unique_addresses, results):
+            if not result.success:
+                continue
+
+            balances[address] = CurrencyValue(
+                currency.name,
+                currency.symbol,
+                currency.decimals,
+                result.data,
+                format_units(result.data, currency.decimals),
+            )
+
+        return balances
+
+    def export_balances(
+        self,
+        addresses: Iterable[str],
+        path: str,
+        block_identifier: Optional[int] = None,
+    ) -> int:
+        """
+        Write token balances of many wallets to a CSV or JSONL file
+
+        ```python
+        addresses = ["{{wallet_address}}", "0x..."]
+        block = contract.erc20.export_balances(addresses, "balances.csv")
+        ```
+
+        Addresses are read and written in chunks, so snapshots of any number of
+        wallets run in constant memory. Every balance is read at the same block,
+        and addresses whose balance can't be read are left out of the file.
+
+        :extension: ERC20
+        :param addresses: wallet addresses to check the balances of
+        :param path: path of the file to write, with a .csv or .jsonl extension
+        :param block_identifier: optional block to read the balances at, defaults to the latest block
+        :returns: the block the balances were read at
+        """
+
+        if not path.endswith(".csv") and not path.endswith(".jsonl"):
+            raise Exception("Balances can only be exported to .csv or .jsonl files")
+
+        block = (
+            block_identifier
+            if block_identifier is not None
+            else self._contract_wrapper.get_provider().eth.block_number
+        )
+        chunk_size = DEFAULT_MULTICALL_CHUNK_SIZE * 10
+        iterator = iter(addresses)
+
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f) if path.endswith(".csv") else None
+            if writer is not None:
+                writer.writerow(["address", "value", "display_value"])
+
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if len(chunk) == 0:
+                    break
+
+                for address, balance in self.balances_of(chunk, block).items():
+                    if writer is not None:
+                        writer.writerow([address, balance.value, balance.display_value])
+                    else:
+                        f.write(
+                            json.dumps(
+                                {
+                                    "address": address,
+                                    "value": str(balance.value),
+                                    "display_value": balance.display_value,
+                                }
+                            )
+                            + "\n"
+                        )
+
+        return block
+
     def total_supply(self) -> CurrencyValue:
         """
         Get the total minted supply
@@ -205,7 +326,9 @@ class ERC20(BaseContract[TokenERC20]):
             "mint_to", [to, amount_with_decimals]
         )
 
-    def mint_batch_to(self, args: List[TokenAmount]) -> TxReceipt:
+    def mint_batch_to(
+        self, args: List[TokenAmount], gas_budget: int = DEFAULT_MULTICALL_GAS_BUDGET
+    ) -> List[MulticallResult]:
         """
         Mint tokens to many wallets
 
@@ -218,23 +341,26 @@ class ERC20(BaseContract[TokenERC20]):
         ]
 
         :extension: ERC20BatchMintable
-        contract.erc20.mint_batch_to(args)
+        results = contract.erc20.mint_batch_to(args)
         ```
 
+        The mints are packed into as few multicall transactions as fit within
+        the gas budget.
+
         :param args: list of wallet addresses and amounts to mint
-        :returns: transaction receipt of the mint
+        :param gas_budget: maximum gas limit of each transaction
+        :returns: the outcome of the mint to each wallet, in the order of args
         """
 
-        encoded = []
+        decimals = self.get().decimals
         interface = self._contract_wrapper.get_contract_interface()
-        for arg in args:
-            encoded.append(
-                interface.encodeABI(
-                    "mintTo",
-                    [arg.to_address, parse_units(arg.amount, self.get().decimals)],
-                )
+        encoded = [
+            interface.encodeABI(
+                "mintTo", [arg.to_address, parse_units(arg.amount, decimals)]
             )
-        return self._contract_wrapper.multi_call(encoded)
+            for arg in args
+        ]
+        return self._contract_wrapper.multi_call_chunked(encoded, gas_budget)
 
     def transfer(self, to: str, amount: Price) -> TxReceipt:
         """
@@ -311,7 +437,9 @@ class ERC20(BaseContract[TokenERC20]):
             "approve", [spender, amount_with_decimals]
         )
 
-    def transfer_batch(self, args: List[TokenAmount]):
+    def transfer_batch(
+        self, args: List[TokenAmount], gas_budget: int = DEFAULT_MULTICALL_GAS_BUDGET
+    ) -> List[MulticallResult]:
         """
         Transfer tokens to many wallets
 
@@ -323,23 +451,26 @@ class ERC20(BaseContract[TokenERC20]):
             TokenAmount("0x...", 0.2),
         ]
 
-        contract.erc20.transfer_batch(data)
+        results = contract.erc20.transfer_batch(data)
         ```
 
+        The transfers are packed into as few multicall transactions as fit within
+        the gas budget.
+
         :param args: list of token amounts and addressed to transfer to
-        :returns: transaction receipt of the transfers
+        :param gas_budget: maximum gas limit of each transaction
+        :returns: the outcome of the transfer to each wallet, in the order of args
         """
 
-        encoded = []
+        decimals = self.get().decimals
         interface = self._contract_wrapper.get_contract_interface()
-
-        for arg in args:
-            amount_with_decimals = self.normalize_amount(arg.amount)
-            encoded.append(
-                interface.encodeABI("transfer", [arg.to_address, amount_with_decimals])
+        encoded = [
+            interface.encodeABI(
+                "transfer", [arg.to_address, parse_units(arg.amount, decimals)]
             )
-
-        return self._contract_wrapper.multi_call(encoded)
+            for arg in args
+        ]
+        return self._contract_wrapper.multi_call_chunked(encoded, gas_budget)
 
     def burn(self, amount: Price) -> TxReceipt:
         """
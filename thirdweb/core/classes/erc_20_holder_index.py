@@ -0,0 +1,160 @@
+import heapq
+from bisect import bisect_right
+from typing import Any, Dict, List, Tuple
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.event_index import EventIndex
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+
+class ERC20HolderIndex(EventIndex):
+    """
+    Local index of the balance of every holder of an ERC20 contract, built from
+    its Transfer events.
+
+    Each holder keeps one checkpoint per block their balance changed in, so the
+    balance of any holder can also be read as of any past block. All balances
+    are in wei.
+
+    ```python
+    index = contract.get_holder_index()
+    index.sync()
+
+    top_holders = index.get_top_holders(10)
+    holder_count = index.get_holder_count()
+    ```
+    """
+
+    _balances: Dict[str, int]
+    _checkpoints: Dict[str, List[Tuple[int, int]]]
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper,
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the holder index.
+
+        :param contract_wrapper: contract wrapper of the ERC20 contract to index
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        super().__init__(
+            ContractEvents(contract_wrapper), ["Transfer"], start_block, reorg_depth
+        )
+        self._balances = {}
+        self._checkpoints = {}
+
+    def balance_of(self, holder: str) -> int:
+        """
+        Get the balance of a holder from the index
+
+        :param holder: address of the holder
+        :return: the balance of the holder in wei
+        """
+
+        with self._lock:
+            return self._balances.get(Web3.toChecksumAddress(holder), 0)
+
+    def balance_at(self, holder: str, block: int) -> int:
+        """
+        Get the balance of a holder as of a past block
+
+        :param holder: address of the holder
+        :param block: block to read the balance at, must not be after the synced block
+        :return: the balance of the holder in wei at the end of the block
+        """
+
+        if block > self._cursor:
+            raise Exception(
+                f"Cannot read a balance at block {block}, the index is only synced to block {self._cursor}"
+            )
+
+        with self._lock:
+            checkpoints = self._checkpoints.get(Web3.toChecksumAddress(holder), [])
+            position = bisect_right(checkpoints, (block, float("inf")))
+            return checkpoints[position - 1][1] if position > 0 else 0
+
+    def get_holders(self) -> Dict[str, int]:
+        """
+        Get every holder and their balance
+
+        :return: map of holder address to balance in wei
+        """
+
+        with self._lock:
+            return dict(self._balances)
+
+    def get_holder_count(self) -> int:
+        """
+        Get the number of wallets holding a nonzero balance
+
+        :return: the number of holders
+        """
+
+        with self._lock:
+            return len(self._balances)
+
+    def get_top_holders(self, count: int) -> List[Tuple[str, int]]:
+        """
+        Get the holders with the largest balances
+
+        :param count: number of holders to return
+        :return: list of holder address and balance in wei, largest balance first
+        """
+
+        with self._lock:
+            return heapq.nlargest(
+                count, self._balances.items(), key=lambda holder: holder[1]
+            )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _apply(self, event: AttributeDict) -> List[Tuple[str, int, bool]]:
+        args: Any = event["args"]
+        undo = []
+        for holder, delta in [(args["from"], -args["value"]), (args["to"], args["value"])]:
+            if holder == ZERO_ADDRESS or delta == 0:
+                continue
+            undo.append(self._add_balance(event["blockNumber"], holder, delta))
+
+        return undo
+
+    def _revert(self, undo: List[Tuple[str, int, bool]]):
+        for holder, previous_balance, appended in reversed(undo):
+            checkpoints = self._checkpoints[holder]
+            block = checkpoints.pop()[0]
+            if not appended:
+                checkpoints.append((block, previous_balance))
+            elif len(checkpoints) == 0:
+                del self._checkpoints[holder]
+
+            self._set_balance(holder, previous_balance)
+
+    def _add_balance(self, block: int, holder: str, delta: int) -> Tuple[str, int, bool]:
+        previous_balance = self._balances.get(holder, 0)
+        balance = previous_balance + delta
+
+        checkpoints = self._checkpoints.setdefault(holder, [])
+        appended = len(checkpoints) == 0 or checkpoints[-1][0] != block
+        if appended:
+            checkpoints.append((block, balance))
+        else:
+            checkpoints[-1] = (block, balance)
+
+        self._set_balance(holder, balance)
+        return (holder, previous_balance, appended)
+
+    def _set_balance(self, holder: str, balance: int):
+        if balance == 0:
+            self._balances.pop(holder, None)
+        else:
+            self._balances[holder] = balance
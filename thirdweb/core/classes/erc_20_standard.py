@@ -1,9 +1,13 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from thirdweb.abi.token_erc20 import TokenERC20
+from thirdweb.constants.contract import DEFAULT_MULTICALL_GAS_BUDGET
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.erc_20 import ERC20
+from thirdweb.core.classes.erc_20_holder_index import ERC20HolderIndex
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.types.multicall import MulticallResult
 from thirdweb.types.currency import (
     Currency,
     CurrencyValue,
@@ -65,6 +69,69 @@ class ERC20Standard(BaseContract[TokenERC20]):
 
         return self._erc20.balance_of(address)
 
+    def balances_of(
+        self, addresses: List[str], block_identifier: Optional[int] = None
+    ) -> Dict[str, CurrencyValue]:
+        """
+        Get the balances of many wallets at once, read at the same block. Addresses
+        whose balance can't be read are left out of the result.
+
+        ```python
+        addresses = ["{{wallet_address}}", "0x..."]
+        balances = contract.balances_of(addresses)
+        print(balances)
+        ```
+
+        :param addresses: wallet addresses to check the balances of
+        :param block_identifier: optional block to read the balances at, defaults to the latest block
+        :returns: map of wallet address to its balance
+        """
+
+        return self._erc20.balances_of(addresses, block_identifier)
+
+    def export_balances(
+        self,
+        addresses: Iterable[str],
+        path: str,
+        block_identifier: Optional[int] = None,
+    ) -> int:
+        """
+        Write the balances of many wallets to a CSV or JSONL file
+
+        ```python
+        addresses = ["{{wallet_address}}", "0x..."]
+        block = contract.export_balances(addresses, "balances.jsonl")
+        ```
+
+        :param addresses: wallet addresses to check the balances of
+        :param path: path of the file to write, with a .csv or .jsonl extension
+        :param block_identifier: optional block to read the balances at, defaults to the latest block
+        :returns: the block the balances were read at
+        """
+
+        return self._erc20.export_balances(addresses, path, block_identifier)
+
+    def get_holder_index(
+        self, start_block: int = 0, reorg_depth: int = DEFAULT_REORG_DEPTH
+    ) -> ERC20HolderIndex:
+        """
+        Create a local index of the balance of every holder, built from the transfer
+        events of the contract. Call sync on the index to bring it up to date.
+
+        ```python
+        index = contract.get_holder_index()
+        index.sync()
+
+        top_holders = index.get_top_holders(10)
+        ```
+
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        :return: the holder index
+        """
+
+        return ERC20HolderIndex(self._contract_wrapper, start_block, reorg_depth)
+
     def total_supply(self) -> CurrencyValue:
         """
         Get the total minted supply of the token.
@@ -188,7 +255,9 @@ class ERC20Standard(BaseContract[TokenERC20]):
 
         return self._erc20.set_allowance(spender, amount)
 
-    def transfer_batch(self, args: List[TokenAmount]):
+    def transfer_batch(
+        self, args: List[TokenAmount], gas_budget: int = DEFAULT_MULTICALL_GAS_BUDGET
+    ) -> List[MulticallResult]:
         """
         Transfer tokens from the connected wallet to many wallets.
 
@@ -200,14 +269,15 @@ class ERC20Standard(BaseContract[TokenERC20]):
             TokenAmount("0x...", 0.2),
         ]
 
-        contract.transfer_batch(data)
+        results = contract.transfer_batch(data)
         ```
 
         :param args: list of token amounts and addressed to transfer to
-        :returns: transaction receipt of the transfers
+        :param gas_budget: maximum gas limit of each transaction
+        :returns: the outcome of the transfer to each wallet, in the order of args
         """
 
-        return self._erc20.transfer_batch(args)
+        return self._erc20.transfer_batch(args, gas_budget)
 
     def burn(self, amount: Price) -> TxReceipt:
         """
@@ -1,11 +1,18 @@
-from typing import Generic, List, Union
+from typing import Generic, Iterator, List, Union, cast
 
 from web3 import Web3
 from thirdweb.abi.drop_erc721 import DropERC721, IDropAllowlistProof
 from thirdweb.abi.token_erc721 import TokenERC721
 from thirdweb.common.claim_conditions import prepare_claim
 from thirdweb.common.error import NotFoundException
-from thirdweb.common.nft import fetch_token_metadata, upload_or_extract_uri, upload_or_extract_uris
+from thirdweb.common.pagination import iter_pages
+from thirdweb.common.nft import (
+    fetch_token_metadata,
+    fetch_token_metadata_batch,
+    upload_or_extract_uri,
+    upload_or_extract_uris,
+)
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.constants.role import Role, get_role_hash
 from thirdweb.core.classes.base_contract import BaseContract
@@ -16,6 +23,7 @@ from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import TERC721
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.contracts.claim_conditions import ClaimVerification
+from thirdweb.types.multicall import BatchQueryResult
 from thirdweb.types.nft import NFTMetadata, NFTMetadataInput, NFTMetadataOwner, QueryAllParams
 from web3.eth import TxReceipt
 from thirdweb.types.settings.metadata import NFTDropContractMetadata
@@ -100,23 +108,89 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         print(nfts)
         ```
 
+        Tokens whose metadata can't be resolved are left out, use get_batch
+        to get the error for each of them.
+
         :extension: ERC721Supply | ERC721Enumerable
         :param query_params: optionally define a QueryAllParams instance to narrow the metadata query to specific tokens
         :return: the metadata of all tokens in the contract
         """
 
         max_id = min(query_params.start + query_params.count, self.get_total_count())
+        return self.get_batch(list(range(query_params.start, max_id))).items
 
-        nfts = []
-        for token_id in range(query_params.start, max_id):
-            try:
-                nft = self.get(token_id)
-                nfts.append(nft)
-            except:
-                pass
+    def get_batch(self, token_ids: List[int]) -> BatchQueryResult[NFTMetadataOwner]:
+        """
+        Get many NFTs at once
+
+        ```python
+        result = contract.erc721.get_batch([0, 1, 2])
+        nfts = result.items
+        failed_token_ids = list(result.failures.keys())
+        ```
+
+        Owners and token URIs are read in batched multicalls, and the metadata
+        of every token is then fetched concurrently.
+
+        :extension: ERC721
+        :param token_ids: token IDs of the tokens to get the metadata for
+        :return: the metadata and owner of each token that resolved, and the error for each token that didn't
+        """
+
+        calls = []
+        for token_id in token_ids:
+            calls.append(("ownerOf", [token_id]))
+            calls.append(("tokenURI", [token_id]))
+        results = self._contract_wrapper.multi_call_read(calls)
+
+        batch = BatchQueryResult[NFTMetadataOwner]()
+        token_uris = {}
+        for index, token_id in enumerate(token_ids):
+            uri_result = results[2 * index + 1]
+            if not uri_result.success:
+                batch.failures[token_id] = cast(Exception, uri_result.error)
+            elif not uri_result.data:
+                batch.failures[token_id] = NotFoundException(str(token_id))
+            else:
+                token_uris[token_id] = uri_result.data
+
+        metadatas, failures = fetch_token_metadata_batch(token_uris, self._storage)
+        batch.failures.update(failures)
+
+        for index, token_id in enumerate(token_ids):
+            if token_id not in metadatas:
+                continue
+
+            owner_result = results[2 * index]
+            owner = owner_result.data if owner_result.success else ZERO_ADDRESS
+            batch.items.append(NFTMetadataOwner(metadatas[token_id], owner))
+
+        return batch
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[NFTMetadataOwner]:
+        """
+        Iterate over all NFTs page by page
+
+        ```python
+        for nft in contract.erc721.iter_all(page_size=100):
+            print(nft.metadata.name)
+        ```
+
+        The next page is fetched in the background while the current one is
+        consumed, so large collections can be read in constant memory.
+
+        :extension: ERC721Supply | ERC721Enumerable
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the metadata and owner of all tokens in the contract
+        """
+
+        return iter_pages(
+            lambda start, count: self.get_batch(list(range(start, start + count))).items,
+            0,
+            self.get_total_count(),
+            page_size,
+        )
 
-        return nfts
-    
     def get_all_claimed(
         self, query_params: QueryAllParams = QueryAllParams()
     ) -> List[NFTMetadataOwner]:
@@ -128,6 +202,9 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         first_owner = claimed_nfts[0].owner
         ```
 
+        Tokens whose metadata can't be resolved are left out, use get_batch
+        to get the error for each of them.
+
         :param query_params: Query parameters.
         :return: List of nft metadatas and owners for claimed nfts.
         """
@@ -137,7 +214,29 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
             query_params.start + query_params.count,
         )
 
-        return [self.get(token_id) for token_id in range(query_params.start, max_id)]
+        return self.get_batch(list(range(query_params.start, max_id))).items
+
+    def iter_all_claimed(
+        self, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[NFTMetadataOwner]:
+        """
+        Iterate over all claimed NFTs page by page
+
+        ```python
+        for nft in contract.erc721.iter_all_claimed(page_size=100):
+            print(nft.owner)
+        ```
+
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the nft metadatas and owners of claimed nfts
+        """
+
+        return iter_pages(
+            lambda start, count: self.get_batch(list(range(start, start + count))).items,
+            0,
+            self.total_claimed_supply(),
+            page_size,
+        )
 
     def get_all_unclaimed(
         self, query_params: QueryAllParams = QueryAllParams()
@@ -161,10 +260,30 @@ class ERC721(Generic[TERC721], BaseContract[TERC721]):
         unminted_id = self._drop._contract_abi.next_token_id_to_claim.call()
 
         return [
-            self._get_token_metadata(unminted_id + i)
-            for i in range(max_id - unminted_id)
+            self._get_token_metadata(token_id)
+            for token_id in range(max(query_params.start, unminted_id), max_id)
         ]
 
+    def iter_all_unclaimed(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[NFTMetadata]:
+        """
+        Iterate over all unclaimed NFTs page by page
+
+        ```python
+        for nft in contract.erc721.iter_all_unclaimed(page_size=100):
+            print(nft.name)
+        ```
+
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the nft metadatas of unclaimed nfts
+        """
+
+        return iter_pages(
+            lambda start, count: self.get_all_unclaimed(QueryAllParams(start, count)),
+            self.total_claimed_supply(),
+            self._drop._contract_abi.next_token_id_to_mint.call(),
+            page_size,
+        )
+
     def total_claimed_supply(self) -> int:
         """
         Get the number of claimed NFTs
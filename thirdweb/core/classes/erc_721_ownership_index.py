@@ -0,0 +1,129 @@
+from typing import Any, Dict, List, Optional, Set, Tuple
+from thirdweb.common.error import NotFoundException
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.erc_721 import ERC721
+from thirdweb.core.classes.event_index import EventIndex
+from thirdweb.types.nft import NFTMetadataOwner
+from web3.datastructures import AttributeDict
+
+
+class ERC721OwnershipIndex(EventIndex):
+    """
+    Local index of the owner of every token of an ERC721 contract, built from its
+    Transfer events. Useful for contracts that don't implement tokenOfOwnerByIndex,
+    where finding the tokens of a wallet would otherwise require an owner_of call
+    for every token.
+
+    ```python
+    index = contract.get_ownership_index()
+    index.sync()
+
+    token_ids = index.get_owned_token_ids("{{wallet_address}}")
+    owner = index.owner_of(0)
+    ```
+    """
+
+    _erc721: ERC721
+    _owners: Dict[int, str]
+    _tokens: Dict[str, Set[int]]
+
+    def __init__(
+        self,
+        erc721: ERC721,
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the ownership index.
+
+        :param erc721: the ERC721 contract to index
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        super().__init__(
+            ContractEvents(erc721._contract_wrapper),
+            ["Transfer"],
+            start_block,
+            reorg_depth,
+        )
+        self._erc721 = erc721
+        self._owners = {}
+        self._tokens = {}
+
+    def owner_of(self, token_id: int) -> str:
+        """
+        Get the owner of a token from the index
+
+        :param token_id: the token ID of the token to get the owner of
+        :return: the owner of the token
+        """
+
+        with self._lock:
+            if token_id not in self._owners:
+                raise NotFoundException(str(token_id))
+            return self._owners[token_id]
+
+    def get_owned_token_ids(self, address: str) -> List[int]:
+        """
+        Get the token IDs owned by a specific address from the index
+
+        :param address: the address to get the token IDs for
+        :return: the token IDs owned by the address, in ascending order
+        """
+
+        with self._lock:
+            return sorted(self._tokens.get(address.lower(), set()))
+
+    def get_owned(self, address: str) -> List[NFTMetadataOwner]:
+        """
+        Get the metadata of all tokens owned by a specific address, using the index
+        to find the tokens
+
+        :param address: the address to get the metadata for
+        :return: the metadata of all tokens owned by the address
+        """
+
+        return self._erc721.get_batch(self.get_owned_token_ids(address)).items
+
+    def get_total_holders(self) -> int:
+        """
+        Get the number of wallets holding at least one token
+
+        :return: the number of holders
+        """
+
+        with self._lock:
+            return len(self._tokens)
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _apply(self, event: AttributeDict) -> Tuple[int, Optional[str]]:
+        args: Any = event["args"]
+        token_id = args["tokenId"]
+        previous_owner = self._owners.get(token_id)
+        self._set_owner(token_id, args["to"])
+
+        return (token_id, previous_owner)
+
+    def _revert(self, undo: Tuple[int, Optional[str]]):
+        token_id, previous_owner = undo
+        self._set_owner(token_id, previous_owner)
+
+    def _set_owner(self, token_id: int, owner: Optional[str]):
+        current_owner = self._owners.pop(token_id, None)
+        if current_owner is not None:
+            tokens = self._tokens[current_owner.lower()]
+            tokens.discard(token_id)
+            if len(tokens) == 0:
+                del self._tokens[current_owner.lower()]
+
+        if owner is None or owner.lower() == ZERO_ADDRESS:
+            return
+
+        self._owners[token_id] = owner
+        self._tokens.setdefault(owner.lower(), set()).add(token_id)
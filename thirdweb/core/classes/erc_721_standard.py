@@ -1,9 +1,13 @@
-from typing import Generic, List
+from typing import Generic, Iterator, List
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.erc_721 import ERC721
+from thirdweb.core.classes.erc_721_ownership_index import ERC721OwnershipIndex
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contract import TERC721
+from thirdweb.types.multicall import BatchQueryResult
 from thirdweb.types.nft import NFTMetadataOwner, QueryAllParams
 from web3.eth import TxReceipt
 
@@ -57,6 +61,58 @@ class ERC721Standard(Generic[TERC721], BaseContract[TERC721]):
 
         return self._erc721.get_all(query_params)
 
+    def get_batch(self, token_ids: List[int]) -> BatchQueryResult[NFTMetadataOwner]:
+        """
+        Get the metadata of many tokens at once
+
+        ```python
+        result = contract.get_batch([0, 1, 2])
+        nfts = result.items
+        ```
+
+        :param token_ids: token IDs of the tokens to get the metadata for
+        :return: the metadata and owner of each token that resolved, and the error for each token that didn't
+        """
+
+        return self._erc721.get_batch(token_ids)
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[NFTMetadataOwner]:
+        """
+        Iterate over the metadata of all tokens in the contract page by page
+
+        ```python
+        for nft in contract.iter_all(page_size=100):
+            print(nft.metadata.name)
+        ```
+
+        :param page_size: number of tokens to fetch per page
+        :return: iterator over the metadata of all tokens in the contract
+        """
+
+        return self._erc721.iter_all(page_size)
+
+    def get_ownership_index(
+        self, start_block: int = 0, reorg_depth: int = DEFAULT_REORG_DEPTH
+    ) -> ERC721OwnershipIndex:
+        """
+        Create a local index of token ownership built from the Transfer events
+        of the contract. Call sync on the index to bring it up to date, after
+        which owner lookups are served locally without any RPC calls.
+
+        ```python
+        index = contract.get_ownership_index()
+        index.sync()
+
+        token_ids = index.get_owned_token_ids("{{wallet_address}}")
+        ```
+
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        :return: the ownership index
+        """
+
+        return ERC721OwnershipIndex(self._erc721, start_block, reorg_depth)
+
     def get_total_count(self) -> int:
         """
         Get the total number of NFTs minted by this contract
@@ -0,0 +1,218 @@
+import logging
+from abc import ABC, abstractmethod
+from threading import Event, RLock, Thread
+from typing import Any, Callable, List, Optional, Tuple
+from thirdweb.constants.events import DEFAULT_POLL_INTERVAL, DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.types.events import EventQueryOptions
+from web3.datastructures import AttributeDict
+
+logger = logging.getLogger(__name__)
+
+
+class EventIndex(ABC):
+    """
+    Base class for local indexes built by replaying contract events.
+
+    The index keeps a cursor of the last block it synced to, so each sync only
+    queries the blocks produced since the previous one. Every change applied
+    for the most recent reorg_depth blocks is journaled, and those blocks are
+    rolled back and replayed on every sync, so the index recovers from any
+    reorg that is no deeper than reorg_depth blocks.
+    """
+
+    _events: ContractEvents
+    _event_names: List[str]
+    _start_block: int
+    _reorg_depth: int
+    _cursor: int
+    _journal: List[Tuple[int, Any]]
+    _lock: RLock
+    _sync_lock: RLock
+    _follower: Optional[Thread]
+    _stop_following: Event
+    _last_error: Optional[Exception]
+
+    def __init__(
+        self,
+        events: ContractEvents,
+        event_names: List[str],
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the event index.
+
+        :param events: contract events instance to query the events with
+        :param event_names: names of the events to replay into the index
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        self._events = events
+        self._event_names = event_names
+        self._start_block = start_block
+        self._reorg_depth = reorg_depth
+        self._cursor = start_block - 1
+        self._journal = []
+        self._lock = RLock()
+        # Syncs are serialized, so overlapping syncs never replay the same events twice
+        self._sync_lock = RLock()
+        self._follower = None
+        self._stop_following = Event()
+        self._last_error = None
+
+    def get_cursor(self) -> int:
+        """
+        Get the last block the index is synced to
+
+        :returns: the last synced block, or start_block - 1 if the index was never synced
+        """
+
+        return self._cursor
+
+    def get_last_error(self) -> Optional[Exception]:
+        """
+        Get the error of the last sync made while following the chain head
+
+        :returns: the error raised by the last background sync, or None if it succeeded
+        """
+
+        return self._last_error
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """
+        Bring the index up to date with the chain.
+
+        :param to_block: optional block to sync to, defaults to the latest block
+        :returns: the block the index is synced to
+        """
+
+        with self._sync_lock:
+            head = (
+                to_block
+                if to_block is not None
+                else self._events._contract_wrapper.get_provider().eth.block_number
+            )
+            from_block = max(self._start_block, self._cursor - self._reorg_depth + 1)
+
+            if head < from_block:
+                return self._cursor
+
+            events = self._fetch_events(from_block, head)
+
+            with self._lock:
+                self._rollback(from_block)
+
+                # Every change of the pass is journaled until it completes, so a
+                # failed pass is reverted instead of being applied twice by the next
+                try:
+                    for event in events:
+                        undo = self._apply(event)
+                        if undo is not None:
+                            self._journal.append((event["blockNumber"], undo))
+                    self._on_synced(head)
+                except Exception:
+                    self._rollback(from_block)
+                    raise
+
+                self._cursor = head
+                self._journal = [
+                    entry
+                    for entry in self._journal
+                    if entry[0] > head - self._reorg_depth
+                ]
+
+        return head
+
+    def follow(
+        self,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        Keep the index synced with the chain head from a background thread until
+        stop is called. A sync that fails is logged, recorded as the last error
+        and retried on the next poll.
+
+        :param poll_interval: number of seconds to wait between syncs
+        :param on_error: optional callback called with the error of every failed sync
+        """
+
+        with self._lock:
+            if self._follower is not None:
+                return
+
+            self._stop_following.clear()
+            self._follower = Thread(
+                target=self._follow, args=(poll_interval, on_error), daemon=True
+            )
+            self._follower.start()
+
+    def stop(self):
+        """
+        Stop following the chain head and wait for the sync in progress to finish
+        """
+
+        follower = self._follower
+        if follower is None:
+            return
+
+        self._stop_following.set()
+        follower.join()
+        self._follower = None
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _fetch_events(self, from_block: int, to_block: int) -> List[AttributeDict]:
+        events: List[AttributeDict] = []
+        for event_name in self._event_names:
+            events.extend(
+                self._events.get_events_chunked(
+                    event_name, EventQueryOptions(from_block=from_block, to_block=to_block)
+                )
+            )
+
+        return sorted(events, key=lambda event: (event["blockNumber"], event["logIndex"]))
+
+    def _follow(
+        self, poll_interval: float, on_error: Optional[Callable[[Exception], None]]
+    ):
+        while not self._stop_following.is_set():
+            try:
+                self.sync()
+                self._last_error = None
+            except Exception as e:
+                logger.exception("Failed to sync event index, retrying next poll")
+                self._last_error = e
+                if on_error is not None:
+                    on_error(e)
+            self._stop_following.wait(poll_interval)
+
+    def _rollback(self, from_block: int):
+        while len(self._journal) > 0 and self._journal[-1][0] >= from_block:
+            _, undo = self._journal.pop()
+            self._revert(undo)
+
+    def _on_synced(self, block: int):
+        pass
+
+    @abstractmethod
+    def _apply(self, event: AttributeDict) -> Any:
+        """
+        Apply an event to the index.
+
+        :param event: decoded event to apply
+        :returns: the data needed to revert the change made by the event, or None if
+            the index handles rollbacks itself
+        """
+
+    @abstractmethod
+    def _revert(self, undo: Any):
+        """
+        Revert a change previously made by _apply.
+
+        :param undo: the data returned by _apply for the change to revert
+        """
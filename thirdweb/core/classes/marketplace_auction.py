@@ -1,5 +1,5 @@
 from time import time
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, List, Optional, cast
 from thirdweb.abi import Marketplace
 from thirdweb.abi.marketplace import IMarketplaceListingParameters
 from thirdweb.common.currency import (
@@ -24,9 +24,12 @@ from thirdweb.common.marketplace import (
 from thirdweb.common.nft import fetch_token_metadata_for_contract
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.core.classes.base_contract import BaseContract
+from thirdweb.core.classes.contract_events import ContractEvents
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.currency import Price
+from thirdweb.types.events import EventQueryOptions
+from thirdweb.types.nft import NFTMetadata
 from thirdweb.types.marketplace import (
     AuctionListing,
     ContractListing,
@@ -87,27 +90,71 @@ class MarketplaceAuction(BaseContract[Marketplace]):
 
         return map_offer(self._contract_wrapper.get_provider(), listing_id, offers)
 
-    def get_winner(self, listing_id) -> str:
+    def get_winner(self, listing_id: int) -> str:
         """
         Get the winner of an auction that has already ended.
 
         :param listing_id: The ID of the listing to get the winner for
         :return: The winning bidder
         """
-        interface = self._contract_wrapper.get_contract_interface()
-        closed_auctions = interface.events.AuctionClosed().getLogs()
 
-        auctions = [
-            auction.get("args").get("listing_id") == listing_id
-            for auction in closed_auctions
-        ]
-
-        if len(auctions) == 0:
+        winners = self.get_winners([listing_id])
+        if listing_id not in winners:
             raise Exception(
                 f"Could not find auction with listing ID {listing_id} in close auctions"
             )
 
-        return auctions[0].get("winning_bidder")
+        return winners[listing_id]
+
+    def get_winners(self, listing_ids: List[int]) -> Dict[int, str]:
+        """
+        Get the winners of many auctions that have already ended.
+
+        ```python
+        winners = contract.auction.get_winners([0, 1, 2])
+        ```
+
+        The AuctionClosed events of all the auctions are queried together, filtered
+        by listing ID on the node and starting from the block the earliest of them
+        ended at. Cancelled auctions are deleted and have no winner, so they are
+        left out of the result.
+
+        :param listing_ids: The IDs of the listings to get the winners for
+        :return: Map of listing ID to winning bidder, for the auctions that have been closed
+        """
+
+        if len(listing_ids) == 0:
+            return {}
+
+        results = self._contract_wrapper.multi_call_read(
+            [("listings", [listing_id]) for listing_id in listing_ids]
+        )
+
+        end_times: Dict[int, int] = {}
+        for listing_id, result in zip(listing_ids, results):
+            if not result.success:
+                raise cast(Exception, result.error)
+
+            listing = ContractListing(*result.data)
+            # Cancelled auctions are deleted and have neither a close time nor a winner
+            if listing.asset_contract != ZERO_ADDRESS:
+                end_times[listing_id] = listing.end_time
+
+        if len(end_times) == 0:
+            return {}
+
+        from_block = self._get_block_at(min(end_times.values()))
+        events = ContractEvents(self._contract_wrapper).get_events_chunked(
+            "AuctionClosed",
+            EventQueryOptions(
+                filters={"listingId": list(end_times.keys())}, from_block=from_block
+            ),
+        )
+
+        return {
+            event["args"]["listingId"]: event["args"]["winningBidder"]
+            for event in events
+        }
 
     """
     WRITE FUNCTIONS
@@ -293,13 +340,37 @@ class MarketplaceAuction(BaseContract[Marketplace]):
     INTERNAL FUNCTIONS
     """
 
+    def _get_block_at(self, timestamp: int) -> int:
+        # Binary search for the first block mined at or after the timestamp
+        provider = self._contract_wrapper.get_provider()
+        low = 0
+        high: int = provider.eth.block_number
+        while low < high:
+            middle = (low + high) // 2
+            if provider.eth.get_block(middle)["timestamp"] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
     def _validate_listing(self, listing_id: int) -> AuctionListing:
         try:
             return self.get_listing(listing_id)
         except:
             raise ListingNotFoundException(listing_id)
 
-    def _map_listing(self, listing: ContractListing) -> AuctionListing:
+    def _map_listing(
+        self, listing: ContractListing, asset: Optional[NFTMetadata] = None
+    ) -> AuctionListing:
+        if asset is None:
+            asset = fetch_token_metadata_for_contract(
+                listing.asset_contract,
+                self._contract_wrapper.get_provider(),
+                listing.token_id,
+                self._storage,
+            )
+
         return AuctionListing(
             id=listing.listing_id,
             asset_contract_address=listing.asset_contract,
@@ -313,12 +384,7 @@ class MarketplaceAuction(BaseContract[Marketplace]):
             token_id=listing.token_id,
             quantity=listing.quantity,
             start_time_in_epoch_seconds=listing.start_time,
-            asset=fetch_token_metadata_for_contract(
-                listing.asset_contract,
-                self._contract_wrapper.get_provider(),
-                listing.token_id,
-                self._storage,
-            ),
+            asset=asset,
             reserve_price_currency_value_per_token=fetch_currency_value(
                 self._contract_wrapper.get_provider(),
                 listing.currency,
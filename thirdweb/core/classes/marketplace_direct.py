@@ -3,7 +3,6 @@ from typing import Any, Dict, Optional, cast
 
 from eth_utils import is_address
 from thirdweb.abi import Marketplace
-from thirdweb.abi import IERC165
 from thirdweb.abi.ierc1155 import IERC1155
 from thirdweb.abi.ierc721 import IERC721
 from thirdweb.abi.marketplace import IMarketplaceListingParameters
@@ -21,13 +20,14 @@ from thirdweb.common.marketplace import (
     map_offer,
     validate_new_listing_param,
 )
+from thirdweb.common.feature_detection import fetch_token_interfaces
 from thirdweb.common.nft import fetch_token_metadata_for_contract
-from thirdweb.constants.contract import INTERFACE_ID_IERC1155, INTERFACE_ID_IERC721
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.core.classes.base_contract import BaseContract
 from thirdweb.core.classes.contract_wrapper import ContractWrapper
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.currency import Price
+from thirdweb.types.nft import NFTMetadata
 from zero_ex.contract_wrappers.tx_params import TxParams
 from thirdweb.types.marketplace import (
     ContractListing,
@@ -301,7 +301,17 @@ class MarketplaceDirect(BaseContract[Marketplace]):
         except:
             raise ListingNotFoundException(listing_id)
 
-    def _map_listing(self, listing: ContractListing) -> DirectListing:
+    def _map_listing(
+        self, listing: ContractListing, asset: Optional[NFTMetadata] = None
+    ) -> DirectListing:
+        if asset is None:
+            asset = fetch_token_metadata_for_contract(
+                listing.asset_contract,
+                self._contract_wrapper.get_provider(),
+                listing.token_id,
+                self._storage,
+            )
+
         return DirectListing(
             id=listing.listing_id,
             asset_contract_address=listing.asset_contract,
@@ -315,12 +325,7 @@ class MarketplaceDirect(BaseContract[Marketplace]):
             ),
             quantity=listing.quantity,
             start_time_in_seconds=listing.start_time,
-            asset=fetch_token_metadata_for_contract(
-                listing.asset_contract,
-                self._contract_wrapper.get_provider(),
-                listing.token_id,
-                self._storage,
-            ),
+            asset=asset,
             seconds_until_end=listing.end_time,
             seller_address=listing.token_owner,
         )
@@ -340,9 +345,9 @@ class MarketplaceDirect(BaseContract[Marketplace]):
             return False
 
         provider = self._contract_wrapper.get_provider()
-        erc165 = IERC165(provider, listing.asset_contract_address)
-        is_erc721 = erc165.supports_interface.call(INTERFACE_ID_IERC721)
-        is_erc1155 = erc165.supports_interface.call(INTERFACE_ID_IERC1155)
+        is_erc721, is_erc1155 = fetch_token_interfaces(
+            provider, listing.asset_contract_address
+        )
 
         if is_erc721:
             ierc721 = IERC721(provider, listing.asset_contract_address)
@@ -0,0 +1,479 @@
+import sqlite3
+from bisect import bisect_left, insort
+from time import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.event_index import EventIndex
+from thirdweb.types.marketplace import (
+    AuctionListing,
+    ContractListing,
+    DirectListing,
+    ListingType,
+)
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+
+class MarketplaceListingIndex(EventIndex):
+    """
+    Local index of the listings of a marketplace, built from its listing, sale,
+    offer and auction events.
+
+    Every event marks the listing it belongs to as changed, and the changed
+    listings are read back from the contract at the end of each sync, so the
+    index always matches the contract state at the synced block. Listings can
+    then be filtered by seller, asset, currency and price without scanning the
+    marketplace.
+
+    ```python
+    index = contract.get_listing_index()
+    index.sync()
+
+    listings = index.get_listings(seller="{{wallet_address}}", active_only=True)
+    ```
+    """
+
+    _contract_wrapper: ContractWrapper
+    _map_listings: Callable[
+        [List[ContractListing]], List[Union[DirectListing, AuctionListing]]
+    ]
+    _store: Union["_MemoryListingStore", "_SQLiteListingStore"]
+    _dirty: Set[int]
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper,
+        map_listings: Callable[
+            [List[ContractListing]], List[Union[DirectListing, AuctionListing]]
+        ],
+        database_path: Optional[str] = None,
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the listing index.
+
+        :param contract_wrapper: contract wrapper of the marketplace to index
+        :param map_listings: function mapping raw contract listings to SDK listings
+        :param database_path: optional path of an SQLite file to store the index in, defaults to storing it in memory
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        super().__init__(
+            ContractEvents(contract_wrapper),
+            [
+                "ListingAdded",
+                "ListingUpdated",
+                "ListingRemoved",
+                "NewSale",
+                "NewOffer",
+                "AuctionClosed",
+            ],
+            start_block,
+            reorg_depth,
+        )
+        self._contract_wrapper = contract_wrapper
+        self._map_listings = map_listings
+        self._dirty = set()
+
+        if database_path is None:
+            self._store = _MemoryListingStore()
+        else:
+            self._store = _SQLiteListingStore(
+                database_path, contract_wrapper._contract_abi.contract_address
+            )
+            cursor = self._store.get_cursor()
+            if cursor is not None:
+                self._cursor = cursor
+
+    def sync(self, to_block: Optional[int] = None) -> int:
+        """
+        Bring the index up to date with the chain.
+
+        :param to_block: optional block to sync to, defaults to the latest block
+        :returns: the block the index is synced to
+        """
+
+        with self._sync_lock:
+            cursor = self._cursor
+            try:
+                return super().sync(to_block)
+            except Exception:
+                with self._lock:
+                    self._store.rollback()
+                    self._cursor = cursor
+                raise
+
+    def get_raw_listings(
+        self,
+        seller: Optional[str] = None,
+        asset_contract: Optional[str] = None,
+        token_id: Optional[int] = None,
+        currency: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+    ) -> List[ContractListing]:
+        """
+        Get the listings matching a filter from the index, as stored on the contract
+
+        :param seller: optional address of the seller of the listings
+        :param asset_contract: optional address of the contract of the listed assets
+        :param token_id: optional token ID of the listed assets
+        :param currency: optional address of the currency of the listings
+        :param min_price: optional minimum buyout price per token in wei
+        :param max_price: optional maximum buyout price per token in wei
+        :return: the matching listings, in ascending listing ID order
+        """
+
+        with self._lock:
+            return self._store.query(
+                Web3.toChecksumAddress(seller) if seller else None,
+                Web3.toChecksumAddress(asset_contract) if asset_contract else None,
+                token_id,
+                Web3.toChecksumAddress(currency) if currency else None,
+                min_price,
+                max_price,
+            )
+
+    def get_listings(
+        self,
+        seller: Optional[str] = None,
+        asset_contract: Optional[str] = None,
+        token_id: Optional[int] = None,
+        currency: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        active_only: bool = False,
+    ) -> List[Union[DirectListing, AuctionListing]]:
+        """
+        Get the listings matching a filter, with the metadata of their assets.
+        Direct listings whose seller no longer holds or approved the asset are left out.
+
+        :param seller: optional address of the seller of the listings
+        :param asset_contract: optional address of the contract of the listed assets
+        :param token_id: optional token ID of the listed assets
+        :param currency: optional address of the currency of the listings
+        :param min_price: optional minimum buyout price per token in wei
+        :param max_price: optional maximum buyout price per token in wei
+        :param active_only: whether to only return auctions that haven't ended and direct listings with tokens left
+        :return: the matching listings, in ascending listing ID order
+        """
+
+        raw_listings = self.get_raw_listings(
+            seller, asset_contract, token_id, currency, min_price, max_price
+        )
+
+        if active_only:
+            now = int(time())
+            raw_listings = [
+                listing
+                for listing in raw_listings
+                if (
+                    ListingType(listing.listing_type) == ListingType.AUCTION
+                    and listing.end_time > now
+                )
+                or (
+                    ListingType(listing.listing_type) == ListingType.DIRECT
+                    and listing.quantity > 0
+                )
+            ]
+
+        return self._map_listings(raw_listings)
+
+    def get_total_count(self) -> int:
+        """
+        Get the number of listings in the index
+
+        :return: the number of listings
+        """
+
+        with self._lock:
+            return self._store.count()
+
+    def close(self):
+        """
+        Close the connection to the database of the index, if it has one
+        """
+
+        with self._lock:
+            self._store.close()
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _apply(self, event: AttributeDict) -> int:
+        listing_id = cast(Any, event["args"])["listingId"]
+        self._dirty.add(listing_id)
+        return listing_id
+
+    def _revert(self, listing_id: int):
+        self._dirty.add(listing_id)
+
+    def _on_synced(self, block: int):
+        listing_ids = sorted(self._dirty)
+        results = self._contract_wrapper.multi_call_read(
+            [("listings", [listing_id]) for listing_id in listing_ids],
+            block_identifier=block,
+        )
+
+        for listing_id, result in zip(listing_ids, results):
+            if not result.success:
+                raise cast(Exception, result.error)
+
+            listing = ContractListing(*result.data)
+            if listing.asset_contract == ZERO_ADDRESS:
+                self._store.delete(listing_id)
+            else:
+                self._store.put(listing)
+
+        self._store.commit(block)
+        self._dirty.clear()
+
+
+class _MemoryListingStore:
+    _listings: Dict[int, ContractListing]
+    _by_seller: Dict[str, Set[int]]
+    _by_asset_contract: Dict[str, Set[int]]
+    _by_asset: Dict[Tuple[str, int], Set[int]]
+    _by_currency: Dict[str, Set[int]]
+    # (buyout price per token, listing ID) of every listing, sorted for range queries
+    _by_price: List[Tuple[int, int]]
+
+    def __init__(self):
+        self._listings = {}
+        self._by_seller = {}
+        self._by_asset_contract = {}
+        self._by_asset = {}
+        self._by_currency = {}
+        self._by_price = []
+
+    def put(self, listing: ContractListing):
+        self.delete(listing.listing_id)
+        self._listings[listing.listing_id] = listing
+        for index, key in self._index_keys(listing):
+            index.setdefault(key, set()).add(listing.listing_id)
+        insort(self._by_price, (listing.buyout_price_per_token, listing.listing_id))
+
+    def delete(self, listing_id: int):
+        listing = self._listings.pop(listing_id, None)
+        if listing is None:
+            return
+
+        for index, key in self._index_keys(listing):
+            index[key].discard(listing_id)
+            if len(index[key]) == 0:
+                del index[key]
+        del self._by_price[
+            bisect_left(self._by_price, (listing.buyout_price_per_token, listing_id))
+        ]
+
+    def query(
+        self,
+        seller: Optional[str],
+        asset_contract: Optional[str],
+        token_id: Optional[int],
+        currency: Optional[str],
+        min_price: Optional[int],
+        max_price: Optional[int],
+    ) -> List[ContractListing]:
+        indexes: List[Tuple[Dict[Any, Set[int]], Any]] = [
+            (self._by_seller, seller),
+            (self._by_currency, currency),
+        ]
+        if asset_contract is not None and token_id is not None:
+            indexes.append((self._by_asset, (asset_contract, token_id)))
+        else:
+            indexes.append((self._by_asset_contract, asset_contract))
+
+        candidates: Optional[Set[int]] = None
+        for index, key in indexes:
+            if key is not None:
+                ids = index.get(key, set())
+                candidates = ids if candidates is None else candidates & ids
+
+        if min_price is not None or max_price is not None:
+            low = (
+                bisect_left(self._by_price, (min_price, -1))
+                if min_price is not None
+                else 0
+            )
+            high = (
+                bisect_left(self._by_price, (max_price + 1, -1))
+                if max_price is not None
+                else len(self._by_price)
+            )
+            ids = {listing_id for _, listing_id in self._by_price[low:high]}
+            candidates = ids if candidates is None else candidates & ids
+
+        listing_ids = candidates if candidates is not None else self._listings.keys()
+        listings = [self._listings[listing_id] for listing_id in sorted(listing_ids)]
+
+        # Token IDs are only indexed together with their asset contract
+        if token_id is not None and asset_contract is None:
+            listings = [listing for listing in listings if listing.token_id == token_id]
+
+        return listings
+
+    def _index_keys(
+        self, listing: ContractListing
+    ) -> List[Tuple[Dict[Any, Set[int]], Any]]:
+        return [
+            (self._by_seller, listing.token_owner),
+            (self._by_asset_contract, listing.asset_contract),
+            (self._by_asset, (listing.asset_contract, listing.token_id)),
+            (self._by_currency, listing.currency),
+        ]
+
+    def count(self) -> int:
+        return len(self._listings)
+
+    def commit(self, block: int):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _SQLiteListingStore:
+    _connection: sqlite3.Connection
+
+    def __init__(self, database_path: str, contract_address: str):
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS listings (
+                listing_id INTEGER PRIMARY KEY,
+                token_owner TEXT NOT NULL,
+                asset_contract TEXT NOT NULL,
+                token_id TEXT NOT NULL,
+                start_time TEXT NOT NULL,
+                end_time TEXT NOT NULL,
+                quantity TEXT NOT NULL,
+                currency TEXT NOT NULL,
+                reserve_price_per_token TEXT NOT NULL,
+                buyout_price_per_token TEXT NOT NULL,
+                token_type INTEGER NOT NULL,
+                listing_type INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS listings_token_owner ON listings (token_owner);
+            CREATE INDEX IF NOT EXISTS listings_asset ON listings (asset_contract, token_id);
+            CREATE INDEX IF NOT EXISTS listings_currency_price ON listings (currency, buyout_price_per_token);
+            """
+        )
+
+        meta = dict(self._connection.execute("SELECT key, value FROM meta").fetchall())
+        if "contract_address" not in meta:
+            self._connection.execute(
+                "INSERT INTO meta (key, value) VALUES ('contract_address', ?)",
+                (contract_address.lower(),),
+            )
+            self._connection.commit()
+        elif meta["contract_address"] != contract_address.lower():
+            raise Exception(
+                f"The index database belongs to contract {meta['contract_address']}, not {contract_address}"
+            )
+
+    def get_cursor(self) -> Optional[int]:
+        row = self._connection.execute(
+            "SELECT value FROM meta WHERE key = 'cursor'"
+        ).fetchone()
+        return int(row[0]) if row is not None else None
+
+    def put(self, listing: ContractListing):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                listing.listing_id,
+                listing.token_owner,
+                listing.asset_contract,
+                _pad(listing.token_id),
+                _pad(listing.start_time),
+                _pad(listing.end_time),
+                _pad(listing.quantity),
+                listing.currency,
+                _pad(listing.reserve_price_per_token),
+                _pad(listing.buyout_price_per_token),
+                listing.token_type,
+                listing.listing_type,
+            ),
+        )
+
+    def delete(self, listing_id: int):
+        self._connection.execute(
+            "DELETE FROM listings WHERE listing_id = ?", (listing_id,)
+        )
+
+    def query(
+        self,
+        seller: Optional[str],
+        asset_contract: Optional[str],
+        token_id: Optional[int],
+        currency: Optional[str],
+        min_price: Optional[int],
+        max_price: Optional[int],
+    ) -> List[ContractListing]:
+        conditions = []
+        params: List[Any] = []
+        for condition, value in [
+            ("token_owner = ?", seller),
+            ("asset_contract = ?", asset_contract),
+            ("token_id = ?", _pad(token_id) if token_id is not None else None),
+            ("currency = ?", currency),
+            ("buyout_price_per_token >= ?", _pad(min_price) if min_price is not None else None),
+            ("buyout_price_per_token <= ?", _pad(max_price) if max_price is not None else None),
+        ]:
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+
+        where = f" WHERE {' AND '.join(conditions)}" if len(conditions) > 0 else ""
+        rows = self._connection.execute(
+            f"SELECT * FROM listings{where} ORDER BY listing_id", params
+        ).fetchall()
+
+        return [
+            ContractListing(
+                row[0],
+                row[1],
+                row[2],
+                int(row[3]),
+                int(row[4]),
+                int(row[5]),
+                int(row[6]),
+                row[7],
+                int(row[8]),
+                int(row[9]),
+                row[10],
+                row[11],
+            )
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def commit(self, block: int):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('cursor', ?)", (str(block),)
+        )
+        self._connection.commit()
+
+    def rollback(self):
+        self._connection.rollback()
+
+    def close(self):
+        self._connection.close()
+
+
+def _pad(value: int) -> str:
+    # uint256 values are stored as fixed width text so they compare numerically
+    return str(value).zfill(78)
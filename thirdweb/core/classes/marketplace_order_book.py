@@ -0,0 +1,406 @@
+from bisect import bisect_left, insort
+from heapq import heappop, heappush
+from threading import Lock
+from time import time
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.constants.events import DEFAULT_REORG_DEPTH
+from thirdweb.core.classes.contract_events import ContractEvents
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.event_index import EventIndex
+from thirdweb.types.marketplace import ContractListing, ContractOffer, ListingType
+from web3 import Web3
+from web3.datastructures import AttributeDict
+
+
+class MarketplaceOrderBook(EventIndex):
+    """
+    Live order book of the offers on direct listings and the winning bids on
+    auction listings of a marketplace, built from its events.
+
+    Offers are kept sorted by price per token, per listing and per asset, in a
+    separate book for each currency, so best offer, depth and top offer queries
+    are answered from memory without any RPC. Every offer event marks the offer
+    as changed, and changed offers are read back from the contract at the end of
+    each sync. Offers expire at their own expiration or at the end of their
+    listing, whichever comes first, and expired offers are pruned from the books
+    on every sync and before every query. Call follow to keep the book synced with the chain head.
+
+    Each book is a sorted list: finding an offer takes O(log n) comparisons, but
+    inserting or removing one shifts the list in O(n), which is a fast memmove
+    for books of up to tens of thousands of offers. Top offer and depth queries
+    take O(k) for k offers or levels, plus the pruning of any offer that expired
+    since the last sync.
+
+    ```python
+    book = contract.get_order_book()
+    book.sync()
+    book.follow()
+
+    best_offer = book.get_best_offer(0)
+    top_offers = book.get_top_offers_for_asset("{{asset_address}}", 0, "{{currency_address}}", 10)
+    ```
+    """
+
+    _contract_wrapper: ContractWrapper
+    _listings: Dict[int, ContractListing]
+    _offers: Dict[int, Dict[str, ContractOffer]]
+    _by_listing: Dict[Tuple[int, str], "_OfferBook"]
+    _by_asset: Dict[Tuple[str, int, str], "_OfferBook"]
+    _dirty: Set[Tuple[int, Optional[str]]]
+    _book_lock: Lock
+
+    def __init__(
+        self,
+        contract_wrapper: ContractWrapper,
+        start_block: int = 0,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ):
+        """
+        Initializes the order book.
+
+        :param contract_wrapper: contract wrapper of the marketplace to index
+        :param start_block: block to start indexing from, usually the deployment block of the contract
+        :param reorg_depth: number of most recent blocks to replay on every sync
+        """
+
+        super().__init__(
+            ContractEvents(contract_wrapper),
+            [
+                "ListingUpdated",
+                "ListingRemoved",
+                "NewSale",
+                "NewOffer",
+                "AuctionClosed",
+            ],
+            start_block,
+            reorg_depth,
+        )
+        self._contract_wrapper = contract_wrapper
+        self._listings = {}
+        self._offers = {}
+        self._by_listing = {}
+        self._by_asset = {}
+        self._dirty = set()
+        # Queries only wait for the book to be updated, not for the reads of a sync
+        self._book_lock = Lock()
+
+    def get_offers(self, listing_id: int) -> List[ContractOffer]:
+        """
+        Get every offer on a listing, in any currency
+
+        :param listing_id: ID of the listing
+        :return: the offers on the listing, highest price per token first
+        """
+
+        with self._book_lock:
+            offers = list(self._offers.get(listing_id, {}).values())
+
+        return sorted(offers, key=lambda offer: -offer.price_per_token)
+
+    def get_best_offer(
+        self, listing_id: int, currency: Optional[str] = None
+    ) -> Optional[ContractOffer]:
+        """
+        Get the highest unexpired offer on a listing
+
+        :param listing_id: ID of the listing
+        :param currency: optional address of the currency of the offer, defaults to the currency of the listing
+        :return: the best offer, or None if the listing has no offers
+        """
+
+        offers = self.get_top_offers(listing_id, 1, currency)
+        return offers[0] if len(offers) > 0 else None
+
+    def get_top_offers(
+        self, listing_id: int, count: int, currency: Optional[str] = None
+    ) -> List[ContractOffer]:
+        """
+        Get the highest unexpired offers on a listing
+
+        :param listing_id: ID of the listing
+        :param count: maximum number of offers to return
+        :param currency: optional address of the currency of the offers, defaults to the currency of the listing
+        :return: the offers, highest price per token first
+        """
+
+        with self._book_lock:
+            book = self._by_listing.get((listing_id, self._currency(listing_id, currency)))
+            return book.top(count, int(time())) if book is not None else []
+
+    def get_depth(
+        self, listing_id: int, levels: int, currency: Optional[str] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the quantity wanted at each of the highest price levels of a listing
+
+        :param listing_id: ID of the listing
+        :param levels: maximum number of price levels to return
+        :param currency: optional address of the currency of the offers, defaults to the currency of the listing
+        :return: list of price per token in wei and total quantity wanted at that price, highest price first
+        """
+
+        with self._book_lock:
+            book = self._by_listing.get((listing_id, self._currency(listing_id, currency)))
+            return book.depth(levels, int(time())) if book is not None else []
+
+    def get_best_offer_for_asset(
+        self, asset_contract: str, token_id: int, currency: str
+    ) -> Optional[ContractOffer]:
+        """
+        Get the highest unexpired offer across every listing of an asset
+
+        :param asset_contract: address of the contract of the asset
+        :param token_id: token ID of the asset
+        :param currency: address of the currency of the offer
+        :return: the best offer, or None if the asset has no offers in the currency
+        """
+
+        offers = self.get_top_offers_for_asset(asset_contract, token_id, currency, 1)
+        return offers[0] if len(offers) > 0 else None
+
+    def get_top_offers_for_asset(
+        self, asset_contract: str, token_id: int, currency: str, count: int
+    ) -> List[ContractOffer]:
+        """
+        Get the highest unexpired offers across every listing of an asset
+
+        :param asset_contract: address of the contract of the asset
+        :param token_id: token ID of the asset
+        :param currency: address of the currency of the offers
+        :param count: maximum number of offers to return
+        :return: the offers, highest price per token first
+        """
+
+        with self._book_lock:
+            book = self._by_asset.get(self._asset_key(asset_contract, token_id, currency))
+            return book.top(count, int(time())) if book is not None else []
+
+    def get_depth_for_asset(
+        self, asset_contract: str, token_id: int, currency: str, levels: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the quantity wanted at each of the highest price levels of an asset,
+        across every listing of the asset
+
+        :param asset_contract: address of the contract of the asset
+        :param token_id: token ID of the asset
+        :param currency: address of the currency of the offers
+        :param levels: maximum number of price levels to return
+        :return: list of price per token in wei and total quantity wanted at that price, highest price first
+        """
+
+        with self._book_lock:
+            book = self._by_asset.get(self._asset_key(asset_contract, token_id, currency))
+            return book.depth(levels, int(time())) if book is not None else []
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _apply(self, event: AttributeDict) -> Tuple[int, Optional[str]]:
+        args: Any = event["args"]
+        # Offers only change for their offeror, other events can change them all
+        offeror = args["offeror"] if event["event"] == "NewOffer" else None
+        self._dirty.add((args["listingId"], offeror))
+        return (args["listingId"], offeror)
+
+    def _revert(self, undo: Tuple[int, Optional[str]]):
+        self._dirty.add(undo)
+
+    def _on_synced(self, block: int):
+        listing_ids = sorted({listing_id for listing_id, _ in self._dirty})
+        reads = self._contract_wrapper.multi_call_read(
+            [("listings", [listing_id]) for listing_id in listing_ids],
+            block_identifier=block,
+        )
+
+        listings: Dict[int, Optional[ContractListing]] = {}
+        calls: List[Tuple[str, List[Any]]] = []
+        for listing_id, read in zip(listing_ids, reads):
+            if not read.success:
+                raise cast(Exception, read.error)
+
+            read_listing = ContractListing(*read.data)
+            if read_listing.asset_contract == ZERO_ADDRESS or read_listing.quantity == 0:
+                listings[listing_id] = None
+            elif ListingType(read_listing.listing_type) == ListingType.AUCTION:
+                listings[listing_id] = read_listing
+                calls.append(("winningBid", [listing_id]))
+            else:
+                listings[listing_id] = read_listing
+                offerors = {
+                    offeror
+                    for dirty_id, offeror in self._dirty
+                    if dirty_id == listing_id and offeror is not None
+                }
+                if (listing_id, None) in self._dirty:
+                    offerors.update(self._offers.get(listing_id, {}).keys())
+                calls.extend(("offers", [listing_id, offeror]) for offeror in offerors)
+
+        reads = self._contract_wrapper.multi_call_read(calls, block_identifier=block)
+        offers: List[Tuple[int, ContractOffer]] = []
+        for (_, args), read in zip(calls, reads):
+            if not read.success:
+                raise cast(Exception, read.error)
+            offers.append((args[0], ContractOffer(*read.data)))
+
+        with self._book_lock:
+            for listing_id, listing in listings.items():
+                if listing is None:
+                    for offer in list(self._offers.get(listing_id, {}).values()):
+                        self._remove_offer(offer)
+                    self._listings.pop(listing_id, None)
+                    continue
+
+                self._listings[listing_id] = listing
+                if ListingType(listing.listing_type) == ListingType.AUCTION:
+                    # Only the winning bid of an auction stands, earlier bids are refunded
+                    for offer in list(self._offers.get(listing_id, {}).values()):
+                        self._remove_offer(offer)
+
+            for listing_id, offer in offers:
+                existing = self._offers.get(listing_id, {}).get(offer.offeror)
+                if existing is not None:
+                    self._remove_offer(existing)
+                if offer.offeror != ZERO_ADDRESS and offer.quantity_wanted > 0:
+                    self._add_offer(offer)
+
+            self._prune(int(time()))
+
+        self._dirty.clear()
+
+    def _add_offer(self, offer: ContractOffer):
+        self._offers.setdefault(offer.listing_id, {})[offer.offeror] = offer
+        # Bids never expire on their own, they stop standing when the listing ends
+        expires_at = offer.expiration_timestamp
+        end_time = self._listings[offer.listing_id].end_time
+        if end_time > 0:
+            expires_at = min(expires_at, end_time)
+
+        for books, key in self._books_of(offer):
+            books.setdefault(key, _OfferBook()).add(offer, expires_at)
+
+    def _remove_offer(self, offer: ContractOffer):
+        offers = self._offers[offer.listing_id]
+        del offers[offer.offeror]
+        if len(offers) == 0:
+            del self._offers[offer.listing_id]
+
+        for books, key in self._books_of(offer):
+            # The book is already gone if the offer expired and was pruned
+            book = books.get(key)
+            if book is None:
+                continue
+
+            book.remove(offer)
+            if len(book) == 0:
+                del books[key]
+
+    def _books_of(
+        self, offer: ContractOffer
+    ) -> List[Tuple[Dict[Any, "_OfferBook"], Any]]:
+        listing = self._listings[offer.listing_id]
+        return [
+            (self._by_listing, (offer.listing_id, offer.currency)),
+            (self._by_asset, (listing.asset_contract, listing.token_id, offer.currency)),
+        ]
+
+    def _prune(self, now: int):
+        # Expired offers stay in _offers, they are only dropped from the sorted books
+        books: List[Dict[Any, _OfferBook]] = [self._by_listing, self._by_asset]
+        for by_key in books:
+            for key, book in list(by_key.items()):
+                book.prune(now)
+                if len(book) == 0:
+                    del by_key[key]
+
+    def _currency(self, listing_id: int, currency: Optional[str]) -> str:
+        if currency is not None:
+            return Web3.toChecksumAddress(currency)
+
+        listing = self._listings.get(listing_id)
+        return listing.currency if listing is not None else ZERO_ADDRESS
+
+    def _asset_key(
+        self, asset_contract: str, token_id: int, currency: str
+    ) -> Tuple[str, int, str]:
+        return (
+            Web3.toChecksumAddress(asset_contract),
+            token_id,
+            Web3.toChecksumAddress(currency),
+        )
+
+
+class _OfferBook:
+    """
+    Offers of one book sorted by price per token, with a heap of the times they
+    stop standing so expired offers are pruned without a scan.
+    """
+
+    _keys: List[Tuple[int, int, str]]
+    _offers: Dict[Tuple[int, int, str], ContractOffer]
+    _expires_at: Dict[Tuple[int, int, str], int]
+    _expirations: List[Tuple[int, Tuple[int, int, str]]]
+
+    def __init__(self):
+        self._keys = []
+        self._offers = {}
+        self._expires_at = {}
+        self._expirations = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, offer: ContractOffer, expires_at: int):
+        key = self._key(offer)
+        insort(self._keys, key)
+        self._offers[key] = offer
+        self._expires_at[key] = expires_at
+        heappush(self._expirations, (expires_at, key))
+
+    def remove(self, offer: ContractOffer):
+        key = self._key(offer)
+        if key not in self._offers:
+            return
+
+        del self._keys[bisect_left(self._keys, key)]
+        del self._offers[key]
+        del self._expires_at[key]
+        # Heap entries of removed offers are dropped lazily, compact once most are stale
+        if len(self._expirations) > 2 * len(self._keys) + 16:
+            self._expirations = [
+                (expiration, live_key)
+                for expiration, live_key in self._expirations
+                if self._expires_at.get(live_key) == expiration
+            ]
+            self._expirations.sort()
+
+    def prune(self, now: int):
+        while len(self._expirations) > 0 and self._expirations[0][0] <= now:
+            expiration, key = heappop(self._expirations)
+            # Skip stale entries of offers that were removed or replaced since
+            if self._expires_at.get(key) == expiration:
+                self.remove(self._offers[key])
+
+    def top(self, count: int, now: int) -> List[ContractOffer]:
+        self.prune(now)
+        return [self._offers[key] for key in self._keys[:count]]
+
+    def depth(self, levels: int, now: int) -> List[Tuple[int, int]]:
+        self.prune(now)
+        depth: List[Tuple[int, int]] = []
+        for key in self._keys:
+            offer = self._offers[key]
+            if len(depth) > 0 and depth[-1][0] == offer.price_per_token:
+                depth[-1] = (offer.price_per_token, depth[-1][1] + offer.quantity_wanted)
+            elif len(depth) == levels:
+                break
+            else:
+                depth.append((offer.price_per_token, offer.quantity_wanted))
+
+        return depth
+
+    def _key(self, offer: ContractOffer) -> Tuple[int, int, str]:
+        # Highest price first, ties broken by listing and offeror
+        return (-offer.price_per_token, offer.listing_id, offer.offeror)
@@ -0,0 +1,146 @@
+from typing import Iterator, List, Optional
+from web3 import Web3
+from thirdweb.abi.direct_listings_logic import DirectListingsLogic, IDirectListingsListing
+from thirdweb.common.currency import fetch_currency_value
+from thirdweb.common.error import ListingNotFoundException
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
+from thirdweb.core.classes.marketplace_v3_extension import MarketplaceV3Extension
+from thirdweb.types.marketplace import DirectListingV3, ListingStatus
+from thirdweb.types.nft import NFTMetadata
+
+
+class DirectListings(MarketplaceV3Extension[DirectListingsLogic, DirectListingV3]):
+    """
+    Read the direct listings of a marketplace V3 contract.
+
+    Bulk reads use the contract's range getters, so a page of listings costs a
+    single call, and pages are fetched concurrently.
+
+    ```python
+    contract = sdk.get_marketplace_v3("{{contract_address}}")
+    listings = contract.direct_listings.get_all_valid()
+    ```
+    """
+
+    _id_key = "listingId"
+
+    """
+    READ FUNCTIONS
+    """
+
+    def get_total_count(self) -> int:
+        """
+        Get the total number of direct listings ever created
+
+        :return: the number of direct listings
+        """
+
+        return self._contract_wrapper._contract_abi.total_listings.call()
+
+    def get_listing(self, listing_id: int) -> DirectListingV3:
+        """
+        Get a direct listing by ID
+
+        :param listing_id: ID of the listing to get
+        :return: the listing
+        """
+
+        raw_listing = self._contract_wrapper._contract_abi.get_listing.call(listing_id)
+        return self._get_item(
+            raw_listing, listing_id, ListingNotFoundException(listing_id)
+        )
+
+    def get_all(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[DirectListingV3]:
+        """
+        Get all the direct listings in a range of IDs
+
+        ```python
+        listings = contract.direct_listings.get_all()
+        ```
+
+        :param start: ID of the first listing to get
+        :param end: ID after the last listing to get, defaults to the total count
+        :param page_size: number of listings to fetch per call
+        :return: the listings, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_listings.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def get_all_valid(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[DirectListingV3]:
+        """
+        Get the direct listings in a range of IDs that can currently be bought
+
+        ```python
+        listings = contract.direct_listings.get_all_valid()
+        ```
+
+        :param start: ID of the first listing to get
+        :param end: ID after the last listing to get, defaults to the total count
+        :param page_size: number of listings to fetch per call
+        :return: the valid listings, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_valid_listings.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[DirectListingV3]:
+        """
+        Iterate over all the direct listings page by page, fetching the next page in
+        the background
+
+        ```python
+        for listing in contract.direct_listings.iter_all():
+            print(listing.id)
+        ```
+
+        :param page_size: number of listings to fetch per call
+        :return: iterator over the listings, in ascending ID order
+        """
+
+        return self._iter_range(
+            self._contract_wrapper._contract_abi.get_all_listings.call, page_size
+        )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _map_item(
+        self, raw: IDirectListingsListing, asset: NFTMetadata, provider: Web3
+    ) -> DirectListingV3:
+        return DirectListingV3(
+            id=raw["listingId"],
+            creator_address=raw["listingCreator"],
+            asset_contract_address=raw["assetContract"],
+            token_id=raw["tokenId"],
+            asset=asset,
+            quantity=raw["quantity"],
+            currency_contract_address=raw["currency"],
+            price_per_token=raw["pricePerToken"],
+            currency_value_per_token=fetch_currency_value(
+                provider, raw["currency"], raw["pricePerToken"]
+            ),
+            start_time_in_seconds=raw["startTimestamp"],
+            end_time_in_seconds=raw["endTimestamp"],
+            is_reserved_listing=raw["reserved"],
+            status=ListingStatus(raw["status"]),
+        )
@@ -0,0 +1,151 @@
+from typing import Iterator, List, Optional
+from web3 import Web3
+from thirdweb.abi.english_auctions_logic import EnglishAuctionsLogic, IEnglishAuctionsAuction
+from thirdweb.common.currency import fetch_currency_value
+from thirdweb.common.error import ListingNotFoundException
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
+from thirdweb.core.classes.marketplace_v3_extension import MarketplaceV3Extension
+from thirdweb.types.marketplace import EnglishAuction, ListingStatus
+from thirdweb.types.nft import NFTMetadata
+
+
+class EnglishAuctions(MarketplaceV3Extension[EnglishAuctionsLogic, EnglishAuction]):
+    """
+    Read the English auctions of a marketplace V3 contract.
+
+    Bulk reads use the contract's range getters, so a page of auctions costs a
+    single call, and pages are fetched concurrently.
+
+    ```python
+    contract = sdk.get_marketplace_v3("{{contract_address}}")
+    auctions = contract.english_auctions.get_all_valid()
+    ```
+    """
+
+    _id_key = "auctionId"
+
+    """
+    READ FUNCTIONS
+    """
+
+    def get_total_count(self) -> int:
+        """
+        Get the total number of English auctions ever created
+
+        :return: the number of auctions
+        """
+
+        return self._contract_wrapper._contract_abi.total_auctions.call()
+
+    def get_auction(self, auction_id: int) -> EnglishAuction:
+        """
+        Get an English auction by ID
+
+        :param auction_id: ID of the auction to get
+        :return: the auction
+        """
+
+        raw_auction = self._contract_wrapper._contract_abi.get_auction.call(auction_id)
+        return self._get_item(
+            raw_auction, auction_id, ListingNotFoundException(auction_id)
+        )
+
+    def get_all(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[EnglishAuction]:
+        """
+        Get all the English auctions in a range of IDs
+
+        ```python
+        auctions = contract.english_auctions.get_all()
+        ```
+
+        :param start: ID of the first auction to get
+        :param end: ID after the last auction to get, defaults to the total count
+        :param page_size: number of auctions to fetch per call
+        :return: the auctions, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_auctions.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def get_all_valid(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[EnglishAuction]:
+        """
+        Get the English auctions in a range of IDs that are currently accepting bids
+
+        ```python
+        auctions = contract.english_auctions.get_all_valid()
+        ```
+
+        :param start: ID of the first auction to get
+        :param end: ID after the last auction to get, defaults to the total count
+        :param page_size: number of auctions to fetch per call
+        :return: the valid auctions, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_valid_auctions.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[EnglishAuction]:
+        """
+        Iterate over all the English auctions page by page, fetching the next page in
+        the background
+
+        ```python
+        for auction in contract.english_auctions.iter_all():
+            print(auction.id)
+        ```
+
+        :param page_size: number of auctions to fetch per call
+        :return: iterator over the auctions, in ascending ID order
+        """
+
+        return self._iter_range(
+            self._contract_wrapper._contract_abi.get_all_auctions.call, page_size
+        )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _map_item(
+        self, raw: IEnglishAuctionsAuction, asset: NFTMetadata, provider: Web3
+    ) -> EnglishAuction:
+        return EnglishAuction(
+            id=raw["auctionId"],
+            creator_address=raw["auctionCreator"],
+            asset_contract_address=raw["assetContract"],
+            token_id=raw["tokenId"],
+            asset=asset,
+            quantity=raw["quantity"],
+            currency_contract_address=raw["currency"],
+            minimum_bid_amount=raw["minimumBidAmount"],
+            minimum_bid_currency_value=fetch_currency_value(
+                provider, raw["currency"], raw["minimumBidAmount"]
+            ),
+            buyout_bid_amount=raw["buyoutBidAmount"],
+            buyout_currency_value=fetch_currency_value(
+                provider, raw["currency"], raw["buyoutBidAmount"]
+            ),
+            time_buffer_in_seconds=raw["timeBufferInSeconds"],
+            bid_buffer_bps=raw["bidBufferBps"],
+            start_time_in_seconds=raw["startTimestamp"],
+            end_time_in_seconds=raw["endTimestamp"],
+            status=ListingStatus(raw["status"]),
+        )
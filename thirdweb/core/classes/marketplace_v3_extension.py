@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, Iterator, List, Optional, TypeVar
+from web3 import Web3
+from thirdweb.common.marketplace import fetch_assets_metadata
+from thirdweb.common.pagination import fetch_pages, iter_pages
+from thirdweb.constants.currency import ZERO_ADDRESS
+from thirdweb.core.classes.base_contract import BaseContract
+from thirdweb.core.classes.contract_wrapper import ContractWrapper
+from thirdweb.core.classes.ipfs_storage import IpfsStorage
+from thirdweb.types.contract import TContractABI
+from thirdweb.types.multicall import BatchQueryResult
+from thirdweb.types.nft import NFTMetadata
+
+TItem = TypeVar("TItem")
+
+RangeGetter = Callable[[int, int], List[Any]]
+
+
+class MarketplaceV3Extension(
+    ABC, BaseContract[TContractABI], Generic[TContractABI, TItem]
+):
+    """
+    Base class for the extensions of a marketplace V3 contract, which read their
+    items with range getters and resolve the asset of each item in bulk.
+    """
+
+    _storage: IpfsStorage
+    # Name of the ID field of the raw items of the extension
+    _id_key: str
+
+    def __init__(self, contract_wrapper: ContractWrapper, storage: IpfsStorage):
+        super().__init__(contract_wrapper)
+        self._storage = storage
+
+    @abstractmethod
+    def get_total_count(self) -> int:
+        """
+        Get the total number of items ever created on the extension
+        """
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    @abstractmethod
+    def _map_item(self, raw: Any, asset: NFTMetadata, provider: Web3) -> TItem:
+        pass
+
+    def _get_item(self, raw: Any, id: int, not_found: Exception) -> TItem:
+        if raw["assetContract"] == ZERO_ADDRESS:
+            raise not_found
+
+        result = self._map_items([raw])
+        if id in result.failures:
+            raise result.failures[id]
+
+        return result.items[0]
+
+    def _get_range(
+        self, fetch: RangeGetter, start: int, end: Optional[int], page_size: int
+    ) -> List[TItem]:
+        if end is None:
+            end = self.get_total_count()
+
+        # The range getters take an inclusive end ID
+        raw_items = fetch_pages(
+            lambda page_start, count: fetch(page_start, page_start + count - 1),
+            start,
+            end,
+            page_size,
+        )
+
+        return self._map_items(raw_items).items
+
+    def _iter_range(self, fetch: RangeGetter, page_size: int) -> Iterator[TItem]:
+        return iter_pages(
+            lambda start, count: self._map_items(fetch(start, start + count - 1)).items,
+            0,
+            self.get_total_count(),
+            page_size,
+        )
+
+    def _map_items(self, raw_items: List[Any]) -> BatchQueryResult[TItem]:
+        provider = self._contract_wrapper.get_provider()
+        metadata, failures = fetch_assets_metadata(
+            provider,
+            [
+                (raw["assetContract"], raw["tokenId"], raw["tokenType"])
+                for raw in raw_items
+            ],
+            self._storage,
+        )
+
+        result: BatchQueryResult[TItem] = BatchQueryResult()
+        for raw in raw_items:
+            key = (raw["assetContract"].lower(), raw["tokenId"])
+            if key not in metadata:
+                result.failures[raw[self._id_key]] = failures[key]
+                continue
+
+            result.items.append(self._map_item(raw, metadata[key], provider))
+
+        return result
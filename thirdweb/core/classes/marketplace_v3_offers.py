@@ -0,0 +1,142 @@
+from typing import Iterator, List, Optional
+from web3 import Web3
+from thirdweb.abi.offers_logic import IOffersOffer, OffersLogic
+from thirdweb.common.currency import fetch_currency_value
+from thirdweb.common.error import NotFoundException
+from thirdweb.constants.contract import DEFAULT_PAGE_SIZE
+from thirdweb.core.classes.marketplace_v3_extension import MarketplaceV3Extension
+from thirdweb.types.marketplace import ListingStatus, OfferV3
+from thirdweb.types.nft import NFTMetadata
+
+
+class Offers(MarketplaceV3Extension[OffersLogic, OfferV3]):
+    """
+    Read the offers made on a marketplace V3 contract.
+
+    Bulk reads use the contract's range getters, so a page of offers costs a
+    single call, and pages are fetched concurrently.
+
+    ```python
+    contract = sdk.get_marketplace_v3("{{contract_address}}")
+    offers = contract.offers.get_all_valid()
+    ```
+    """
+
+    _id_key = "offerId"
+
+    """
+    READ FUNCTIONS
+    """
+
+    def get_total_count(self) -> int:
+        """
+        Get the total number of offers ever made
+
+        :return: the number of offers
+        """
+
+        return self._contract_wrapper._contract_abi.total_offers.call()
+
+    def get_offer(self, offer_id: int) -> OfferV3:
+        """
+        Get an offer by ID
+
+        :param offer_id: ID of the offer to get
+        :return: the offer
+        """
+
+        raw_offer = self._contract_wrapper._contract_abi.get_offer.call(offer_id)
+        return self._get_item(raw_offer, offer_id, NotFoundException(str(offer_id)))
+
+    def get_all(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[OfferV3]:
+        """
+        Get all the offers in a range of IDs
+
+        ```python
+        offers = contract.offers.get_all()
+        ```
+
+        :param start: ID of the first offer to get
+        :param end: ID after the last offer to get, defaults to the total count
+        :param page_size: number of offers to fetch per call
+        :return: the offers, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_offers.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def get_all_valid(
+        self,
+        start: int = 0,
+        end: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> List[OfferV3]:
+        """
+        Get the offers in a range of IDs that can currently be accepted
+
+        ```python
+        offers = contract.offers.get_all_valid()
+        ```
+
+        :param start: ID of the first offer to get
+        :param end: ID after the last offer to get, defaults to the total count
+        :param page_size: number of offers to fetch per call
+        :return: the valid offers, in ascending ID order
+        """
+
+        return self._get_range(
+            self._contract_wrapper._contract_abi.get_all_valid_offers.call,
+            start,
+            end,
+            page_size,
+        )
+
+    def iter_all(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[OfferV3]:
+        """
+        Iterate over all the offers page by page, fetching the next page in
+        the background
+
+        ```python
+        for offer in contract.offers.iter_all():
+            print(offer.id)
+        ```
+
+        :param page_size: number of offers to fetch per call
+        :return: iterator over the offers, in ascending ID order
+        """
+
+        return self._iter_range(
+            self._contract_wrapper._contract_abi.get_all_offers.call, page_size
+        )
+
+    """
+    INTERNAL FUNCTIONS
+    """
+
+    def _map_item(
+        self, raw: IOffersOffer, asset: NFTMetadata, provider: Web3
+    ) -> OfferV3:
+        return OfferV3(
+            id=raw["offerId"],
+            offeror_address=raw["offeror"],
+            asset_contract_address=raw["assetContract"],
+            token_id=raw["tokenId"],
+            asset=asset,
+            quantity=raw["quantity"],
+            currency_contract_address=raw["currency"],
+            total_price=raw["totalPrice"],
+            currency_value=fetch_currency_value(
+                provider, raw["currency"], raw["totalPrice"]
+            ),
+            end_time_in_seconds=raw["expirationTimestamp"],
+            status=ListingStatus(raw["status"]),
+        )
@@ -1,11 +1,47 @@
-from typing import List, Optional, Dict
+from copy import deepcopy
+from threading import Lock
+from typing import Any, List, Optional, Dict
+from eth_utils import keccak
 from web3 import Web3
+from thirdweb.common.cache import JSONFileCache, LRUCache
 from thirdweb.common.currency import fetch_currency_metadata, convert_quantity_to_number
+from thirdweb.common.error import InvalidAddressException
+from thirdweb.constants.contract import DEFAULT_PROOF_CACHE_SIZE
 from thirdweb.constants.currency import ZERO_ADDRESS
 from thirdweb.core.classes.ipfs_storage import IpfsStorage
 from thirdweb.types.contracts.claim_conditions import ShardData, ShardedMerkleTreeInfo, SnapshotEntry, SnapshotEntryWithProof
 from thirdweb.common.merkle_tree import MerkleTree
 
+# Optional disk tier for snapshot files, which never change under their IPFS URI
+snapshot_file_cache: Optional[JSONFileCache] = None
+
+
+def set_snapshot_cache_dir(directory: Optional[str]):
+    """
+    Keep the snapshot info and shard files downloaded for claims in a directory,
+    so later processes don't download them again.
+
+    :param directory: path of the directory to store the files in, or None to stop storing them
+    """
+
+    global snapshot_file_cache
+    snapshot_file_cache = JSONFileCache(directory) if directory is not None else None
+
+
+def fetch_snapshot_file(storage: IpfsStorage, uri: str) -> Any:
+    file_cache = snapshot_file_cache
+    if file_cache is not None:
+        data = file_cache.get(uri)
+        if data is not None:
+            return data
+
+    data = storage.get(uri)
+    if file_cache is not None:
+        file_cache.set(uri, data)
+
+    return data
+
+
 class ShardedMerkleTree:
     storage: IpfsStorage
     base_uri: str
@@ -14,6 +50,11 @@ class ShardedMerkleTree:
     token_decimals: int
     shards: Dict[str, ShardData]
     trees: Dict[str, MerkleTree]
+    entries: Dict[str, Dict[str, SnapshotEntry]]
+    currency_decimals: Dict[str, int]
+    proofs: LRUCache[str, SnapshotEntryWithProof]
+    _shard_locks: Dict[str, Lock]
+    _shard_locks_lock: Lock
 
     def __init__(
         self,
@@ -30,6 +71,12 @@ class ShardedMerkleTree:
         self.token_decimals = token_decimals
         self.shards = {}
         self.trees = {}
+        self.entries = {}
+        self.currency_decimals = {}
+        self.proofs = LRUCache(DEFAULT_PROOF_CACHE_SIZE)
+        # Each shard is only downloaded and hashed once, even by concurrent claims
+        self._shard_locks = {}
+        self._shard_locks_lock = Lock()
     
     @staticmethod
     def from_info(metadata: ShardedMerkleTreeInfo, storage: IpfsStorage) -> "ShardedMerkleTree":
@@ -54,88 +101,122 @@ class ShardedMerkleTree:
         return cache[currency_address]
 
     def hash_entry(self, entry: SnapshotEntry, token_decimals: int, currency_decimals: int) -> str:
-        max_claimable = convert_quantity_to_number(entry.max_claimable, token_decimals)
-        entry_price = entry.price
+        return hash_snapshot_entry(entry, token_decimals, currency_decimals).hex()
 
-        if entry_price == "":
-            entry_price = "unlimited"
+    def get_proof(self, address: str, provider: Web3) -> Optional[SnapshotEntryWithProof]:
+        # Proofs are copied in and out of the memo, so callers can't change it
+        cached = self.proofs.get(address.lower())
+        if cached is not None:
+            return deepcopy(cached)
+
+        # Shard files are named after the lowercase address prefix
+        shard_id = address[2:self.shard_nybbles+2].lower()
+        shard = self._load_shard(shard_id, provider)
+        if shard is None:
+            return None
 
-        price = convert_quantity_to_number(entry_price, currency_decimals)
+        entry = self.entries[shard_id].get(address.lower())
+        if entry is None:
+            return None
 
-        currency_address = entry.currency_address
-        if currency_address == "":
-            currency_address = ZERO_ADDRESS
-        
-        hash: bytes = Web3.solidityKeccak(
-            ["address", "uint256", "uint256", "address"], 
-            [entry.address, max_claimable, price, currency_address]
+        currency_decimals = self.fetch_and_cache_decimals(
+            self.currency_decimals,
+            provider,
+            entry.currency_address
         )
+        leaf = hash_snapshot_entry(entry, self.token_decimals, currency_decimals)
 
-        return hash.hex()[2:]
+        proof: List[str] = []
+        merkle_proof = self.trees[shard_id].get_proof_bytes(leaf)
+        if merkle_proof is not None:
+            proof = [sibling.hex() for sibling, _ in merkle_proof]
 
-    def get_proof(self, address: str, provider: Web3) -> Optional[SnapshotEntryWithProof]:
-        shard_id = address[2:self.shard_nybbles+2]
-        shard: ShardData = self.shards.get(shard_id)
-        
-        currency_decimal_map: Dict[str, int] = {}
+        proof += shard.proofs
 
-        if shard is None:
-            uri = self.base_uri + "/" + shard_id + ".json"
+        entry_with_proof = SnapshotEntryWithProof(
+            address=entry.address,
+            max_claimable=entry.max_claimable,
+            price=entry.price,
+            currency_address=entry.currency_address,
+            proof=proof
+        )
+        self.proofs.set(address.lower(), deepcopy(entry_with_proof))
+
+        return entry_with_proof
+
+    def _load_shard(self, shard_id: str, provider: Web3) -> Optional[ShardData]:
+        shard = self.shards.get(shard_id)
+        if shard is not None:
+            return shard
+
+        with self._shard_locks_lock:
+            lock = self._shard_locks.setdefault(shard_id, Lock())
 
-            raw = {}
+        with lock:
+            # Another thread may have loaded the shard while this one waited
+            shard = self.shards.get(shard_id)
+            if shard is not None:
+                return shard
+
+            uri = self.base_uri + "/" + shard_id + ".json"
             try:
-                raw = self.storage.get(uri)
+                raw = fetch_snapshot_file(self.storage, uri)
             except:
                 return None
 
-            shard_data: ShardData = ShardData.from_json(raw)
-            self.shards[shard_id] = shard_data
-            shard = self.shards[shard_id]
-
-            hashed_entries: List[str] = []
-            for e in shard.entries:
-                currency_decimals = self.fetch_and_cache_decimals(currency_decimal_map, provider, e.currency_address)
-                hash = self.hash_entry(e, self.token_decimals, currency_decimals)
-                hashed_entries.append(hash)
+            shard = ShardData.from_json(raw)
 
+            # Decimals are resolved once per currency for the whole tree
             tree = MerkleTree()
-            for leaf in hashed_entries:
-                tree.add_leaf(leaf)
-
+            tree.add_leaf_bytes(
+                hash_snapshot_entry(
+                    e,
+                    self.token_decimals,
+                    self.fetch_and_cache_decimals(self.currency_decimals, provider, e.currency_address),
+                )
+                for e in shard.entries
+            )
             tree.make_tree()
+
+            self.entries[shard_id] = {e.address.lower(): e for e in shard.entries}
             self.trees[shard_id] = tree
+            # The shard is published last, so readers never see a half loaded shard
+            self.shards[shard_id] = shard
 
-        entry: Optional[SnapshotEntry] = None
-        for e in shard.entries:
-            if e.address.lower() == address.lower():
-                entry = e
-                break
+            return shard
 
-        if entry is None:
-            return None
 
-        currency_decimals = self.fetch_and_cache_decimals(
-            currency_decimal_map,
-            provider,
-            entry.currency_address
-        )
+def hash_snapshot_entry(entry: SnapshotEntry, token_decimals: int, currency_decimals: int) -> bytes:
+    """
+    Hash a snapshot entry into a merkle leaf, packed like
+    solidityKeccak(["address", "uint256", "uint256", "address"]).
 
-        leaf = self.hash_entry(entry, self.token_decimals, currency_decimals)
+    :param entry: snapshot entry to hash
+    :param token_decimals: decimals of the claimed token
+    :param currency_decimals: decimals of the currency of the entry price
+    :returns: the raw 32 byte leaf
+    """
 
-        proof: List[str] = []
-        current_tree = self.trees.get(shard_id)
-        if current_tree is not None:
-            merkle_proof = current_tree.get_proof(leaf)
+    if not Web3.isAddress(entry.address):
+        raise InvalidAddressException(entry.address)
 
-            if merkle_proof is not None:
-                proof = [p.get("left", p.get("right")) for p in merkle_proof]
+    max_claimable = convert_quantity_to_number(entry.max_claimable, token_decimals)
+    entry_price = entry.price
 
-        proof += shard.proofs
+    if entry_price == "":
+        entry_price = "unlimited"
 
-        return SnapshotEntryWithProof(
-            address=entry.address,
-            max_claimable=entry.max_claimable,
-            price=entry.price,
-            currency_address=entry.currency_address,
-            proof=proof
-        )
\ No newline at end of file
+    price = convert_quantity_to_number(entry_price, currency_decimals)
+
+    currency_address = entry.currency_address
+    if currency_address == "":
+        currency_address = ZERO_ADDRESS
+    elif not Web3.isAddress(currency_address):
+        raise InvalidAddressException(currency_address)
+
+    return keccak(
+        bytes.fromhex(entry.address[2:])
+        + max_claimable.to_bytes(32, "big")
+        + price.to_bytes(32, "big")
+        + bytes.fromhex(currency_address[2:])
+    )
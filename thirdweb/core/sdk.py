@@ -4,6 +4,7 @@ from thirdweb.common.feature_detection import (
 )
 from thirdweb.constants.urls import get_provider_for_network
 from thirdweb.contracts import Marketplace
+from thirdweb.contracts.marketplace_v3 import MarketplaceV3
 from thirdweb.contracts.custom import CustomContract
 from thirdweb.contracts.edition_drop import EditionDrop
 from thirdweb.contracts.nft_drop import NFTDrop
@@ -33,6 +34,7 @@ class ThirdwebSDK(ProviderHandler):
             Edition,
             Token,
             Marketplace,
+            MarketplaceV3,
             NFTDrop,
             EditionDrop,
             Multiwrap,
@@ -115,6 +117,16 @@ class ThirdwebSDK(ProviderHandler):
 
         return cast(Marketplace, self._get_contract(address, Marketplace))
 
+    def get_marketplace_v3(self, address: str) -> MarketplaceV3:
+        """
+        Returns a Marketplace V3 contract SDK instance
+
+        :param address: address of the Marketplace V3 contract
+        :returns: Marketplace V3 contract SDK instance
+        """
+
+        return cast(MarketplaceV3, self._get_contract(address, MarketplaceV3))
+
     def get_nft_drop(self, address: str) -> NFTDrop:
         """
         Returns an NFT Drop contract SDK instance
@@ -223,12 +235,20 @@ class ThirdwebSDK(ProviderHandler):
             Type[Edition],
             Type[Token],
             Type[Marketplace],
+            Type[MarketplaceV3],
             Type[NFTDrop],
             Type[EditionDrop],
             Type[Multiwrap],
         ],
     ) -> Union[
-        NFTCollection, Edition, Token, Marketplace, NFTDrop, EditionDrop, Multiwrap
+        NFTCollection,
+        Edition,
+        Token,
+        Marketplace,
+        MarketplaceV3,
+        NFTDrop,
+        EditionDrop,
+        Multiwrap,
     ]:
         if address in self.__contract_cache:
             return self.__contract_cache[address]
@@ -5,3 +5,4 @@ from thirdweb.types.marketplace import *
 from thirdweb.types.settings import *
 from thirdweb.types.auth import *
 from thirdweb.types.events import *
+from thirdweb.types.multicall import *
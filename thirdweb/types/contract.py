@@ -7,6 +7,10 @@ from thirdweb.abi import (
     TokenERC721,
     TokenERC1155,
     Marketplace,
+    MarketplaceV3,
+    DirectListingsLogic,
+    EnglishAuctionsLogic,
+    OffersLogic,
     IERC20,
     IERC721,
     IERC1155,
@@ -24,6 +28,10 @@ TContractABI = TypeVar(
         TokenERC1155,
         TokenERC20,
         Marketplace,
+        MarketplaceV3,
+        DirectListingsLogic,
+        EnglishAuctionsLogic,
+        OffersLogic,
         IERC20,
         IERC721,
         IERC1155,
@@ -63,6 +71,7 @@ TMetadataABI = TypeVar(
         TokenERC1155,
         TokenERC20,
         Marketplace,
+        MarketplaceV3,
         DropERC721,
         DropERC1155,
         Multiwrap,
@@ -76,6 +85,7 @@ class ContractType(Enum):
     EDITION = "edition"
     TOKEN = "token"
     MARKETPLACE = "marketplace"
+    MARKETPLACE_V3 = "marketplace-v3"
     NFT_DROP = "nft-drop"
     EDITION_DROP = "edition-drop"
     MULTIWRAP = "multiwrap"
@@ -14,6 +14,23 @@ class SnapshotEntry:
     price: str
     currency_address: str = ADDRESS_ZERO
 
+    @staticmethod
+    def from_json(json: Dict[str, Any]) -> "SnapshotEntry":
+        return SnapshotEntry(
+            json.get("address", ""),
+            json.get("maxClaimable", ""),
+            json.get("price", ""),
+            json.get("currencyAddress", ""),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "address": self.address,
+            "maxClaimable": self.max_claimable,
+            "price": self.price,
+            "currencyAddress": self.currency_address,
+        }
+
 @dataclass
 class SnapshotEntryWithProof:
     address: str
@@ -29,20 +46,18 @@ class ShardData:
 
     @staticmethod
     def from_json(json: Dict[str, Any]) -> "ShardData":
-        entries = [
-            SnapshotEntry(
-                entry.get("address", ""),
-                entry.get("maxClaimable", ""),
-                entry.get("price", ""),
-                entry.get("currencyAddress", ""),
-            ) 
-            for entry in json["entries"]
-        ]
+        entries = [SnapshotEntry.from_json(entry) for entry in json["entries"]]
         return ShardData(
             json["proofs"],
             entries
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "proofs": self.proofs,
+            "entries": [entry.to_json() for entry in self.entries],
+        }
+
 @dataclass
 class ShardedMerkleTreeInfo:
     merkle_root: str
@@ -61,6 +76,23 @@ class ShardedMerkleTreeInfo:
             json["tokenDecimals"],
         )
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "merkleRoot": self.merkle_root,
+            "baseUri": self.base_uri,
+            "originalEntriesUri": self.original_entries_uri,
+            "shardNybbles": self.shard_nybbles,
+            "tokenDecimals": self.token_decimals,
+            "isShardedMerkleTree": True,
+        }
+
+
+@dataclass
+class SnapshotInfo:
+    merkle_root: str
+    snapshot_uri: str
+    info: ShardedMerkleTreeInfo
+
 
 @dataclass
 class ClaimConditionOutput:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import NewType
+from typing import NewType, Optional
 
 Price = float
 PriceWei = int
@@ -25,6 +25,14 @@ class TokenAmount:
     amount: Price
 
 
+@dataclass
+class VoteBalance:
+    address: str
+    delegate: str
+    votes: CurrencyValue
+    past_votes: Optional[CurrencyValue] = None
+
+
 @dataclass
 class WrappedToken:
     address: str
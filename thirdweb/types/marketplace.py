@@ -11,6 +11,13 @@ class ListingType(Enum):
     AUCTION = 1
 
 
+class ListingStatus(Enum):
+    UNSET = 0
+    CREATED = 1
+    COMPLETED = 2
+    CANCELLED = 3
+
+
 @dataclass
 class MarketplaceFilter:
     start: int = 0
@@ -113,3 +120,55 @@ class Offer:
     price_per_token: PriceWei
     currency_value: CurrencyValue
     currency_contract_address: str
+
+
+@dataclass
+class DirectListingV3:
+    id: int
+    creator_address: str
+    asset_contract_address: str
+    token_id: int
+    asset: NFTMetadata
+    quantity: int
+    currency_contract_address: str
+    price_per_token: PriceWei
+    currency_value_per_token: CurrencyValue
+    start_time_in_seconds: int
+    end_time_in_seconds: int
+    is_reserved_listing: bool
+    status: ListingStatus
+
+
+@dataclass
+class EnglishAuction:
+    id: int
+    creator_address: str
+    asset_contract_address: str
+    token_id: int
+    asset: NFTMetadata
+    quantity: int
+    currency_contract_address: str
+    minimum_bid_amount: PriceWei
+    minimum_bid_currency_value: CurrencyValue
+    buyout_bid_amount: PriceWei
+    buyout_currency_value: CurrencyValue
+    time_buffer_in_seconds: int
+    bid_buffer_bps: int
+    start_time_in_seconds: int
+    end_time_in_seconds: int
+    status: ListingStatus
+
+
+@dataclass
+class OfferV3:
+    id: int
+    offeror_address: str
+    asset_contract_address: str
+    token_id: int
+    asset: NFTMetadata
+    quantity: int
+    currency_contract_address: str
+    total_price: PriceWei
+    currency_value: CurrencyValue
+    end_time_in_seconds: int
+    status: ListingStatus
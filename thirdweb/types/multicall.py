@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class MulticallResult:
+    """
+    The result of a single call inside a batched read or write.
+
+    :param success: whether the call succeeded
+    :param data: the decoded return value of the call for reads, or the receipt of
+        the transaction that executed the call for writes
+    :param error: the error raised by the call if it failed
+    """
+
+    success: bool
+    data: Any = None
+    error: Optional[Exception] = None
+
+
+@dataclass
+class BatchQueryResult(Generic[T]):
+    """
+    The result of a bulk read, with the items that resolved and the errors for
+    the ones that didn't.
+
+    :param items: items that resolved successfully, in the order they were requested
+    :param failures: map of the ID of each item that failed to the error it raised
+    """
+
+    items: List[T] = field(default_factory=list)
+    failures: Dict[int, Exception] = field(default_factory=dict)